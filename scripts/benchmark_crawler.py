@@ -0,0 +1,195 @@
+"""크롤러 오프라인 벤치마크
+
+가짜 무신사 서버(mock_musinsa_server.py)를 띄우고 MusinsaPreciseCrawler로 랭킹 수집부터
+상품 상세 크롤링까지 실행해서, 동시 처리 개수별로 처리량(개/초), 페이지별 지연 시간(p50/p95),
+크롬 포함 최대 메모리(RSS), CPU 시간을 비교한다.
+
+사용법:
+    python scripts/benchmark_crawler.py --backend http --workers 1 2 4 8 --latency 0.2
+    python scripts/benchmark_crawler.py --backend selenium --workers 2 4 --failure-rate 0.05
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+import psutil
+import requests
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src' / 'crawling'))
+
+from musinsa_precise_crawler import MusinsaPreciseCrawler  # noqa: E402
+from network_profile import NetworkProfile  # noqa: E402
+from ranking_capture import PRODUCT_URL_TEMPLATE, find_product_items  # noqa: E402
+from mock_musinsa_server import MockMusinsaServer  # noqa: E402
+
+
+class ResourceSampler(threading.Thread):
+    """현재 프로세스와 모든 하위 프로세스(chromedriver, chrome)의 메모리/CPU 사용량 샘플링"""
+
+    def __init__(self, interval=0.2):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.process = psutil.Process(os.getpid())
+        self.peak_rss = 0
+        self._cpu = {}  # pid -> 마지막으로 관측한 CPU 시간 (종료된 프로세스 포함)
+        self._start_cpu = self._cpu_time(self.process)
+        self._stopped = threading.Event()
+
+    @staticmethod
+    def _cpu_time(process):
+        times = process.cpu_times()
+        return times.user + times.system
+
+    def sample(self):
+        rss = 0
+        for process in [self.process] + self.process.children(recursive=True):
+            try:
+                rss += process.memory_info().rss
+                if process.pid != self.process.pid:
+                    self._cpu[process.pid] = self._cpu_time(process)
+            except psutil.Error:
+                continue
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def run(self):
+        while not self._stopped.is_set():
+            self.sample()
+            self._stopped.wait(self.interval)
+
+    def stop(self):
+        self.sample()
+        self._stopped.set()
+        self.join()
+
+    @property
+    def cpu_time(self):
+        return self._cpu_time(self.process) - self._start_cpu + sum(self._cpu.values())
+
+
+class BenchmarkCrawler(MusinsaPreciseCrawler):
+    """상품 페이지별 전체 소요 시간(드라이버 대여 ~ 추출)을 기록하는 크롤러"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_latencies = []
+
+    def _attempt_parallel(self, url, rank, attempt=1):
+        start = time.perf_counter()
+        try:
+            return super()._attempt_parallel(url, rank, attempt)
+        finally:
+            with self.lock:
+                self.page_latencies.append(time.perf_counter() - start)
+
+
+def collect_urls(crawler, server, limit):
+    """랭킹 단계 - selenium은 실제 수집 과정을 그대로, http는 랭킹 JSON API로 수집"""
+    if crawler.backend == 'selenium':
+        crawler.collect_product_urls(server.ranking_url, limit=limit)
+        # JSON 응답에서 만든 URL은 실제 사이트를 가리키므로 가짜 서버 주소로 바꿈
+        real_prefix = PRODUCT_URL_TEMPLATE.format('')
+        return [url.replace(real_prefix, f"{server.base_url}/products/") for url in crawler.product_urls]
+
+    payload = requests.get(f"{server.base_url}/api/ranking", timeout=10).json()
+    return [server.product_url(product_id) for product_id, _ in find_product_items(payload)][:limit]
+
+
+def percentile(values, q):
+    if len(values) < 2:
+        return values[0] if values else None
+    return statistics.quantiles(values, n=100, method='inclusive')[int(q * 100) - 1]
+
+
+def run_once(server, backend, workers, limit, adaptive=False):
+    """동시 처리 개수 하나로 크롤링 1회 실행하고 측정 결과 반환"""
+    crawler = BenchmarkCrawler(backend=backend, network_profile=NetworkProfile(enabled=backend == 'selenium'),
+                               quiet=True)
+    sampler = ResourceSampler()
+    sampler.start()
+    start = time.perf_counter()
+    try:
+        if backend == 'selenium':
+            crawler.setup_driver()
+        urls = collect_urls(crawler, server, limit)
+        crawler.crawl_urls([(url, rank) for rank, url in enumerate(urls, 1)], max_workers=workers,
+                           adaptive=adaptive)
+    finally:
+        elapsed = time.perf_counter() - start
+        crawler.close()
+        sampler.stop()
+
+    latencies = crawler.page_latencies
+    return {
+        'backend': backend,
+        'workers': workers,
+        'adaptive': adaptive,
+        'products': len(crawler.products),
+        'failed': len(crawler.dead_letters),
+        'retries': crawler.retries,
+        'elapsed': round(elapsed, 3),
+        'products_per_sec': round(len(crawler.products) / elapsed, 2),
+        'latency_p50': round(percentile(latencies, 0.5), 4) if latencies else None,
+        'latency_p95': round(percentile(latencies, 0.95), 4) if latencies else None,
+        'peak_rss_mb': round(sampler.peak_rss / 1024 / 1024, 1),
+        'cpu_time': round(sampler.cpu_time, 2),
+    }
+
+
+def print_results(results):
+    print("\n" + "=" * 92)
+    print(f"{'동시 처리':>8}{'상품':>7}{'실패':>6}{'재시도':>7}{'소요(초)':>10}{'개/초':>9}"
+          f"{'p50(ms)':>10}{'p95(ms)':>10}{'최대 RSS(MB)':>14}{'CPU(초)':>9}")
+    print("=" * 92)
+    for result in results:
+        p50 = result['latency_p50'] * 1000 if result['latency_p50'] is not None else float('nan')
+        p95 = result['latency_p95'] * 1000 if result['latency_p95'] is not None else float('nan')
+        workers = f"{result['workers']}{'*' if result['adaptive'] else ''}"
+        print(f"{workers:>8}{result['products']:>7}{result['failed']:>6}{result['retries']:>7}"
+              f"{result['elapsed']:>10.2f}{result['products_per_sec']:>9.2f}"
+              f"{p50:>10.0f}{p95:>10.0f}{result['peak_rss_mb']:>14.1f}{result['cpu_time']:>9.2f}")
+    if any(result['adaptive'] for result in results):
+        print("* 적응형 동시 처리 (표시된 값은 상한)")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="가짜 무신사 서버를 이용한 크롤러 벤치마크")
+    parser.add_argument('--backend', choices=MusinsaPreciseCrawler.BACKENDS, default='http')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help="비교할 동시 처리 개수")
+    parser.add_argument('--adaptive', action='store_true', help="적응형 동시 처리 (--workers는 상한)")
+    parser.add_argument('--products', type=int, default=100, help="랭킹 상품 수 (기본: 100)")
+    parser.add_argument('--latency', type=float, default=0.1, help="상품 페이지 응답 지연(초) (기본: 0.1)")
+    parser.add_argument('--jitter', type=float, default=0.05, help="응답 지연 편차(초) (기본: 0.05)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="503 응답 비율")
+    parser.add_argument('--block-rate', type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--report', default='data/benchmark_crawler.json', help="결과 저장 경로")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = []
+    with MockMusinsaServer(args.products, args.latency, args.jitter, args.failure_rate, args.block_rate,
+                           seed=args.seed) as server:
+        print(f"가짜 무신사 서버: {server.base_url} (상품 {args.products}개, 지연 {args.latency}±{args.jitter}초, "
+              f"오류 {args.failure_rate:.0%}, 차단 {args.block_rate:.0%})")
+        for workers in args.workers:
+            print(f"\n▶ 동시 처리 {workers}개 ({args.backend})")
+            results.append(run_once(server, args.backend, workers, args.products, args.adaptive))
+
+    print_results(results)
+
+    os.makedirs(os.path.dirname(args.report) or '.', exist_ok=True)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        json.dump({'settings': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ 벤치마크 결과 저장: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
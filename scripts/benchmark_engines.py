@@ -0,0 +1,99 @@
+"""분석 엔진 벤치마크 - pandas와 Polars로 같은 분석을 실행해 결과 일치 여부와 소요 시간 비교
+
+저장된 랭킹 데이터를 반복 샘플링하고 브랜드/카테고리/가격/리뷰수/순위를 조금씩 바꿔 여러 스냅샷을
+모은 것 같은 데이터를 만든 뒤, 크기별로 두 엔진의 정제 + 네 가지 분석(get_all_insights) 시간을 잰다.
+
+사용법:
+    python scripts/benchmark_engines.py --rows 10000 100000 1000000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+from preprocessing.data_preprocessing import apply_schema, load_ranking_data  # noqa: E402
+from preprocessing.ranking_dataset import RankingDataset  # noqa: E402
+from analysis.marketing_analysis import MusinsaMarketingAnalyzer  # noqa: E402
+from analysis.polars_engine import diff_insights  # noqa: E402
+
+
+def make_history(source, rows, seed=0):
+    """원본 랭킹 데이터로 rows행짜리 스냅샷 이력 데이터 생성 (스키마 적용 전 원본 형태)"""
+    rng = np.random.default_rng(seed)
+    df = source.sample(n=rows, replace=True, random_state=seed).reset_index(drop=True)
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype) or str(df[column].dtype).startswith('string'):
+            df[column] = df[column].astype(object)
+
+    df['순위'] = rng.integers(1, 201, size=rows)
+    df['브랜드명'] = df['브랜드명'] + ' ' + pd.Series(rng.integers(0, 200, size=rows)).astype(str)
+    df['카테고리'] = df['카테고리'] + ' ' + pd.Series(rng.integers(0, 5, size=rows)).astype(str)
+    prices = rng.integers(5, 500, size=rows) * 1000
+    df['현재가격'] = [f"{price:,}원" for price in prices]
+    df['리뷰수'] = [f"후기 {count:,}개" for count in rng.integers(0, 50000, size=rows)]
+    df.loc[rng.random(rows) < 0.03, '현재가격'] = np.nan
+    df.loc[rng.random(rows) < 0.05, '평점'] = np.nan
+    return df
+
+
+def run_engine(df, engine):
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', FutureWarning)
+        insights = MusinsaMarketingAnalyzer(RankingDataset(df.copy()), engine=engine, use_cache=False).get_all_insights()
+    return insights, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pandas vs Polars 분석 엔진 벤치마크")
+    parser.add_argument('--input', default='data/musinsa_ranking_precise.xlsx')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000], help="비교할 데이터 크기")
+    parser.add_argument('--report', default='data/benchmark_engines.json', help="결과 저장 경로")
+    args = parser.parse_args()
+
+    source = load_ranking_data(args.input)
+    results = []
+    for rows in args.rows:
+        df = apply_schema(make_history(source, rows))
+        print(f"\n▶ {rows:,}행 (브랜드 {df['브랜드명'].nunique():,}개, 카테고리 {df['카테고리'].nunique():,}개)")
+        expected, pandas_time = run_engine(df, 'pandas')
+        print(f"  pandas: {pandas_time:.2f}초")
+        actual, polars_time = run_engine(df, 'polars')
+        print(f"  polars: {polars_time:.2f}초")
+
+        diffs = diff_insights(expected, actual)
+        if diffs:
+            print(f"✗ 결과 불일치 {len(diffs)}건")
+            for diff in diffs[:10]:
+                print(f"  {diff}")
+        else:
+            print("  ✓ 결과 일치")
+        results.append({'rows': rows, 'pandas': round(pandas_time, 3), 'polars': round(polars_time, 3),
+                        'speedup': round(pandas_time / polars_time, 2), 'equal': not diffs})
+
+    print("\n" + "=" * 52)
+    print(f"{'행 수':>12}{'pandas(초)':>12}{'polars(초)':>12}{'속도 향상':>10}{'일치':>6}")
+    print("=" * 52)
+    for result in results:
+        print(f"{result['rows']:>12,}{result['pandas']:>12.2f}{result['polars']:>12.2f}"
+              f"{result['speedup']:>9.1f}배{'✓' if result['equal'] else '✗':>6}")
+
+    os.makedirs(os.path.dirname(args.report) or '.', exist_ok=True)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        json.dump({'settings': vars(args), 'results': results}, f, ensure_ascii=False, indent=2)
+    print(f"\n✓ 벤치마크 결과 저장: {args.report}")
+    if not all(result['equal'] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
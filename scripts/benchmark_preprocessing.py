@@ -0,0 +1,87 @@
+"""전처리 벤치마크 - 셀 단위 apply 방식과 벡터 연산 방식 비교
+
+저장된 랭킹 데이터를 반복 샘플링해 큰 데이터(기본 100만 행)를 만들고, 기존 방식(Series.apply + re.sub)과
+벡터 연산 방식(preprocess_data)의 결과가 같은지 확인한 뒤 소요 시간을 비교한다.
+
+사용법:
+    python scripts/benchmark_preprocessing.py --rows 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+from preprocessing.data_preprocessing import (  # noqa: E402
+    clean_price, clean_review_count, clean_discount_rate, preprocess_data,
+    PRICE_BINS, PRICE_LABELS, DISCOUNT_BINS, DISCOUNT_LABELS,
+)
+
+CLEANED_COLUMNS = ['현재가격_정제', '원가_정제', '할인율_정제', '리뷰수_정제', '할인액', '리뷰당_순위점수', '가격대', '할인율_구간']
+
+
+def preprocess_with_apply(df):
+    """기존 전처리 방식 (셀마다 정제 함수 호출)"""
+    df['현재가격_정제'] = df['현재가격'].apply(clean_price)
+    df['원가_정제'] = df['원가'].apply(clean_price)
+    df['할인율_정제'] = df['할인율'].apply(clean_discount_rate)
+    df['리뷰수_정제'] = df['리뷰수'].apply(clean_review_count)
+    df['할인액'] = df['원가_정제'] - df['현재가격_정제']
+    df['리뷰당_순위점수'] = df['순위'] / (df['리뷰수_정제'] + 1)
+    df['가격대'] = pd.cut(df['현재가격_정제'], bins=PRICE_BINS, labels=PRICE_LABELS)
+    df['할인율_구간'] = pd.cut(df['할인율_정제'], bins=DISCOUNT_BINS, labels=DISCOUNT_LABELS)
+    return df
+
+
+def make_large_frame(source, rows, seed=0):
+    """원본 데이터를 rows행으로 샘플링하고, 가격/리뷰수 값을 조금씩 바꿔 고유값 수를 늘림"""
+    rng = np.random.default_rng(seed)
+    df = source.sample(n=rows, replace=True, random_state=seed).reset_index(drop=True)
+    prices = rng.integers(5, 500, size=rows) * 1000
+    df['현재가격'] = [f"{price:,}원" for price in prices]
+    df['원가'] = [f"{price:,}원" for price in prices * 2]
+    reviews = rng.integers(0, 50000, size=rows)
+    df['리뷰수'] = [f"후기 {count:,}개" for count in reviews]
+
+    # 결측치와 형식이 다른 값 섞기
+    df.loc[rng.random(rows) < 0.05, '현재가격'] = np.nan
+    df.loc[rng.random(rows) < 0.01, '원가'] = '가격 문의'
+    df.loc[rng.random(rows) < 0.10, '리뷰수'] = np.nan
+    df.loc[rng.random(rows) < 0.30, '할인율'] = np.nan
+    return df
+
+
+def timed(func, df):
+    start = time.perf_counter()
+    result = func(df.copy())
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전처리 apply vs 벡터 연산 벤치마크")
+    parser.add_argument('--input', default='data/musinsa_ranking_precise.xlsx')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    source = pd.read_excel(args.input)
+    df = make_large_frame(source, args.rows)
+    print(f"벤치마크 데이터: {len(df):,}행")
+
+    expected, apply_time = timed(preprocess_with_apply, df)
+    print(f"apply 방식: {apply_time:.2f}초")
+    result, vector_time = timed(preprocess_data, df)
+    print(f"벡터 연산 방식: {vector_time:.2f}초")
+
+    for column in CLEANED_COLUMNS:
+        pd.testing.assert_series_equal(result[column], expected[column])
+    print("✓ 결과 일치 (값, dtype, 결측치)")
+    print(f"속도 향상: {apply_time / vector_time:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
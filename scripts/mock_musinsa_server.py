@@ -0,0 +1,208 @@
+"""무신사 랭킹/상품 페이지를 흉내 내는 로컬 서버 (크롤러 벤치마크용)
+
+scripts/fixtures의 HTML을 상품마다 다른 값으로 채워서 제공하고,
+응답 지연과 오류(503)/차단(429) 응답을 원하는 비율로 섞을 수 있다.
+
+사용법:
+    python scripts/mock_musinsa_server.py --products 200 --latency 0.2 --failure-rate 0.05
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from string import Template
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures'
+
+BRANDS = ['무신사 스탠다드', '디스이즈네버댓', '커버낫', '마르디 메크르디', '아디다스', '나이키', '예일', '리', '칼하트 WIP', '쿠어']
+CATEGORIES = ['상의 > 반소매 티셔츠', '바지 > 데님 팬츠', '아우터 > 후드 집업', '신발 > 스니커즈', '가방 > 백팩']
+ITEMS = ['오버핏 티셔츠', '와이드 데님 팬츠', '후드 집업', '캔버스 스니커즈', '나일론 백팩', '스웨트셔츠']
+
+PRODUCT_PATH_RE = re.compile(r'^/products/(\d+)$')
+
+
+def product_fields(product_id, seed=0):
+    """상품 번호별로 항상 같은 가짜 상품 정보"""
+    rng = random.Random(seed * 100003 + product_id)
+    original = rng.randrange(20, 300) * 1000
+    discount = rng.choice([0, 0, 10, 20, 30, 45])
+    brand = rng.choice(BRANDS)
+    return {
+        'goodsNo': product_id,
+        'brand': brand,
+        'brand_id': BRANDS.index(brand),
+        'name': f"{brand} {rng.choice(ITEMS)} {product_id}",
+        'category': rng.choice(CATEGORIES),
+        'original': original,
+        'price': original * (100 - discount) // 100,
+        'discount': discount,
+        'rating': round(rng.uniform(4.0, 5.0), 1),
+        'reviews': rng.randrange(0, 20000),
+    }
+
+
+class MockMusinsaServer:
+    """백그라운드 스레드에서 동작하는 가짜 무신사 서버
+
+    latency/jitter: 응답마다 latency ± jitter초 지연
+    failure_rate: 상품 페이지 요청 중 503을 돌려줄 비율
+    block_rate: 상품 페이지 요청 중 429를 돌려줄 비율
+    """
+
+    def __init__(self, products=100, latency=0.0, jitter=0.0, failure_rate=0.0, block_rate=0.0,
+                 host='127.0.0.1', port=0, seed=0):
+        self.products = products
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.block_rate = block_rate
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.status_counts = {}
+
+        self.product_template = Template((FIXTURE_DIR / 'musinsa_product.html').read_text(encoding='utf-8'))
+        self.ranking_template = Template((FIXTURE_DIR / 'musinsa_ranking.html').read_text(encoding='utf-8'))
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def ranking_url(self):
+        return f"{self.base_url}/ranking"
+
+    def product_url(self, product_id):
+        return f"{self.base_url}/products/{product_id}"
+
+    def _product_ids(self):
+        return range(1000001, 1000001 + self.products)
+
+    def _injected_status(self):
+        """지연 후 이번 요청에 돌려줄 오류 상태 코드 (정상이면 None)"""
+        with self._lock:
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            roll = self._rng.random()
+        if delay:
+            time.sleep(delay)
+        if roll < self.block_rate:
+            return 429
+        if roll < self.block_rate + self.failure_rate:
+            return 503
+        return None
+
+    def _render(self, path):
+        """경로 -> (상태 코드, Content-Type, 본문)"""
+        if path == '/ranking':
+            items = '\n'.join(
+                f'    <li><a href="{self.product_url(product_id)}">{product_fields(product_id, self.seed)["name"]}</a></li>'
+                for product_id in self._product_ids())
+            return 200, 'text/html; charset=utf-8', self.ranking_template.substitute(items=items)
+
+        if path == '/api/ranking':
+            items = []
+            for product_id in self._product_ids():
+                fields = product_fields(product_id, self.seed)
+                items.append({
+                    'goodsNo': product_id,
+                    'brandName': fields['brand'],
+                    'goodsName': fields['name'],
+                    'normalPrice': fields['original'],
+                    'finalPrice': fields['price'],
+                    'discountRatio': fields['discount'],
+                })
+            return 200, 'application/json', json.dumps({'data': {'list': items}}, ensure_ascii=False)
+
+        match = PRODUCT_PATH_RE.match(path)
+        if match and int(match.group(1)) in self._product_ids():
+            status = self._injected_status()
+            if status:
+                return status, 'text/plain; charset=utf-8', 'error'
+            fields = product_fields(int(match.group(1)), self.seed)
+            body = self.product_template.substitute(
+                fields,
+                original=f"{fields['original']:,}",
+                price=f"{fields['price']:,}",
+                reviews=f"{fields['reviews']:,}",
+            )
+            return 200, 'text/html; charset=utf-8', body
+
+        return 404, 'text/plain; charset=utf-8', 'not found'
+
+    def _handler_class(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                status, content_type, body = mock._render(self.path.split('?')[0])
+                with mock._lock:
+                    mock.status_counts[status] = mock.status_counts.get(status, 0) + 1
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (중단될 때까지 반환하지 않음, 끝나면 close() 호출)"""
+        self._server.serve_forever()
+
+    def close(self):
+        """서버 소켓 닫기"""
+        self._server.server_close()
+
+    def stop(self):
+        """start()로 띄운 백그라운드 서버 종료"""
+        self._server.shutdown()
+        self.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 벤치마크용 가짜 무신사 서버")
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--products', type=int, default=100, help="랭킹 상품 수 (기본: 100)")
+    parser.add_argument('--latency', type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="응답 지연 편차(초)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="503 응답 비율")
+    parser.add_argument('--block-rate', type=float, default=0.0, help="429 응답 비율")
+    args = parser.parse_args()
+
+    server = MockMusinsaServer(args.products, args.latency, args.jitter, args.failure_rate, args.block_rate,
+                               port=args.port)
+    print(f"가짜 무신사 서버 실행: {server.ranking_url} (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""그룹 집계 - 브랜드/카테고리/구간별 통계를 기준 컬럼마다 한 번의 groupby로 계산
+
+분석기(MusinsaMarketingAnalyzer)는 브랜드나 카테고리마다 전체 데이터를 다시 필터링하지 않고
+여기서 계산한 표를 읽는다. 브랜드/카테고리 수가 늘어도 비용은 행 수에 비례한다.
+
+사용법:
+    stats = GroupedStats(dataset)
+    stats.by('카테고리')                 # 카테고리별 제품 수, 가격(평균/최소/최대), 평균 순위 등
+    stats.category_mix('브랜드A')        # 브랜드A의 카테고리별 제품 수
+"""
+# 제품이 없는 구간도 결과에 남기는 기준 컬럼 (가격대/할인율_구간/리뷰수_구간은 고정 구간)
+BUCKET_KEYS = ('가격대', '할인율_구간', '리뷰수_구간')
+VALUE_COLUMNS = ('순위', '현재가격_정제', '할인율_정제')
+
+
+def group_stats(df, key):
+    """key별 통계표 (인덱스: key 값, 카테고리 순서)
+
+    product_count  제품 수 (가격 결측 포함)
+    avg_price / min_price / max_price  현재가격_정제 평균/최소/최대
+    avg_rank       평균 순위
+    avg_discount   평균 할인율
+    top3_avg_price 순위 상위 3개 제품의 평균 가격
+    """
+    observed = key not in BUCKET_KEYS
+    stats = df.groupby(key, observed=observed).agg(
+        product_count=('순위', 'size'),
+        avg_price=('현재가격_정제', 'mean'),
+        min_price=('현재가격_정제', 'min'),
+        max_price=('현재가격_정제', 'max'),
+        avg_rank=('순위', 'mean'),
+        avg_discount=('할인율_정제', 'mean'),
+    )
+    # 순위로 안정 정렬한 뒤 그룹별 앞 3행 (nsmallest(3, '순위')와 같은 동률 처리)
+    top3 = df.sort_values('순위', kind='stable').groupby(key, observed=observed).head(3)
+    stats['top3_avg_price'] = top3.groupby(key, observed=observed)['현재가격_정제'].mean()
+    return stats
+
+
+class GroupedStats:
+    """RankingDataset의 그룹별 통계 - 기준 컬럼별로 처음 요청할 때 계산하고 기억해둔다"""
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self._stats = {}
+        self._brand_category = None
+
+    def by(self, key):
+        """key(브랜드명, 카테고리, 가격대 등)별 통계표 (group_stats 참고)"""
+        if key not in self._stats:
+            df = self.dataset.require(key, *VALUE_COLUMNS)
+            self._stats[key] = group_stats(df, key)
+        return self._stats[key]
+
+    @property
+    def brand_category(self):
+        """(브랜드명, 카테고리)별 제품 수 - 등장한 조합만"""
+        if self._brand_category is None:
+            df = self.dataset.require('브랜드명', '카테고리')
+            self._brand_category = df.groupby(['브랜드명', '카테고리'], observed=True).size()
+        return self._brand_category
+
+    def category_mix(self, brand):
+        """브랜드의 카테고리별 제품 수 dict (개수 내림차순, 동률이면 카테고리 순서대로)"""
+        try:
+            counts = self.brand_category.xs(brand, level='브랜드명')
+        except KeyError:
+            return {}
+        return counts.sort_values(ascending=False, kind='stable').to_dict()
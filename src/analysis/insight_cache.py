@@ -0,0 +1,135 @@
+"""분석 결과 캐시 - get_all_insights() 결과를 데이터 지문 + 분석 코드 버전을 키로 디스크에 저장
+
+같은 데이터를 같은 코드로 분석한 결과는 대시보드, CLI, 노트북 등 어느 프로세스에서든 다시 계산하지 않고
+data/cache/insights/<키>.pkl에서 읽는다. 분석/전처리 코드나 pandas(Polars) 버전이 바뀌면 키가 바뀌어
+자동으로 다시 계산한다. 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 결과부터 삭제한다.
+
+사용법:
+    cache = InsightCache()
+    key = cache.key(dataset.fingerprint(), engine='pandas')
+    insights = cache.load(key, analyzer.compute_all_insights)
+"""
+import functools
+import hashlib
+import os
+import pickle
+
+import pandas as pd
+
+from preprocessing import data_preprocessing, ranking_dataset
+from preprocessing.data_preprocessing import DEFAULT_CACHE_DIR
+
+DEFAULT_INSIGHT_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'insights')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 분석 결과에 영향을 주는 src/analysis 모듈
+# (전처리 규칙 data_preprocessing.py와 파생 컬럼 계산 ranking_dataset.py도 함께 반영)
+ANALYSIS_MODULES = ['marketing_analysis.py', 'grouped_stats.py', 'polars_engine.py']
+
+
+@functools.lru_cache(maxsize=None)
+def code_version(engine='pandas'):
+    """분석 코드 버전 - 분석/전처리/데이터셋 모듈 소스와 엔진 라이브러리 버전의 해시"""
+    digest = hashlib.sha256(f"pandas={pd.__version__}".encode('utf-8'))
+    if engine == 'polars':
+        import polars as pl
+        digest.update(f"polars={pl.__version__}".encode('utf-8'))
+    analysis_dir = os.path.dirname(os.path.abspath(__file__))
+    paths = [os.path.join(analysis_dir, name) for name in ANALYSIS_MODULES]
+    paths += [data_preprocessing.__file__, ranking_dataset.__file__]
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class InsightCache:
+    """분석 결과(insight dict)를 키별 pickle 파일로 저장하는 LRU 캐시
+
+    결과를 읽을 때마다 파일 수정 시각을 갱신하고, 저장 후 전체 크기가 max_bytes를 넘으면
+    수정 시각이 가장 오래된 파일부터 삭제한다 (방금 저장한 결과는 남김).
+    """
+
+    def __init__(self, cache_dir=DEFAULT_INSIGHT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, fingerprint, engine='pandas'):
+        """데이터 지문 + 분석 엔진 + 분석 코드 버전으로 만든 캐시 키"""
+        return hashlib.sha256(f"{fingerprint}:{engine}:{code_version(engine)}".encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+    def get(self, key):
+        """저장된 결과 반환, 없거나 읽을 수 없으면 None"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                insights = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            self._remove(path)  # 깨진 캐시는 지우고 다시 계산
+            return None
+        try:
+            os.utime(path)  # 최근 사용 표시 (LRU)
+        except OSError:
+            pass
+        return insights
+
+    def put(self, key, insights):
+        path = self._path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(insights, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self._evict(keep=path)
+        except Exception as e:
+            print(f"✗ 분석 결과 캐시 저장 실패: {e}")
+
+    def load(self, key, build):
+        """캐시된 결과 반환, 없으면 build()로 계산해서 저장"""
+        insights = self.get(key)
+        if insights is None:
+            insights = build()
+            self.put(key, insights)
+        return insights
+
+    def _entries(self):
+        """(수정 시각, 크기, 경로) 목록 - 오래 사용하지 않은 순"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.pkl'):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue  # 다른 프로세스가 먼저 삭제
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def _evict(self, keep=None):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                self._remove(path)
+                total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """저장된 분석 결과 모두 삭제"""
+        if os.path.isdir(self.cache_dir):
+            for _, _, path in self._entries():
+                self._remove(path)
@@ -1,137 +1,183 @@
 import pandas as pd
 import numpy as np
-from preprocessing.data_preprocessing import load_and_preprocess_data
+from preprocessing.ranking_dataset import RankingDataset
+from analysis.grouped_stats import GroupedStats
+from analysis.insight_cache import DEFAULT_INSIGHT_CACHE_DIR, InsightCache
+
+
+def count_values(series, observed=False):
+    """value_counts (개수 내림차순, 동률이면 카테고리 순서대로)
+
+    분석 엔진(pandas/polars)과 관계없이 같은 순서가 나오도록 동률 순서를 고정한다.
+    observed=True면 등장하지 않은 카테고리(0개)는 제외한다. 브랜드명/카테고리는 category dtype이라
+    일부 행만 골라도 전체 카테고리가 0개로 함께 집계된다.
+    """
+    counts = series.value_counts(sort=False)
+    if observed:
+        counts = counts[counts > 0]
+    return counts.sort_values(ascending=False, kind='stable')
 
 class MusinsaMarketingAnalyzer:
-    def __init__(self, data_path):
-        self.df = load_and_preprocess_data(data_path)
+    ENGINES = ('pandas', 'polars')
+
+    def __init__(self, data, engine='pandas', use_cache=True, cache_dir=DEFAULT_INSIGHT_CACHE_DIR):
+        """data: 데이터 파일 경로 또는 RankingDataset (대시보드 등에서 이미 로드한 데이터셋 공유)
+
+        engine='polars'면 같은 분석을 Polars로 실행한다 (analysis/polars_engine.py, 결과 형태는 같음).
+        use_cache=True면 get_all_insights() 결과를 cache_dir에 저장하고 같은 데이터/코드면 다시 계산하지 않는다.
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"지원하지 않는 분석 엔진입니다: {engine} (사용 가능: {', '.join(self.ENGINES)})")
+        self.data = data if isinstance(data, RankingDataset) else RankingDataset.load(data)
+        self.engine = engine
+        self.stats = GroupedStats(self.data)
+        self.cache = InsightCache(cache_dir) if use_cache else None
+        self._polars = None
+
+    @property
+    def df(self):
+        """지금까지 계산된 컬럼을 포함한 DataFrame"""
+        return self.data.df
+
+    @property
+    def polars(self):
+        """Polars 분석 엔진 (engine='polars'일 때 처음 사용할 때 정제)"""
+        if self._polars is None:
+            from analysis.polars_engine import PolarsAnalysis
+            self._polars = PolarsAnalysis(self.data.df)
+        return self._polars
     
     def price_discount_analysis(self):
         """가격/할인 전략 분석"""
+        if self.engine == 'polars':
+            return self.polars.price_discount_analysis()
         results = {}
+        df = self.data.require('가격대', '할인율_정제', '순위')
+        price_stats = self.stats.by('가격대')
         
         # 1. 가격대별 분포
-        results['price_range_dist'] = self.df['가격대'].value_counts().sort_index()
+        results['price_range_dist'] = price_stats['product_count'].rename('count')
         
         # 2. 가격대별 평균 순위
-        results['avg_rank_by_price'] = self.df.groupby('가격대')['순위'].mean().sort_values()
+        results['avg_rank_by_price'] = price_stats['avg_rank'].rename('순위').sort_values(kind='stable')
         
         # 3. 할인율과 순위의 상관관계
-        results['discount_rank_corr'] = self.df[['할인율_정제', '순위']].corr().iloc[0, 1]
+        results['discount_rank_corr'] = df[['할인율_정제', '순위']].corr().iloc[0, 1]
         
         # 4. 할인율 구간별 평균 순위
-        results['avg_rank_by_discount'] = self.df.groupby('할인율_구간')['순위'].mean().sort_values()
+        results['avg_rank_by_discount'] = self.stats.by('할인율_구간')['avg_rank'].rename('순위').sort_values(kind='stable')
         
         # 5. 최적 가격대 (상위 20위 기준)
-        top20 = self.df[self.df['순위'] <= 20]
-        results['top20_price_range'] = top20['가격대'].value_counts()
+        top20 = df[df['순위'] <= 20]
+        results['top20_price_range'] = count_values(top20['가격대'])
         
         # 6. 카테고리별 평균 할인율
-        results['avg_discount_by_category'] = self.df.groupby('카테고리')['할인율_정제'].mean().sort_values(ascending=False)
+        results['avg_discount_by_category'] = self.stats.by('카테고리')['avg_discount'].rename('할인율_정제').sort_values(ascending=False, kind='stable')
         
         return results
     
     def brand_category_insights(self):
         """브랜드/카테고리 인사이트 분석"""
+        if self.engine == 'polars':
+            return self.polars.brand_category_insights()
         results = {}
+        brand_stats = self.stats.by('브랜드명')
+        category_stats = self.stats.by('카테고리')
         
-        # 1. 인기 브랜드 TOP 10
-        brand_counts = self.df['브랜드명'].value_counts().head(10)
+        # 1. 인기 브랜드 TOP 10 (제품 수가 같으면 데이터에 먼저 등장한 브랜드가 앞 - 10위 경계의 동률도 이 순서로 자름)
+        brand_counts = brand_stats['product_count'].rename('count').sort_values(ascending=False, kind='stable').head(10)
         results['top10_brands'] = brand_counts
         
         # 2. 브랜드별 평균 순위
-        brand_avg_rank = self.df.groupby('브랜드명')['순위'].mean().sort_values().head(10)
+        brand_avg_rank = brand_stats['avg_rank'].rename('순위').sort_values(kind='stable').head(10)
         results['brand_avg_rank'] = brand_avg_rank
         
         # 3. 카테고리별 제품 수
-        results['category_dist'] = self.df['카테고리'].value_counts()
+        results['category_dist'] = category_stats['product_count'].rename('count').sort_values(ascending=False, kind='stable')
         
         # 4. 카테고리별 평균 가격
-        results['avg_price_by_category'] = self.df.groupby('카테고리')['현재가격_정제'].mean().sort_values(ascending=False)
+        results['avg_price_by_category'] = category_stats['avg_price'].rename('현재가격_정제').sort_values(ascending=False, kind='stable')
         
         # 5. 상위 브랜드의 카테고리 전략
         top_brands = brand_counts.index[:5]
-        brand_category_strategy = {}
-        for brand in top_brands:
-            brand_data = self.df[self.df['브랜드명'] == brand]
-            brand_category_strategy[brand] = brand_data['카테고리'].value_counts().to_dict()
-        results['brand_category_strategy'] = brand_category_strategy
+        results['brand_category_strategy'] = {brand: self.stats.category_mix(brand) for brand in top_brands}
         
         return results
     
     def customer_response_analysis(self):
         """고객 반응 분석"""
+        if self.engine == 'polars':
+            return self.polars.customer_response_analysis()
         results = {}
+        df = self.data.require('평점', '순위', '리뷰수_정제', '리뷰당_순위점수', '브랜드명', '상품명')
         
         # 1. 평점과 순위의 상관관계
-        results['rating_rank_corr'] = self.df[['평점', '순위']].corr().iloc[0, 1]
+        results['rating_rank_corr'] = df[['평점', '순위']].corr().iloc[0, 1]
         
         # 2. 리뷰수와 순위의 상관관계
-        results['review_rank_corr'] = self.df[['리뷰수_정제', '순위']].corr().iloc[0, 1]
+        results['review_rank_corr'] = df[['리뷰수_정제', '순위']].corr().iloc[0, 1]
         
         # 3. 리뷰당 순위 점수 TOP 10 (효율적인 제품)
-        efficient_products = self.df.nsmallest(10, '리뷰당_순위점수')[['브랜드명', '상품명', '순위', '리뷰수_정제', '리뷰당_순위점수']]
+        efficient_products = df.nsmallest(10, '리뷰당_순위점수')[['브랜드명', '상품명', '순위', '리뷰수_정제', '리뷰당_순위점수']]
         results['efficient_products'] = efficient_products
         
         # 4. 평점 높지만 순위 낮은 제품 (마케팅 기회)
-        high_rating_low_rank = self.df[(self.df['평점'] >= 4.8) & (self.df['순위'] > 50)][['브랜드명', '상품명', '평점', '순위', '리뷰수_정제']]
+        high_rating_low_rank = df[(df['평점'] >= 4.8) & (df['순위'] > 50)][['브랜드명', '상품명', '평점', '순위', '리뷰수_정제']]
         results['marketing_opportunities'] = high_rating_low_rank
         
         # 5. 리뷰수 구간별 평균 순위
-        review_bins = [0, 100, 500, 1000, 5000, float('inf')]
-        review_labels = ['100개 미만', '100-500개', '500-1000개', '1000-5000개', '5000개 이상']
-        self.df['리뷰수_구간'] = pd.cut(self.df['리뷰수_정제'], bins=review_bins, labels=review_labels)
-        results['avg_rank_by_review_range'] = self.df.groupby('리뷰수_구간')['순위'].mean().sort_values()
+        results['avg_rank_by_review_range'] = self.stats.by('리뷰수_구간')['avg_rank'].rename('순위').sort_values(kind='stable')
         
         return results
     
     def competitive_positioning_analysis(self):
         """경쟁 분석 및 포지셔닝"""
+        if self.engine == 'polars':
+            return self.polars.competitive_positioning_analysis()
         results = {}
+        df = self.data.require('카테고리', '순위', '현재가격_정제', '할인율_정제', '평점', '리뷰수_정제', '가격대')
         
-        # 1. 카테고리별 가격 경쟁력 분석
-        category_price_stats = {}
-        for category in self.df['카테고리'].unique():
-            cat_data = self.df[self.df['카테고리'] == category]
-            if len(cat_data) >= 3:  # 최소 3개 이상 제품이 있는 카테고리만
-                category_price_stats[category] = {
-                    'min_price': cat_data['현재가격_정제'].min(),
-                    'avg_price': cat_data['현재가격_정제'].mean(),
-                    'max_price': cat_data['현재가격_정제'].max(),
-                    'top3_avg_price': cat_data.nsmallest(3, '순위')['현재가격_정제'].mean()
-                }
-        results['category_price_stats'] = category_price_stats
+        # 1. 카테고리별 가격 경쟁력 분석 (최소 3개 이상 제품이 있는 카테고리만)
+        category_stats = self.stats.by('카테고리')
+        category_stats = category_stats[category_stats['product_count'] >= 3]
+        results['category_price_stats'] = category_stats[['min_price', 'avg_price', 'max_price', 'top3_avg_price']].to_dict('index')
         
         # 2. 성공 제품의 특성 (상위 10위)
-        top10 = self.df[self.df['순위'] <= 10]
+        top10 = df[df['순위'] <= 10]
         results['top10_characteristics'] = {
             'avg_price': top10['현재가격_정제'].mean(),
             'avg_discount': top10['할인율_정제'].mean(),
             'avg_rating': top10['평점'].mean(),
             'avg_reviews': top10['리뷰수_정제'].mean(),
-            'dominant_category': top10['카테고리'].value_counts().to_dict(),
-            'price_range_dist': top10['가격대'].value_counts().to_dict()
+            'dominant_category': count_values(top10['카테고리'], observed=True).to_dict(),
+            'price_range_dist': count_values(top10['가격대']).to_dict()
         }
         
         # 3. 브랜드 포트폴리오 분석 (제품 수가 많은 브랜드)
-        multi_product_brands = self.df['브랜드명'].value_counts()
-        multi_product_brands = multi_product_brands[multi_product_brands >= 2].index[:5]
+        brand_stats = self.stats.by('브랜드명').sort_values('product_count', ascending=False, kind='stable')
+        multi_product_brands = brand_stats[brand_stats['product_count'] >= 2].head(5)
         
         brand_portfolio = {}
-        for brand in multi_product_brands:
-            brand_data = self.df[self.df['브랜드명'] == brand]
+        for brand, stats in multi_product_brands.iterrows():
             brand_portfolio[brand] = {
-                'product_count': len(brand_data),
-                'avg_rank': brand_data['순위'].mean(),
-                'price_range': f"{brand_data['현재가격_정제'].min():,} - {brand_data['현재가격_정제'].max():,}",
-                'categories': brand_data['카테고리'].value_counts().to_dict()
+                'product_count': int(stats['product_count']),
+                'avg_rank': stats['avg_rank'],
+                'price_range': f"{stats['min_price']:,} - {stats['max_price']:,}",
+                'categories': self.stats.category_mix(brand)
             }
         results['brand_portfolio_analysis'] = brand_portfolio
         
         return results
     
     def get_all_insights(self):
-        """모든 분석 결과 종합"""
+        """모든 분석 결과 종합 (같은 데이터를 같은 코드로 분석한 결과가 캐시에 있으면 그대로 반환)"""
+        if self.cache is None:
+            return self.compute_all_insights()
+        key = self.cache.key(self.data.fingerprint(), self.engine)
+        return self.cache.load(key, self.compute_all_insights)
+
+    def compute_all_insights(self):
+        """캐시를 거치지 않고 네 가지 분석을 모두 실행"""
         return {
             'price_discount': self.price_discount_analysis(),
             'brand_category': self.brand_category_insights(),
@@ -140,7 +186,15 @@ class MusinsaMarketingAnalyzer:
         }
 
 if __name__ == "__main__":
-    analyzer = MusinsaMarketingAnalyzer('data/musinsa_ranking_precise.xlsx')
+    import argparse
+
+    parser = argparse.ArgumentParser(description="무신사 랭킹 마케팅 분석")
+    parser.add_argument('data_path', nargs='?', default='data/musinsa_ranking_precise.xlsx')
+    parser.add_argument('--engine', choices=MusinsaMarketingAnalyzer.ENGINES, default='pandas', help="분석 엔진 (기본: pandas)")
+    parser.add_argument('--no-cache', action='store_true', help="분석 결과 캐시를 사용하지 않고 다시 계산")
+    args = parser.parse_args()
+
+    analyzer = MusinsaMarketingAnalyzer(args.data_path, engine=args.engine, use_cache=not args.no_cache)
     insights = analyzer.get_all_insights()
     print("분석 완료!")
-    print(f"분석 카테고리: {list(insights.keys())}")
\ No newline at end of file
+    print(f"분석 카테고리: {list(insights.keys())}")
@@ -0,0 +1,326 @@
+"""Polars 분석 엔진 - MusinsaMarketingAnalyzer의 네 가지 분석을 Polars로 실행
+
+pandas 경로(data_preprocessing.DERIVED_COLUMNS, MusinsaMarketingAnalyzer)와 같은 정제 규칙과 같은
+분석을 Polars 지연 실행(LazyFrame)으로 처리한다. 결과는 대시보드가 그대로 쓸 수 있도록 pandas 경로와
+같은 형태(pandas Series/DataFrame, dict)로 반환하고, 동률 순서도 pandas 경로와 같게 맞춘다.
+- 개수/평균으로 정렬할 때 동률이면 카테고리 순서 (브랜드명/카테고리는 처음 등장한 순서, 구간은 구간 순서)
+- nsmallest는 동률이면 먼저 나온 행
+
+사용법:
+    analyzer = MusinsaMarketingAnalyzer('data/musinsa_ranking_precise.xlsx', engine='polars')
+    diff_insights(pandas_insights, polars_insights)   # 두 엔진 결과 비교 (차이 목록, 같으면 빈 목록)
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from preprocessing.data_preprocessing import (
+    PRICE_BINS, PRICE_LABELS, DISCOUNT_BINS, DISCOUNT_LABELS, REVIEW_BINS, REVIEW_LABELS, RANKING_SCHEMA,
+)
+
+ROW = '_row'
+
+
+def _extract_number(frame, column, default):
+    """data_preprocessing._extract_number와 같은 규칙 (문자열로 바꿔 숫자만 남김, 없으면 default)
+
+    pandas 경로와 마찬가지로 고유값만 정제한 뒤 원래 행에 다시 매핑한다.
+    """
+    uniques = frame.select(pl.col(column).cast(pl.String).unique().drop_nulls()).to_series()
+    digits = uniques.str.replace_all(r'[^\d]', '')
+    # pandas 경로와 같이 숫자가 없거나 19자리 이상(int64 범위 초과 가능)이면 값 없음
+    invalid = (pl.lit(digits) == '') | (pl.lit(digits).str.strip_chars_start('0').str.len_chars() > 18)
+    values = pl.select(pl.when(invalid).then(None).otherwise(pl.lit(digits))
+                       .cast(pl.Int64, strict=False)).to_series()
+    value = pl.col(column).cast(pl.String).replace_strict(uniques, values, default=None, return_dtype=pl.Int64)
+    name = f'{column}_정제'
+    if default is None:
+        return value.cast(pl.Float64).alias(name)
+    value = value.fill_null(default)
+    if RANKING_SCHEMA.get(name, '').startswith('int'):
+        # pandas 경로(_within_schema)와 같이 스키마 정수형 범위를 벗어난 값은 null
+        limits = np.iinfo(RANKING_SCHEMA[name])
+        value = pl.when(value.is_between(int(limits.min), int(limits.max))).then(value)
+    return value.alias(name)
+
+
+def _cut(column, bins, labels, name):
+    """pd.cut(bins, labels)과 같은 구간 (오른쪽 닫힌 구간, 범위 밖/결측치는 null)"""
+    expr = pl.when((pl.col(column) > bins[0]) & (pl.col(column) <= bins[1])).then(pl.lit(labels[0]))
+    for low, high, label in zip(bins[1:-1], bins[2:], labels[1:]):
+        expr = expr.when((pl.col(column) > low) & (pl.col(column) <= high)).then(pl.lit(label))
+    return expr.otherwise(None).cast(pl.Enum(labels)).alias(name)
+
+
+def clean(frame):
+    """원본 컬럼에서 정제/파생 컬럼 계산 (Polars DataFrame -> LazyFrame)"""
+    return (
+        frame.lazy()
+        .with_columns(
+            _extract_number(frame, '현재가격', None),
+            _extract_number(frame, '원가', None),
+            _extract_number(frame, '할인율', 0),
+            _extract_number(frame, '리뷰수', 0),
+            pl.col('평점').fill_nan(None),
+        )
+        .with_columns(
+            (pl.col('원가_정제') - pl.col('현재가격_정제')).alias('할인액'),
+            (pl.col('순위') / (pl.col('리뷰수_정제') + 1)).alias('리뷰당_순위점수'),
+            _cut('현재가격_정제', PRICE_BINS, PRICE_LABELS, '가격대'),
+            _cut('할인율_정제', DISCOUNT_BINS, DISCOUNT_LABELS, '할인율_구간'),
+            _cut('리뷰수_정제', REVIEW_BINS, REVIEW_LABELS, '리뷰수_구간'),
+            # 동률 정렬용: 브랜드/카테고리가 전체 데이터에서 처음 등장한 행
+            pl.col(ROW).min().over('브랜드명').alias('_브랜드명_순서'),
+            pl.col(ROW).min().over('카테고리').alias('_카테고리_순서'),
+        )
+    )
+
+
+def _value(value):
+    """Polars 결과 값을 pandas 경로와 같은 형태로 (null -> NaN)"""
+    return np.nan if value is None else value
+
+
+def _series(frame, key, value, name):
+    return pd.Series([_value(v) for v in frame[value].to_list()],
+                     index=pd.Index(frame[key].cast(pl.String).to_list(), name=key), name=name)
+
+
+def _corr(frame, a, b):
+    pairs = frame.filter(pl.col(a).is_not_null() & pl.col(b).is_not_null())
+    return pairs.select(pl.corr(pl.col(a).cast(pl.Float64), pl.col(b).cast(pl.Float64))).item()
+
+
+class PolarsAnalysis:
+    """Polars로 실행하는 네 가지 분석 (MusinsaMarketingAnalyzer와 같은 결과)"""
+
+    def __init__(self, frame):
+        """frame: 스키마를 적용한 원본 랭킹 데이터 (pandas DataFrame, Polars DataFrame/LazyFrame)"""
+        if isinstance(frame, pd.DataFrame):
+            frame = pl.from_pandas(frame)
+        if isinstance(frame, pl.LazyFrame):
+            frame = frame.collect()
+        # 정제 결과는 네 가지 분석이 같이 쓰므로 한 번만 계산해둠
+        self.df = clean(frame.with_row_index(ROW)).collect()
+
+    @classmethod
+    def scan(cls, path):
+        """Parquet 파일(스트리밍 전처리 결과 등)을 pandas를 거치지 않고 바로 읽어 분석"""
+        return cls(pl.scan_parquet(path))
+
+    def _counts(self, frame, key, labels=None):
+        """count_values와 같은 결과: 개수 내림차순, 동률이면 카테고리 순서
+
+        labels가 있으면(구간 컬럼) 0개인 구간도 포함, 없으면 등장한 값만.
+        """
+        counts = frame.filter(pl.col(key).is_not_null()).group_by(key).agg(pl.len().alias('count'))
+        if labels is not None:
+            order = pl.LazyFrame({key: labels}, schema={key: pl.Enum(labels)}).with_row_index('_order')
+            counts = order.join(counts, on=key, how='left').with_columns(pl.col('count').fill_null(0))
+        else:
+            order = frame.group_by(key).agg(pl.col(f'_{key}_순서').first().alias('_order'))
+            counts = counts.join(order, on=key)
+        return counts.sort(['count', '_order'], descending=[True, False])
+
+    def _group_mean(self, frame, key, value, descending=False, labels=None):
+        """groupby(key)[value].mean().sort_values(kind='stable')과 같은 결과 (NaN은 마지막)"""
+        if labels is not None:
+            # observed=False: 값이 없는 구간도 NaN으로 포함, 동률이면 구간 순서
+            order = pl.LazyFrame({key: labels}, schema={key: pl.Enum(labels)}).with_row_index('_order')
+            means = frame.filter(pl.col(key).is_not_null()).group_by(key).agg(pl.col(value).mean())
+            stats = order.join(means, on=key, how='left')
+        else:
+            stats = frame.filter(pl.col(key).is_not_null()).group_by(key).agg(
+                pl.col(value).mean(), pl.col(f'_{key}_순서').first().alias('_order'))
+        return stats.sort([value, '_order'], descending=[descending, False], nulls_last=True)
+
+    def price_discount_analysis(self):
+        """가격/할인 전략 분석"""
+        lf = self.df.lazy()
+        top20 = lf.filter(pl.col('순위') <= 20)
+        price_dist, rank_by_price, rank_by_discount, top20_dist, discount_by_category = pl.collect_all([
+            self._counts(lf, '가격대', PRICE_LABELS).sort('_order'),
+            self._group_mean(lf, '가격대', '순위', labels=PRICE_LABELS),
+            self._group_mean(lf, '할인율_구간', '순위', labels=DISCOUNT_LABELS),
+            self._counts(top20, '가격대', PRICE_LABELS),
+            self._group_mean(lf, '카테고리', '할인율_정제', descending=True),
+        ])
+        return {
+            'price_range_dist': _series(price_dist, '가격대', 'count', 'count'),
+            'avg_rank_by_price': _series(rank_by_price, '가격대', '순위', '순위'),
+            'discount_rank_corr': _corr(self.df, '할인율_정제', '순위'),
+            'avg_rank_by_discount': _series(rank_by_discount, '할인율_구간', '순위', '순위'),
+            'top20_price_range': _series(top20_dist, '가격대', 'count', 'count'),
+            'avg_discount_by_category': _series(discount_by_category, '카테고리', '할인율_정제', '할인율_정제'),
+        }
+
+    def brand_category_insights(self):
+        """브랜드/카테고리 인사이트 분석"""
+        lf = self.df.lazy()
+        brand_counts, brand_rank, category_dist, price_by_category = pl.collect_all([
+            self._counts(lf, '브랜드명').head(10),
+            self._group_mean(lf, '브랜드명', '순위').head(10),
+            self._counts(lf, '카테고리'),
+            self._group_mean(lf, '카테고리', '현재가격_정제', descending=True),
+        ])
+        top_brands = brand_counts['브랜드명'].to_list()[:5]
+        return {
+            'top10_brands': _series(brand_counts, '브랜드명', 'count', 'count'),
+            'brand_avg_rank': _series(brand_rank, '브랜드명', '순위', '순위'),
+            'category_dist': _series(category_dist, '카테고리', 'count', 'count'),
+            'avg_price_by_category': _series(price_by_category, '카테고리', '현재가격_정제', '현재가격_정제'),
+            'brand_category_strategy': self._categories_by_brand(top_brands),
+        }
+
+    def _categories_by_brand(self, brands):
+        """브랜드별 카테고리 개수 (brands 순서대로, 등장한 카테고리만, 개수 내림차순)"""
+        counts = (
+            self.df.lazy().filter(pl.col('브랜드명').is_in(brands) & pl.col('카테고리').is_not_null())
+            .group_by('브랜드명', '카테고리')
+            .agg(pl.len().alias('count'), pl.col('_카테고리_순서').first().alias('_order'))
+            .sort(['count', '_order'], descending=[True, False])
+            .collect()
+        )
+        result = {brand: {} for brand in brands}
+        for brand, category, count in counts.select('브랜드명', '카테고리', 'count').iter_rows():
+            result[brand][category] = count
+        return result
+
+    def customer_response_analysis(self):
+        """고객 반응 분석"""
+        lf = self.df.lazy()
+        efficient, opportunities, rank_by_review = pl.collect_all([
+            # nsmallest처럼 리뷰수를 알 수 없는(null) 제품은 제외
+            lf.drop_nulls('리뷰당_순위점수').sort(['리뷰당_순위점수', ROW]).head(10)
+              .select(ROW, '브랜드명', '상품명', '순위', '리뷰수_정제', '리뷰당_순위점수'),
+            lf.filter((pl.col('평점') >= 4.8) & (pl.col('순위') > 50))
+              .select(ROW, '브랜드명', '상품명', '평점', '순위', '리뷰수_정제'),
+            self._group_mean(lf, '리뷰수_구간', '순위', labels=REVIEW_LABELS),
+        ])
+        return {
+            'rating_rank_corr': _corr(self.df, '평점', '순위'),
+            'review_rank_corr': _corr(self.df, '리뷰수_정제', '순위'),
+            'efficient_products': efficient.to_pandas().set_index(ROW).rename_axis(None),
+            'marketing_opportunities': opportunities.to_pandas().set_index(ROW).rename_axis(None),
+            'avg_rank_by_review_range': _series(rank_by_review, '리뷰수_구간', '순위', '순위'),
+        }
+
+    def competitive_positioning_analysis(self):
+        """경쟁 분석 및 포지셔닝"""
+        lf = self.df.lazy()
+        top10 = lf.filter(pl.col('순위') <= 10)
+        price = pl.col('현재가격_정제')
+        category_stats, top10_stats, dominant_category, top10_price_dist, brand_counts = pl.collect_all([
+            lf.filter(pl.col('카테고리').is_not_null()).group_by('카테고리').agg(
+                pl.len().alias('count'),
+                pl.col(ROW).min().alias('_order'),
+                price.min().alias('min_price'),
+                price.mean().alias('avg_price'),
+                price.max().alias('max_price'),
+                price.sort_by(['순위', ROW]).head(3).mean().alias('top3_avg_price'),
+            ).filter(pl.col('count') >= 3).sort('_order'),
+            top10.select(price.mean(), pl.col('할인율_정제').mean(), pl.col('평점').mean(), pl.col('리뷰수_정제').mean()),
+            self._counts(top10, '카테고리'),
+            self._counts(top10, '가격대', PRICE_LABELS),
+            self._counts(lf, '브랜드명').filter(pl.col('count') >= 2).head(5),
+        ])
+
+        category_price_stats = {
+            row['카테고리']: {key: _value(row[key]) for key in ('min_price', 'avg_price', 'max_price', 'top3_avg_price')}
+            for row in category_stats.iter_rows(named=True)
+        }
+        top10_row = top10_stats.row(0, named=True)
+
+        brands = brand_counts['브랜드명'].to_list()
+        brand_stats = lf.filter(pl.col('브랜드명').is_in(brands)).group_by('브랜드명').agg(
+            pl.len().alias('product_count'),
+            pl.col('순위').mean().alias('avg_rank'),
+            price.min().alias('min_price'),
+            price.max().alias('max_price'),
+        ).collect()
+        brand_stats = {row['브랜드명']: row for row in brand_stats.iter_rows(named=True)}
+        categories = self._categories_by_brand(brands)
+        brand_portfolio = {}
+        for brand in brands:
+            stats = brand_stats[brand]
+            brand_portfolio[brand] = {
+                'product_count': stats['product_count'],
+                'avg_rank': stats['avg_rank'],
+                'price_range': f"{_value(stats['min_price']):,} - {_value(stats['max_price']):,}",
+                'categories': categories[brand],
+            }
+
+        return {
+            'category_price_stats': category_price_stats,
+            'top10_characteristics': {
+                'avg_price': _value(top10_row['현재가격_정제']),
+                'avg_discount': _value(top10_row['할인율_정제']),
+                'avg_rating': _value(top10_row['평점']),
+                'avg_reviews': _value(top10_row['리뷰수_정제']),
+                'dominant_category': dict(zip(dominant_category['카테고리'].to_list(), dominant_category['count'].to_list())),
+                'price_range_dist': dict(zip(top10_price_dist['가격대'].cast(pl.String).to_list(),
+                                             top10_price_dist['count'].to_list())),
+            },
+            'brand_portfolio_analysis': brand_portfolio,
+        }
+
+    def get_all_insights(self):
+        """모든 분석 결과 종합"""
+        return {
+            'price_discount': self.price_discount_analysis(),
+            'brand_category': self.brand_category_insights(),
+            'customer_response': self.customer_response_analysis(),
+            'competitive_positioning': self.competitive_positioning_analysis()
+        }
+
+
+def _is_null(value):
+    """None, NaN, pd.NA 모두 결측치로 취급 (pandas는 NaN/<NA>, Polars는 None으로 돌려줌)"""
+    return value is None or value is pd.NA or (isinstance(value, float) and math.isnan(value))
+
+
+def _close(a, b, rtol):
+    if _is_null(a) or _is_null(b):
+        return _is_null(a) and _is_null(b)
+    try:
+        a, b = float(a), float(b)
+    except (TypeError, ValueError):
+        return str(a) == str(b)
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return math.isclose(a, b, rel_tol=rtol, abs_tol=1e-9)
+
+
+def diff_insights(expected, actual, rtol=1e-6, path=''):
+    """두 분석 결과(get_all_insights)의 차이 목록 (같으면 빈 목록)
+
+    Series/dict는 키 순서까지, DataFrame은 인덱스/컬럼/값을 비교한다. 실수는 상대 오차 rtol까지 같은 값으로 본다.
+    """
+    if isinstance(expected, pd.Series) and isinstance(actual, pd.Series):
+        expected = list(zip(map(str, expected.index), expected.tolist()))
+        actual = list(zip(map(str, actual.index), actual.tolist()))
+    elif isinstance(expected, pd.DataFrame) and isinstance(actual, pd.DataFrame):
+        if list(expected.columns) != list(actual.columns) or list(expected.index) != list(actual.index):
+            return [f"{path}: 인덱스/컬럼이 다릅니다."]
+        expected = [list(row) for row in expected.itertuples(index=False)]
+        actual = [list(row) for row in actual.itertuples(index=False)]
+
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        if list(map(str, expected)) != list(map(str, actual)):
+            return [f"{path}: 키가 다릅니다 {list(expected)[:5]}... != {list(actual)[:5]}..."]
+        diffs = []
+        for (key, value), other in zip(expected.items(), actual.values()):
+            diffs += diff_insights(value, other, rtol, f"{path}/{key}")
+        return diffs
+    if isinstance(expected, (list, tuple)) and isinstance(actual, (list, tuple)):
+        if len(expected) != len(actual):
+            return [f"{path}: 길이가 다릅니다 ({len(expected)} != {len(actual)})"]
+        diffs = []
+        for i, (value, other) in enumerate(zip(expected, actual)):
+            diffs += diff_insights(value, other, rtol, f"{path}[{i}]")
+        return diffs
+    if not _close(expected, actual, rtol):
+        return [f"{path}: {expected!r} != {actual!r}"]
+    return []
@@ -5,6 +5,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 from analysis.marketing_analysis import MusinsaMarketingAnalyzer
+from preprocessing.ranking_dataset import RankingDataset
 
 # 페이지 설정
 st.set_page_config(
@@ -45,11 +46,13 @@ st.markdown("---")
 # 데이터 로드
 @st.cache_data
 def load_data():
-    analyzer = MusinsaMarketingAnalyzer('data/musinsa_ranking_precise.xlsx')
+    dataset = RankingDataset.load('data/musinsa_ranking_precise.xlsx')
+    analyzer = MusinsaMarketingAnalyzer(dataset)
     return analyzer, analyzer.get_all_insights()
 
 analyzer, insights = load_data()
-df = analyzer.df
+# 요약 지표에 필요한 컬럼 (분석 중에 이미 계산된 컬럼은 다시 계산하지 않음)
+df = analyzer.data.require('현재가격_정제', '할인율_정제', '리뷰수_정제', '평점', '브랜드명', '카테고리')
 
 # 사이드바
 st.sidebar.header("📊 분석 메뉴")
@@ -0,0 +1,94 @@
+import asyncio
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """비동기 토큰 버킷 - 초당 rate개 요청, 최대 burst개까지 몰아서 허용"""
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = None
+        self._lock = None
+        self.waited = 0.0  # 토큰을 기다린 총 시간 (초)
+
+    def _refill(self, now):
+        if self._updated is None:
+            self._updated = now
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        # Lock은 이벤트 루프 안에서 생성해야 하므로 첫 호출 시 만든다
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            self._refill(loop.time())
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                self.waited += delay
+                await asyncio.sleep(delay)
+                self._refill(loop.time())
+            self._tokens -= 1
+
+
+class AsyncCrawlEngine:
+    """asyncio 기반 크롤링 엔진
+
+    요청 간격은 전역 토큰 버킷(rate, burst)으로, 동시 접속 수는 호스트별 세마포어로 제한한다.
+    대기 중인 작업은 스레드를 점유하지 않으므로 처리량은 설정한 rate까지 올라간다.
+    재시도도 시도마다 토큰을 얻고, 백오프 동안에는 호스트 세마포어를 놓아 다른 작업이 쓰게 한다.
+    """
+
+    def __init__(self, extract, rate=2.0, burst=5, per_host_limit=10, on_done=None):
+        """
+        extract: async 함수 (url, rank, attempt) -> 성공하면 None, 실패하면 CrawlFailure
+                 (retry_in초 뒤 attempt + 1로 다시 호출, retry_in이 None이면 포기)
+        on_done: 작업 하나가 끝날 때마다 호출되는 콜백 (url, rank, 성공 여부)
+        """
+        self.extract = extract
+        self.bucket = TokenBucket(rate, burst)
+        self.per_host_limit = per_host_limit
+        self.on_done = on_done
+        self._host_semaphores = {}
+
+    def _host_semaphore(self, url):
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def _attempt(self, url, rank, attempt):
+        async with self._host_semaphore(url):
+            await self.bucket.acquire()
+            return await self.extract(url, rank, attempt)
+
+    async def _crawl_one(self, url, rank):
+        attempt = 1
+        while True:
+            try:
+                failure = await self._attempt(url, rank, attempt)
+            except Exception as e:
+                print(f'[{rank}위] 예외 발생: {e}')
+                result = False
+                break
+            if failure is None or failure.retry_in is None:
+                result = failure is None
+                break
+            await asyncio.sleep(failure.retry_in)
+            attempt += 1
+        if self.on_done:
+            self.on_done(url, rank, result)
+        return result
+
+    async def run(self, url_rank_tuples):
+        """모든 (url, rank)를 크롤링하고 성공 여부 리스트 반환 (입력 순서 유지)"""
+        self._host_semaphores = {}
+        tasks = [self._crawl_one(url, rank) for url, rank in url_rank_tuples]
+        return await asyncio.gather(*tasks)
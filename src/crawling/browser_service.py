@@ -0,0 +1,320 @@
+"""크롬 세션을 미리 띄워두고 여러 크롤링 실행이 나눠 쓰는 브라우저 서비스
+
+크롤링을 실행할 때마다 chromedriver와 크롬을 새로 띄우는 대신, 데몬이 headless 크롬 세션을
+미리 띄워두고(warm) 크롤러는 로컬 Remote WebDriver 엔드포인트로 기존 세션에 붙어서 사용한다.
+크롤러가 드라이버를 종료(quit)하면 세션은 닫히지 않고 서비스로 반납된다.
+
+사용법:
+    python src/crawling/browser_service.py --sessions 10     # 데몬 실행 (기본: http://127.0.0.1:9600)
+    python src/crawling/musinsa_precise_crawler.py --browser-service http://127.0.0.1:9600
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from musinsa_page import USER_AGENT
+from network_profile import NetworkProfile
+
+CHROMEDRIVER_PATH = Path.home() / ".chromedriver" / "chromedriver"
+DEFAULT_SERVICE_URL = 'http://127.0.0.1:9600'
+
+
+def build_chrome_options(network_profile):
+    """크롤링용 headless 크롬 옵션 (네트워크 차단 프로필 적용)"""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument(f'user-agent={USER_AGENT}')
+    network_profile.apply_options(chrome_options)
+    return chrome_options
+
+
+class RemoteChrome(webdriver.Remote):
+    """chromedriver 엔드포인트에 연결한 Remote 드라이버 (CDP 명령 지원)"""
+
+    def __init__(self, executor_url, options=None):
+        super().__init__(
+            command_executor=ChromiumRemoteConnection(executor_url, vendor_prefix='goog',
+                                                      browser_name='chrome', keep_alive=True),
+            options=options or Options(),
+        )
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
+class AttachedChrome(RemoteChrome):
+    """브라우저 서비스가 빌려준 기존 세션에 붙은 드라이버
+
+    새 세션을 만들지 않으므로 연결이 즉시 끝나고, quit()하면 세션을 종료하지 않고 서비스에 반납한다.
+    """
+
+    def __init__(self, client, lease):
+        self._client = client
+        self._lease = lease
+        self.pages = 0
+        super().__init__(lease['executor'])
+
+    def start_session(self, capabilities):
+        self.session_id = self._lease['session_id']
+        self.caps = self._lease.get('capabilities') or {}
+
+    def get(self, url):
+        self.pages += 1
+        super().get(url)
+
+    def quit(self):
+        if self.session_id:
+            self._client.release(self.session_id, pages=self.pages)
+            self.session_id = None
+
+
+class BrowserServiceClient:
+    """크롤러 쪽에서 브라우저 서비스의 세션을 빌리고 반납하는 클라이언트"""
+
+    def __init__(self, url=DEFAULT_SERVICE_URL, timeout=60):
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+
+    def _post(self, path, payload, timeout=10):
+        response = requests.post(f"{self.url}{path}", json=payload, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def available(self):
+        try:
+            return requests.get(f"{self.url}/status", timeout=2).ok
+        except requests.RequestException:
+            return False
+
+    def status(self):
+        return requests.get(f"{self.url}/status", timeout=5).json()
+
+    def attach(self):
+        """세션 하나를 빌려 AttachedChrome으로 반환 (빈 세션이 없으면 timeout초까지 대기)"""
+        lease = self._post('/lease', {'timeout': self.timeout}, timeout=self.timeout + 10)
+        return AttachedChrome(self, lease)
+
+    def release(self, session_id, pages=0):
+        try:
+            self._post('/release', {'session_id': session_id, 'pages': pages})
+        except requests.RequestException:
+            # 서비스가 내려갔으면 반납할 곳이 없음 (lease 만료 후 서비스가 회수)
+            pass
+
+
+class BrowserService:
+    """warm 크롬 세션 풀 (데몬 프로세스 안에서 동작)
+
+    chromedriver 하나에 size개의 세션을 띄워두고 lease/release로 빌려준다.
+    반납된 세션은 about:blank로 이동한 뒤 살아 있는지 확인하고, 죽었거나
+    max_pages_per_session 페이지를 넘게 처리한 세션은 새 세션으로 교체한다.
+    반납되지 않은 세션은 lease_timeout초 후 회수한다 (크롤러가 비정상 종료된 경우).
+    """
+
+    def __init__(self, size=10, max_pages_per_session=200, lease_timeout=1800, network_profile=None):
+        self.size = size
+        self.max_pages_per_session = max_pages_per_session
+        self.lease_timeout = lease_timeout
+        self.network_profile = network_profile or NetworkProfile()
+
+        self.service = Service(str(CHROMEDRIVER_PATH))
+        self._idle = queue.LifoQueue()
+        self._sessions = {}  # session_id -> 드라이버
+        self._pages = {}     # session_id -> 처리한 페이지 수
+        self._leases = {}    # session_id -> lease 시각
+        self._lock = threading.Lock()
+
+        # 통계
+        self.created = 0
+        self.replaced = 0
+        self.leased = 0
+
+    @property
+    def executor_url(self):
+        return self.service.service_url
+
+    def start(self):
+        """chromedriver를 띄우고 세션을 size개 미리 생성"""
+        self.service.start()
+        for _ in range(self.size):
+            self._idle.put(self._create())
+        threading.Thread(target=self._reap_expired, daemon=True).start()
+        return self
+
+    def _create(self):
+        driver = RemoteChrome(self.executor_url, options=build_chrome_options(self.network_profile))
+        self.network_profile.apply(driver)
+        with self._lock:
+            self._sessions[driver.session_id] = driver
+            self._pages[driver.session_id] = 0
+            self.created += 1
+        return driver.session_id
+
+    def _destroy(self, session_id):
+        with self._lock:
+            driver = self._sessions.pop(session_id, None)
+            self._pages.pop(session_id, None)
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def lease(self, timeout=60):
+        """빈 세션 하나를 빌려줌 - {'executor': chromedriver URL, 'session_id': ..., 'capabilities': ...}"""
+        session_id = self._idle.get(timeout=timeout)
+        with self._lock:
+            self._leases[session_id] = time.time()
+            self.leased += 1
+            driver = self._sessions[session_id]
+        return {'executor': self.executor_url, 'session_id': session_id, 'capabilities': driver.caps}
+
+    def release(self, session_id, pages=0):
+        """반납된 세션 정리 후 다시 대기열에 넣음 (죽었거나 수명이 다한 세션은 교체)"""
+        with self._lock:
+            if self._leases.pop(session_id, None) is None:
+                return  # 이미 회수된 세션
+            driver = self._sessions.get(session_id)
+            self._pages[session_id] = self._pages.get(session_id, 0) + pages
+            expired = self._pages[session_id] >= self.max_pages_per_session
+
+        healthy = False
+        if driver and not expired:
+            try:
+                driver.get('about:blank')
+                driver.get_log('performance')  # 다음 사용자가 이전 페이지의 네트워크 로그를 받지 않도록 비움
+                healthy = True
+            except Exception:
+                healthy = False
+
+        if healthy:
+            self._idle.put(session_id)
+            return
+
+        self._destroy(session_id)
+        with self._lock:
+            self.replaced += 1
+        try:
+            self._idle.put(self._create())
+        except Exception as e:
+            print(f"✗ 세션 재생성 실패: {e}")
+
+    def _reap_expired(self, interval=30):
+        while True:
+            time.sleep(interval)
+            cutoff = time.time() - self.lease_timeout
+            with self._lock:
+                expired = [session_id for session_id, since in self._leases.items() if since < cutoff]
+            for session_id in expired:
+                print(f"lease 만료로 세션 회수: {session_id}")
+                self.release(session_id)
+
+    def status(self):
+        with self._lock:
+            return {
+                'executor': self.executor_url,
+                'sessions': len(self._sessions),
+                'idle': self._idle.qsize(),
+                'leased': len(self._leases),
+                'created': self.created,
+                'replaced': self.replaced,
+                'total_leases': self.leased,
+            }
+
+    def close(self):
+        for session_id in list(self._sessions):
+            self._destroy(session_id)
+        self.service.stop()
+
+
+def make_handler(browser_service):
+    """브라우저 서비스 제어 API (GET /status, POST /lease, POST /release)"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, status, payload):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/status':
+                self._reply(200, browser_service.status())
+            else:
+                self._reply(404, {'error': 'not found'})
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            if self.path == '/lease':
+                try:
+                    self._reply(200, browser_service.lease(timeout=payload.get('timeout', 60)))
+                except queue.Empty:
+                    self._reply(503, {'error': '사용 가능한 세션이 없습니다.'})
+            elif self.path == '/release':
+                browser_service.release(payload['session_id'], pages=payload.get('pages', 0))
+                self._reply(200, {'ok': True})
+            else:
+                self._reply(404, {'error': 'not found'})
+
+    return Handler
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="크롤러가 공유하는 warm 크롬 세션 서비스")
+    parser.add_argument('--url', default=DEFAULT_SERVICE_URL, help=f"제어 API 주소 (기본: {DEFAULT_SERVICE_URL})")
+    parser.add_argument('--sessions', type=int, default=10, help="미리 띄워둘 크롬 세션 수 (기본: 10)")
+    parser.add_argument('--max-pages', type=int, default=200, help="세션 하나가 처리할 최대 페이지 수 (기본: 200)")
+    parser.add_argument('--lease-timeout', type=int, default=1800,
+                        help="반납되지 않은 세션을 회수할 시간(초) (기본: 1800)")
+    parser.add_argument('--no-block', action='store_true', help="이미지/폰트/트래커 등 리소스 차단 비활성화")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    address = urlparse(args.url)
+    browser_service = BrowserService(args.sessions, args.max_pages, args.lease_timeout,
+                                     NetworkProfile(enabled=not args.no_block))
+
+    print(f"크롬 세션 {args.sessions}개 생성 중...")
+    start_time = time.time()
+    browser_service.start()
+    print(f"✓ 세션 준비 완료 ({time.time() - start_time:.1f}초), chromedriver: {browser_service.executor_url}")
+
+    server = ThreadingHTTPServer((address.hostname, address.port), make_handler(browser_service))
+    server.daemon_threads = True
+    print(f"✓ 브라우저 서비스 실행: {args.url} (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n브라우저 서비스 종료 중...")
+    finally:
+        server.server_close()
+        browser_service.close()
+
+
+if __name__ == "__main__":
+    main()
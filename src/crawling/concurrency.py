@@ -0,0 +1,105 @@
+import statistics
+import threading
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 메모리 압박 신호 없이 동작
+    psutil = None
+
+
+class AdaptiveConcurrency:
+    """AIMD 방식의 동시 처리 개수 조절기
+
+    window개의 결과마다 지연 시간, 오류율, 빈 레코드 비율, 메모리 사용률을 확인해서
+    문제가 없으면 동시 처리 개수를 1 늘리고(additive increase),
+    하나라도 기준을 넘으면 절반으로 줄인다(multiplicative decrease).
+    """
+
+    def __init__(self, max_workers, min_workers=1, initial=None, window=10,
+                 latency_tolerance=2.0, error_threshold=0.2, blank_threshold=0.2,
+                 memory_threshold=85.0, on_change=None):
+        self.max_workers = max_workers
+        self.min_workers = min(min_workers, max_workers)
+        self.limit = initial or max(self.min_workers, max_workers // 2)
+        self.window = window
+        self.latency_tolerance = latency_tolerance  # 기준 지연 시간 대비 허용 배수
+        self.error_threshold = error_threshold
+        self.blank_threshold = blank_threshold
+        self.memory_threshold = memory_threshold  # 시스템 메모리 사용률(%)
+        self.on_change = on_change  # on_change(old, new, reason)
+
+        self._cond = threading.Condition()
+        self._active = 0
+        self._samples = []  # 현재 window의 (지연 시간, 성공 여부, 빈 레코드 여부)
+        self.baseline_latency = None  # 지금까지 관측한 window 중앙값 지연 시간의 최솟값
+
+        # 통계
+        self.increases = 0
+        self.decreases = 0
+        self.peak = self.limit
+
+    @contextmanager
+    def slot(self):
+        """현재 동시 처리 개수 한도 안에서 작업 실행"""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def memory_percent(self):
+        return psutil.virtual_memory().percent if psutil else None
+
+    def _pressure(self, samples):
+        """window 결과에서 동시 처리 개수를 줄여야 하는 이유 (없으면 None)"""
+        errors = sum(1 for _, success, _ in samples if not success) / len(samples)
+        if errors > self.error_threshold:
+            return f"오류율 {errors:.0%}"
+
+        blanks = sum(1 for _, success, blank in samples if success and blank) / len(samples)
+        if blanks > self.blank_threshold:
+            return f"빈 레코드 {blanks:.0%}"
+
+        memory = self.memory_percent()
+        if memory is not None and memory > self.memory_threshold:
+            return f"메모리 사용률 {memory:.0f}%"
+
+        latency = statistics.median(latency for latency, _, _ in samples)
+        if self.baseline_latency is None or latency < self.baseline_latency:
+            self.baseline_latency = latency
+        elif latency > self.baseline_latency * self.latency_tolerance:
+            return f"지연 시간 {latency:.1f}초 (기준 {self.baseline_latency:.1f}초)"
+        return None
+
+    def observe(self, latency, success, blank=False):
+        """작업 하나의 결과 기록 - window가 차면 동시 처리 개수 조정"""
+        with self._cond:
+            self._samples.append((latency, success, blank))
+            if len(self._samples) < self.window:
+                return
+            samples, self._samples = self._samples, []
+
+            old = self.limit
+            reason = self._pressure(samples)
+            if reason:
+                self.limit = max(self.min_workers, self.limit // 2)
+                self.decreases += 1
+            else:
+                self.limit = min(self.max_workers, self.limit + 1)
+                self.increases += 1
+            new = self.limit
+            self.peak = max(self.peak, new)
+            self._cond.notify_all()
+
+        if new != old and self.on_change:
+            self.on_change(old, new, reason)
+
+    def summary(self):
+        return (f"동시 처리 개수: 최종 {self.limit}개, 최대 {self.peak}개 "
+                f"(증가 {self.increases}회, 감소 {self.decreases}회, 범위 {self.min_workers}~{self.max_workers})")
@@ -0,0 +1,132 @@
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# 히스토그램 버킷 상한 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float('inf'))
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (값 개수와 무관하게 메모리 일정)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q):
+        """버킷 상한 기준 근사 백분위수"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for upper, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return min(upper, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': round(self.total, 4),
+            'mean': round(self.total / self.count, 4) if self.count else None,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'buckets': {('+Inf' if upper == float('inf') else str(upper)): count
+                        for upper, count in zip(self.buckets, self.counts)},
+        }
+
+
+class CrawlMetrics:
+    """크롤링 단계별 소요 시간, 필드별 셀렉터 적중률, 실패 유형 집계"""
+
+    STAGES = ('acquire', 'navigate', 'wait', 'extract', 'sink')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {stage: Histogram() for stage in self.STAGES}
+        self.field_hits = Counter()
+        self.field_misses = Counter()
+        self.failures = Counter()
+        self.products = 0
+        self.started_at = time.time()
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            if stage not in self.histograms:
+                self.histograms[stage] = Histogram()
+            self.histograms[stage].observe(seconds)
+
+    @contextmanager
+    def time(self, stage):
+        """with 블록의 소요 시간을 stage 히스토그램에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def record_fields(self, data, fields):
+        """필드별 값 추출 성공/실패 집계"""
+        with self._lock:
+            self.products += 1
+            for key in fields:
+                if data.get(key):
+                    self.field_hits[key] += 1
+                else:
+                    self.field_misses[key] += 1
+
+    def record_failure(self, kind):
+        """실패 유형별 횟수 집계 (failures.classify_failure의 분류)"""
+        with self._lock:
+            self.failures[kind] += 1
+
+    def report(self):
+        """실행 리포트 (JSON 직렬화 가능한 dict)"""
+        with self._lock:
+            return {
+                'started_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at)),
+                'elapsed': round(time.time() - self.started_at, 2),
+                'products': self.products,
+                'stages': {stage: hist.to_dict() for stage, hist in self.histograms.items()},
+                'fields': {key: {'hit': self.field_hits[key], 'miss': self.field_misses[key]}
+                           for key in sorted(set(self.field_hits) | set(self.field_misses))},
+                'failures': dict(self.failures),
+            }
+
+    def write_report(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+    def summary(self):
+        lines = ["단계별 소요 시간 (평균 / p95):"]
+        for stage, hist in self.histograms.items():
+            if hist.count:
+                lines.append(f"  {stage}: {hist.total / hist.count * 1000:.0f}ms / "
+                             f"{hist.percentile(0.95) * 1000:.0f}ms ({hist.count}회)")
+        misses = {key: count for key, count in self.field_misses.items() if count}
+        if misses:
+            lines.append("필드 누락: " + ", ".join(f"{key} {count}개" for key, count in misses.items()))
+        if self.failures:
+            lines.append("실패 유형: " + ", ".join(f"{name} {count}회" for name, count in self.failures.items()))
+        return "\n".join(lines)
@@ -0,0 +1,254 @@
+"""무신사 랭킹 다중 카테고리/섹션 크롤링 스케줄러
+
+크롤링 매트릭스(섹션 x 카테고리 x 성별)를 SQLite 작업 큐로 펼치고,
+여러 워커 프로세스(또는 큐 파일을 공유하는 여러 머신)가 작업 묶음을 lease해서 처리한다.
+
+사용법:
+    python src/crawling/crawl_scheduler.py enqueue --categories 000 001 002 --genders A M F
+    python src/crawling/crawl_scheduler.py work --workers 10     # 프로세스/머신마다 실행
+    python src/crawling/crawl_scheduler.py status
+"""
+import argparse
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from work_queue import WorkQueue
+from crawl_state import CrawlStateStore
+from musinsa_page import build_ranking_url
+from musinsa_precise_crawler import MusinsaPreciseCrawler
+from result_sink import open_sink
+
+DEFAULT_SECTIONS = ['199']
+# 전체, 상의, 아우터, 바지, 원피스/스커트, 가방, 신발, 패션소품, 속옷/홈웨어, 뷰티, 스포츠/레저
+DEFAULT_CATEGORIES = ['000', '001', '002', '003', '100', '004', '103', '101', '026', '104', '017']
+DEFAULT_GENDERS = ['A', 'M', 'F']
+
+
+def current_cycle():
+    """크롤링 주기 ID (시간 단위) - 같은 주기 안에서 다시 enqueue해도 중복 추가되지 않음"""
+    return datetime.now().strftime('%Y%m%d%H')
+
+
+def expand_matrix(queue, cycle, sections, categories, genders, limit=100):
+    """크롤링 매트릭스를 랭킹 작업으로 펼쳐 큐에 추가하고 추가된 개수 반환"""
+    added = 0
+    for section_id in sections:
+        for category_code in categories:
+            for gf in genders:
+                key = f"{cycle}:ranking:{section_id}:{category_code}:{gf}"
+                payload = {
+                    'cycle': cycle,
+                    'section_id': section_id,
+                    'category_code': category_code,
+                    'gf': gf,
+                    'limit': limit,
+                }
+                if queue.put(key, 'ranking', payload):
+                    added += 1
+    return added
+
+
+class CrawlWorker:
+    """작업 큐에서 shard를 lease해서 처리하는 워커"""
+
+    def __init__(self, queue, crawler, owner=None, shard_size=50, max_workers=10, visibility_timeout=600,
+                 adaptive=False):
+        self.queue = queue
+        self.crawler = crawler
+        self.owner = owner or f"{socket.gethostname()}-{os.getpid()}"
+        self.shard_size = shard_size
+        self.max_workers = max_workers
+        self.adaptive = adaptive
+        self.visibility_timeout = visibility_timeout
+        self.results = []
+
+    def handle_ranking(self, payload):
+        """랭킹 페이지에서 URL을 모아 상품 shard로 나눠 큐에 추가"""
+        if self.crawler.driver is None:
+            self.crawler.setup_driver()
+
+        ranking_url = build_ranking_url(payload['section_id'], payload['category_code'], payload['gf'])
+        self.crawler.collect_product_urls(ranking_url, limit=payload['limit'])
+
+        items = [[url, rank] for rank, url in enumerate(self.crawler.product_urls, 1)]
+        prefix = f"{payload['cycle']}:products:{payload['section_id']}:{payload['category_code']}:{payload['gf']}"
+        for i in range(0, len(items), self.shard_size):
+            shard = dict(payload, items=items[i:i + self.shard_size])
+            shard.pop('limit', None)
+            self.queue.put(f"{prefix}:{i // self.shard_size}", 'products', shard)
+
+    def handle_products(self, payload, lost=None):
+        """상품 shard 크롤링 - 레코드에 랭킹 조건(섹션/카테고리/성별)을 함께 기록
+
+        lost(threading.Event)가 set되면 (lease를 다른 워커가 가져감) 남은 상품을 크롤링하지 않고
+        그 뒤에 나온 레코드와 이 shard의 결과는 버린다.
+        """
+        self.crawler.products = []
+        self.crawler.record_context = {
+            '섹션ID': payload['section_id'],
+            '카테고리코드': payload['category_code'],
+            '성별': payload['gf'],
+        }
+        self.crawler.cancel = lost
+        try:
+            self.crawler.crawl_urls([tuple(item) for item in payload['items']], max_workers=self.max_workers,
+                                    adaptive=self.adaptive)
+        finally:
+            self.crawler.record_context = {}
+            self.crawler.cancel = None
+        if lost is None or not lost.is_set():
+            self.results.extend(self.crawler.products)
+
+    @contextmanager
+    def heartbeat(self, task):
+        """작업을 처리하는 동안 visibility_timeout의 1/3마다 lease 연장
+
+        shard가 visibility_timeout보다 오래 걸려도 다른 워커가 같은 shard를 가져가지 않는다.
+        워커 프로세스가 죽으면 연장도 멈추므로 lease가 만료되어 다른 워커가 가져간다.
+        SQLite 연결은 스레드 간에 공유할 수 없어 heartbeat 스레드는 큐 파일을 따로 연다.
+
+        lease를 잃으면 set되는 threading.Event를 넘겨준다. 호출한 쪽은 이를 보고 작업을 멈추고
+        complete하거나 결과를 내보내지 않는다 (이미 다른 워커가 같은 shard를 처리 중).
+        """
+        stop = threading.Event()
+        lost = threading.Event()
+
+        def beat():
+            queue = WorkQueue(self.queue.path, self.queue.max_attempts)
+            try:
+                while not stop.wait(self.visibility_timeout / 3):
+                    try:
+                        extended = queue.extend(task['id'], self.owner, self.visibility_timeout)
+                    except Exception as e:
+                        print(f"[{self.owner}] ✗ lease 연장 중 오류: {e}")
+                        extended = False  # lease가 만료됐을 수 있으므로 잃은 것으로 처리
+                    if not extended:
+                        print(f"[{self.owner}] ✗ lease를 연장하지 못했습니다 (작업 중단): {task['key']}")
+                        lost.set()
+                        break
+            finally:
+                queue.close()
+
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield lost
+        finally:
+            stop.set()
+            thread.join()
+
+    def run(self, wait=False, poll_interval=10):
+        """큐가 빌 때까지 작업 처리 (wait=True면 새 작업을 계속 기다림)"""
+        processed = 0
+        while True:
+            task = self.queue.lease(self.owner, self.visibility_timeout)
+            if task is None:
+                if not wait:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            print(f"\n[{self.owner}] 작업 시작: {task['key']} (시도 {task['attempts']}회)")
+            try:
+                with self.heartbeat(task) as lost:
+                    if task['kind'] == 'ranking':
+                        self.handle_ranking(task['payload'])
+                    else:
+                        self.handle_products(task['payload'], lost)
+                if lost.is_set():
+                    print(f"[{self.owner}] ✗ lease를 잃어 결과를 버림: {task['key']}")
+                    continue
+                self.queue.complete(task['id'], self.owner)
+                processed += 1
+            except Exception as e:
+                print(f"[{self.owner}] ✗ 작업 실패: {task['key']} - {e}")
+                self.queue.fail(task['id'], self.owner, error=e)
+
+        collected = self.crawler.sink.written if self.crawler.sink else len(self.results)
+        print(f"\n✓ [{self.owner}] 처리한 작업: {processed}개, 수집 상품: {collected}개")
+        return processed
+
+
+def print_status(queue):
+    stats = queue.stats()
+    if not stats:
+        print("큐가 비어 있습니다.")
+        return
+    print(f"{'종류':<10}{'상태':<10}{'개수':>8}")
+    for (kind, status), count in sorted(stats.items()):
+        print(f"{kind:<10}{status:<10}{count:>8}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="무신사 랭킹 다중 카테고리 크롤링 스케줄러")
+    parser.add_argument('--queue', default='data/crawl_queue.sqlite', help="작업 큐 파일 (기본: data/crawl_queue.sqlite)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    enqueue = subparsers.add_parser('enqueue', help="크롤링 매트릭스를 작업 큐에 추가")
+    enqueue.add_argument('--sections', nargs='+', default=DEFAULT_SECTIONS)
+    enqueue.add_argument('--categories', nargs='+', default=DEFAULT_CATEGORIES)
+    enqueue.add_argument('--genders', nargs='+', default=DEFAULT_GENDERS)
+    enqueue.add_argument('--limit', type=int, default=100, help="랭킹별 최대 상품 수 (기본: 100)")
+    enqueue.add_argument('--cycle', default=None, help="크롤링 주기 ID (기본: 현재 시각 YYYYMMDDHH)")
+
+    work = subparsers.add_parser('work', help="작업 큐에서 shard를 가져와 크롤링")
+    work.add_argument('--backend', choices=MusinsaPreciseCrawler.BACKENDS, default='selenium')
+    work.add_argument('--workers', type=int, default=10, help="프로세스 내 동시 처리 개수 (기본: 10)")
+    work.add_argument('--adaptive', action='store_true', help="--workers를 상한으로 동시 처리 개수 자동 조절")
+    work.add_argument('--shard-size', type=int, default=50, help="상품 shard 크기 (기본: 50)")
+    work.add_argument('--visibility-timeout', type=int, default=600,
+                      help="lease 만료 시간(초) - 워커가 죽으면 이 시간 후 다른 워커가 가져감 (기본: 600)")
+    work.add_argument('--wait', action='store_true', help="큐가 비어도 종료하지 않고 새 작업 대기")
+    work.add_argument('--state', default='data/crawl_state.sqlite', help="증분 크롤링 상태 저장 파일")
+    work.add_argument('--sink', default=None,
+                      help="결과를 메모리에 모으지 않고 즉시 기록할 경로 (.jsonl 또는 Parquet 디렉토리)")
+    work.add_argument('--dead-letters', default='data/crawl_dead_letters.jsonl',
+                      help="재시도 후에도 실패한 상품 기록 경로 (기본: data/crawl_dead_letters.jsonl)")
+    work.add_argument('--ttl', type=int, default=3600, help="이 시간(초) 안에 수집된 상품은 건너뜀 (기본: 3600)")
+
+    subparsers.add_parser('status', help="작업 큐 상태 출력")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    queue = WorkQueue(args.queue)
+
+    try:
+        if args.command == 'enqueue':
+            cycle = args.cycle or current_cycle()
+            added = expand_matrix(queue, cycle, args.sections, args.categories, args.genders, args.limit)
+            print(f"✓ 주기 {cycle}: 랭킹 작업 {added}개 추가")
+            print_status(queue)
+
+        elif args.command == 'work':
+            crawler = MusinsaPreciseCrawler(backend=args.backend,
+                                            state_store=CrawlStateStore(args.state, ttl=args.ttl),
+                                            sink=open_sink(args.sink) if args.sink else None,
+                                            retain_products=args.sink is None)
+            worker = CrawlWorker(queue, crawler, shard_size=args.shard_size, max_workers=args.workers,
+                                 visibility_timeout=args.visibility_timeout, adaptive=args.adaptive)
+            try:
+                worker.run(wait=args.wait)
+            except KeyboardInterrupt:
+                print("\n\n사용자에 의해 중단되었습니다. (처리 중이던 작업은 lease 만료 후 다시 대기열로 돌아갑니다)")
+            finally:
+                if worker.results:
+                    crawler.products = worker.results
+                    crawler.save_to_excel(f"musinsa_ranking_{current_cycle()}_{worker.owner}.xlsx")
+                if crawler.dead_letters:
+                    crawler.save_dead_letters(args.dead_letters)
+                crawler.close()
+
+        else:
+            print_status(queue)
+    finally:
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
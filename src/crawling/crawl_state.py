@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# 내용 해시에서 제외할 필드 (실행마다 바뀌는 값)
+_VOLATILE_FIELDS = ('순위', '크롤링시간')
+
+
+def content_hash(record):
+    """상품 레코드의 내용 해시 (순위/크롤링시간 제외)"""
+    content = {k: v for k, v in record.items() if k not in _VOLATILE_FIELDS}
+    return hashlib.sha1(json.dumps(content, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class CrawlStateStore:
+    """상품 URL별 크롤링 상태 저장소 (SQLite)
+
+    상품 하나가 끝날 때마다 마지막 수집 시각, 내용 해시, 레코드를 기록(checkpoint)한다.
+    재실행 시 ttl 안에 성공적으로 수집된 상품은 다시 크롤링하지 않는다.
+    """
+
+    def __init__(self, path='data/crawl_state.sqlite', ttl=3600):
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS products (
+                url TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL,
+                success INTEGER NOT NULL,
+                content_hash TEXT,
+                record TEXT
+            )
+        """)
+        self._conn.commit()
+
+        self.changed = 0  # 이번 실행에서 내용이 바뀐 상품 수
+
+    def fresh_records(self, urls, ttl=None):
+        """ttl(기본: self.ttl) 안에 성공적으로 수집된 상품의 {url: 레코드}"""
+        cutoff = time.time() - (self.ttl if ttl is None else ttl)
+        fresh = {}
+        with self._lock:
+            for url in urls:
+                row = self._conn.execute(
+                    'SELECT record FROM products WHERE url = ? AND success = 1 AND fetched_at >= ?',
+                    (url, cutoff)).fetchone()
+                if row:
+                    fresh[url] = json.loads(row[0])
+        return fresh
+
+    def checkpoint(self, record, success):
+        """상품 하나의 수집 결과 기록 (즉시 커밋)"""
+        url = record['상품URL']
+        digest = content_hash(record) if success else None
+        with self._lock:
+            row = self._conn.execute('SELECT content_hash FROM products WHERE url = ?', (url,)).fetchone()
+            if success and row and row[0] and row[0] != digest:
+                self.changed += 1
+            # 실패한 경우 이전에 성공한 레코드는 남겨두고 상태만 갱신
+            self._conn.execute("""
+                INSERT INTO products (url, fetched_at, success, content_hash, record)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    fetched_at = excluded.fetched_at,
+                    success = excluded.success,
+                    content_hash = COALESCE(excluded.content_hash, products.content_hash),
+                    record = COALESCE(excluded.record, products.record)
+            """, (url, time.time(), int(success), digest,
+                  json.dumps(record, ensure_ascii=False) if success else None))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,109 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+
+class DriverPool:
+    """병렬 크롤링용 크롬 드라이버 풀
+
+    워커는 미리 띄워둔 드라이버를 빌려 여러 URL에 재사용하고,
+    드라이버는 일정 페이지 수를 처리했거나 오류가 난 경우에만 새로 만든다.
+    """
+
+    def __init__(self, driver_factory, size, max_pages_per_driver=50):
+        self.driver_factory = driver_factory
+        self.size = size
+        self.max_pages_per_driver = max_pages_per_driver
+
+        self._idle = queue.LifoQueue()  # 최근에 쓴(캐시가 따뜻한) 드라이버부터 재사용
+        self._slots = threading.BoundedSemaphore(size)
+        self._page_counts = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # 통계
+        self.created = 0
+        self.recycled = 0
+
+    def _create(self):
+        driver = self.driver_factory()
+        with self._lock:
+            self._page_counts[driver] = 0
+            self.created += 1
+        return driver
+
+    def _destroy(self, driver):
+        with self._lock:
+            self._page_counts.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """드라이버 대여 (풀 크기만큼만 동시에 대여 가능)"""
+        self._slots.acquire()
+        try:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                return self._create()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, driver, broken=False):
+        """드라이버 반납 - 수명이 다했거나 오류가 난 드라이버는 종료"""
+        try:
+            with self._lock:
+                self._page_counts[driver] = self._page_counts.get(driver, 0) + 1
+                expired = self._page_counts[driver] >= self.max_pages_per_driver
+
+            if broken or expired or self._closed:
+                self._destroy(driver)
+                with self._lock:
+                    self.recycled += 1
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    def shrink(self, keep):
+        """대기 중인 드라이버를 keep개만 남기고 종료 (동시 처리 개수를 줄였을 때 메모리 회수)"""
+        closed = 0
+        while self._idle.qsize() > keep:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._destroy(driver)
+            closed += 1
+        return closed
+
+    @contextmanager
+    def driver(self, keep_on=()):
+        """with 문으로 드라이버를 빌려 쓰고, 예외가 나면 해당 드라이버는 폐기
+
+        keep_on: 드라이버는 정상인 예외 타입 (예: 페이지에 필드가 없음) - 폐기하지 않고 반납
+        """
+        driver = self.acquire()
+        broken = False
+        try:
+            yield driver
+        except keep_on:
+            raise
+        except Exception:
+            broken = True
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    def close(self):
+        """대기 중인 드라이버 모두 종료"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._destroy(driver)
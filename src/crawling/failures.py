@@ -0,0 +1,97 @@
+import asyncio
+import random
+
+import aiohttp
+import requests
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from musinsa_page import MissingFieldsError
+
+# 실패 유형
+TIMEOUT = 'timeout'                    # 페이지 로딩/준비 시간 초과
+DRIVER_CRASH = 'driver_crash'          # 크롬 세션 종료, 연결 끊김 등 드라이버 오류
+MISSING_SELECTOR = 'missing_selector'  # 페이지는 열렸지만 필수 필드를 찾지 못함
+BLOCKED = 'blocked'                    # 403/429 등 사이트의 차단/속도 제한 응답
+HTTP_ERROR = 'http_error'              # 그 외 HTTP 오류 (404 등)
+CONNECTION = 'connection'              # 네트워크 연결 오류
+UNKNOWN = 'unknown'
+
+# 다시 시도해도 결과가 같을 실패 유형 (바로 dead letter로 보냄)
+PERMANENT_KINDS = {MISSING_SELECTOR, HTTP_ERROR}
+
+BLOCK_STATUS_CODES = {403, 429}
+
+
+def _status_code(exc):
+    """HTTP 오류 예외의 상태 코드 (requests / aiohttp)"""
+    response = getattr(exc, 'response', None)
+    if response is not None and getattr(response, 'status_code', None):
+        return response.status_code
+    return getattr(exc, 'status', None)
+
+
+def classify_failure(exc):
+    """예외를 실패 유형으로 분류"""
+    if isinstance(exc, MissingFieldsError):
+        return MISSING_SELECTOR
+    if isinstance(exc, (TimeoutException, requests.Timeout, asyncio.TimeoutError)):
+        return TIMEOUT
+    if isinstance(exc, WebDriverException):
+        return DRIVER_CRASH
+    if isinstance(exc, (requests.HTTPError, aiohttp.ClientResponseError)):
+        status = _status_code(exc)
+        if status in BLOCK_STATUS_CODES:
+            return BLOCKED
+        # 5xx는 일시적인 서버 오류일 수 있으므로 재시도
+        return UNKNOWN if status and status >= 500 else HTTP_ERROR
+    if isinstance(exc, (requests.ConnectionError, aiohttp.ClientConnectionError, ConnectionError)):
+        return CONNECTION
+    return UNKNOWN
+
+
+class CrawlFailure:
+    """분류된 크롤링 실패 하나"""
+
+    def __init__(self, url, rank, exc, attempt):
+        self.url = url
+        self.rank = rank
+        self.kind = classify_failure(exc)
+        self.error = f"{type(exc).__name__}: {exc}".strip()
+        self.attempt = attempt
+        self.retry_in = None  # 재시도 예정이면 대기 시간(초)
+
+    @property
+    def retriable(self):
+        return self.kind not in PERMANENT_KINDS
+
+    def to_record(self):
+        return {
+            '상품URL': self.url,
+            '순위': self.rank,
+            '실패유형': self.kind,
+            '오류': self.error,
+            '시도횟수': self.attempt,
+        }
+
+
+class RetryPolicy:
+    """지수 백오프 + full jitter 재시도 정책
+
+    attempt번째 실패 후 대기 시간은 0 ~ min(max_delay, base_delay * 2^(attempt-1)) 사이의 난수.
+    차단 응답은 같은 속도로 다시 요청하면 또 막히므로 blocked_multiplier배 더 기다린다.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=2.0, max_delay=60.0, blocked_multiplier=4.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.blocked_multiplier = blocked_multiplier
+
+    def should_retry(self, failure):
+        return failure.retriable and failure.attempt < self.max_attempts
+
+    def delay(self, failure):
+        cap = self.base_delay * 2 ** (failure.attempt - 1)
+        if failure.kind == BLOCKED:
+            cap *= self.blocked_multiplier
+        return random.uniform(0, min(self.max_delay, cap))
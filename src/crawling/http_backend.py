@@ -0,0 +1,144 @@
+import threading
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from lxml import html as lxml_html
+
+from musinsa_page import USER_AGENT, PRODUCT_SELECTORS, new_record, selector_chain, finalize_record
+
+# innerText처럼 줄바꿈으로 구분되는 태그
+_BLOCK_TAGS = {
+    'div', 'p', 'li', 'ul', 'ol', 'dl', 'dt', 'dd', 'br', 'tr', 'table',
+    'section', 'article', 'header', 'footer', 'nav', 'aside',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+}
+_SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+}
+
+
+def element_text(element):
+    """Selenium element.text와 최대한 같은 형태로 텍스트 추출
+
+    블록 요소 경계는 줄바꿈, 줄 안의 연속 공백은 하나로 합친다.
+    """
+    parts = []
+
+    def walk(el):
+        if not isinstance(el.tag, str) or el.tag in _SKIP_TAGS:
+            return
+        block = el.tag in _BLOCK_TAGS
+        if block:
+            parts.append('\n')
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append('\n')
+
+    walk(element)
+    lines = (' '.join(line.split()) for line in ''.join(parts).split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def parse_product_html(html, url, rank):
+    """상품 상세 페이지 HTML을 Selenium 백엔드와 같은 레코드 dict로 변환"""
+    tree = lxml_html.fromstring(html)
+    data = new_record(url, rank)
+
+    for key in PRODUCT_SELECTORS:
+        data[key] = ''
+        for selector in selector_chain(key):
+            found = tree.cssselect(selector)
+            if found:
+                data[key] = element_text(found[0]).strip()
+                break
+
+    return finalize_record(data)
+
+
+class HttpProductFetcher:
+    """브라우저 없이 keep-alive HTTP 연결로 상품 상세 페이지 HTML을 가져옴 (레코드 변환은 parse_product_html)
+
+    requests.Session은 스레드 간 공유가 보장되지 않으므로 워커 스레드마다
+    세션(연결 풀)을 하나씩 두고 재사용한다.
+    """
+
+    def __init__(self, pool_size=10, timeout=10, headers=None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(self.headers)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def fetch(self, url):
+        """페이지 HTML 가져오기 (HTTP 오류는 예외로 전달)"""
+        response = self._session().get(url, timeout=self.timeout)
+        response.raise_for_status()
+        # charset 헤더가 없으면 requests가 ISO-8859-1로 가정하므로 UTF-8로 디코딩
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = 'utf-8'
+        return response.text
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions = []
+
+
+class AsyncHttpProductFetcher:
+    """asyncio 크롤링 엔진용 HTTP fetcher (aiohttp 연결 풀 재사용)
+
+    async with 블록 안에서 사용한다.
+    """
+
+    def __init__(self, limit=10, timeout=10, headers=None):
+        self.limit = limit
+        self.timeout = timeout
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self.session = None
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.limit),
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.session = None
+
+    async def fetch(self, url):
+        """페이지 HTML 가져오기 (HTTP 오류는 예외로 전달)"""
+        async with self.session.get(url) as response:
+            response.raise_for_status()
+            return await response.text(encoding=response.charset or 'utf-8')
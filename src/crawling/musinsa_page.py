@@ -0,0 +1,107 @@
+"""무신사 상품 상세 페이지 구조 정의
+
+Selenium / HTTP 추출 백엔드가 같은 셀렉터와 같은 레코드 형식을 쓰도록 한 곳에 모아둔다.
+"""
+from datetime import datetime
+
+RANKING_URL_TEMPLATE = ('https://www.musinsa.com/main/musinsa/ranking?storeCode=musinsa'
+                        '&sectionId={section_id}&contentsId=&categoryCode={category_code}&gf={gf}')
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# 필드별 CSS 셀렉터
+PRODUCT_SELECTORS = {
+    '브랜드명': 'div.sc-12cqkwk-0.inPuAw > a > span > span.text-body_14px_med.font-pretendard',
+    '상품명': 'div.sc-1omefes-0.kInhhK',
+    '카테고리': 'div.sc-1prswe3-1.gUBQCf.text-body_13px_reg.text-gray-600.font-pretendard',
+    '현재가격': 'span.text-title_18px_semi.sc-1hw5bl8-7.kXhdZT.text-black.font-pretendard',
+    '원가': 'div.sc-1hw5bl8-0.jwTryS > div > div > span',
+    '할인율': 'span.text-title_18px_semi.sc-1hw5bl8-6.hROMjI.text-red.font-pretendard',
+    '평점': 'span.text-body_13px_med.pl-0\\.5.pr-1.text-black.font-pretendard',
+    '리뷰수': '#root > div.sc-3weaze-0.cBNetp > div.sc-1puoja0-0.hbDyXK > div > div.sc-hw7d9p-0.lecuxg.gtm-click-button > span.text-body_13px_reg.underline.text-gray-600.font-pretendard'
+}
+
+# 값이 없으면 상품 페이지를 제대로 읽지 못한 것으로 보는 필드
+REQUIRED_FIELDS = ('브랜드명', '상품명')
+
+# 기본 셀렉터로 찾지 못했을 때 순서대로 시도할 대체 셀렉터
+FALLBACK_SELECTORS = {
+    '브랜드명': ["a[href*='/brands/']"],
+    '상품명': ['h1'],
+}
+
+# 셀렉터 체인 전체를 브라우저 안에서 한 번에 평가하는 스크립트
+# arguments[0]: {필드명: [셀렉터, 대체 셀렉터, ...]} -> {필드명: innerText}
+BATCH_EXTRACT_SCRIPT = """
+const chains = arguments[0];
+const result = {};
+for (const [key, selectors] of Object.entries(chains)) {
+    result[key] = '';
+    for (const selector of selectors) {
+        let element = null;
+        try {
+            element = document.querySelector(selector);
+        } catch (e) {
+            continue;
+        }
+        if (element) {
+            result[key] = element.innerText || '';
+            break;
+        }
+    }
+}
+return result;
+"""
+
+
+def build_ranking_url(section_id='199', category_code='000', gf='A'):
+    """랭킹 페이지 URL (기본: 전체 카테고리, 전체 성별)"""
+    return RANKING_URL_TEMPLATE.format(section_id=section_id, category_code=category_code, gf=gf)
+
+
+def new_record(url, rank):
+    """상품 레코드 기본 필드 생성"""
+    return {
+        '순위': rank,
+        '상품URL': url,
+        '크롤링시간': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def selector_chain(key):
+    """필드의 기본 셀렉터 + 대체 셀렉터 목록"""
+    return [PRODUCT_SELECTORS[key]] + FALLBACK_SELECTORS.get(key, [])
+
+
+def selector_chains():
+    """모든 필드의 셀렉터 체인"""
+    return {key: selector_chain(key) for key in PRODUCT_SELECTORS}
+
+
+def finalize_record(data):
+    """추출 후 공통 후처리"""
+    # 원가가 없으면 현재가격과 동일하게 설정
+    if not data.get('원가'):
+        data['원가'] = data.get('현재가격', '')
+
+    # 리뷰수에서 괄호 제거
+    if data.get('리뷰수') and '(' in data['리뷰수']:
+        data['리뷰수'] = data['리뷰수'].strip('()')
+
+    return data
+
+
+class MissingFieldsError(Exception):
+    """페이지는 열렸지만 필수 필드를 찾지 못함 (셀렉터 불일치, 삭제된 상품 등)"""
+
+    def __init__(self, fields):
+        self.fields = fields
+        super().__init__(f"필수 필드 없음: {', '.join(fields)}")
+
+
+def check_record(data):
+    """필수 필드가 비어 있으면 MissingFieldsError"""
+    missing = [key for key in REQUIRED_FIELDS if not data.get(key)]
+    if missing:
+        raise MissingFieldsError(missing)
+    return data
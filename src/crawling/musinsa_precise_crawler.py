@@ -4,277 +4,417 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from datetime import datetime
+from selenium.common.exceptions import WebDriverException, TimeoutException
 import os
-from pathlib import Path
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import heapq
+import json
 import threading
+import argparse
+import asyncio
+from datetime import datetime
+from driver_pool import DriverPool
+from http_backend import HttpProductFetcher, AsyncHttpProductFetcher, parse_product_html
+from async_engine import AsyncCrawlEngine
+from wait_policy import ReadinessWait
+from network_profile import NetworkProfile
+from crawl_state import CrawlStateStore
+from ranking_capture import RankingCapture, listing_fields
+from result_sink import open_sink
+from crawl_metrics import CrawlMetrics
+from concurrency import AdaptiveConcurrency
+from failures import CrawlFailure, RetryPolicy
+from browser_service import BrowserServiceClient, build_chrome_options, CHROMEDRIVER_PATH
+from snapshot_store import SnapshotStore, TIME_FORMAT
+from musinsa_page import (PRODUCT_SELECTORS, BATCH_EXTRACT_SCRIPT, build_ranking_url,
+                          new_record, selector_chains, finalize_record, check_record, MissingFieldsError)
 
 class MusinsaPreciseCrawler:
-    def __init__(self):
+    BACKENDS = ('selenium', 'http')
+    
+    RANKING_MODES = ('network', 'dom')
+    
+    def __init__(self, backend='selenium', network_profile=None, state_store=None, ranking_mode='network',
+                 sink=None, retain_products=True, quiet=False, retry_policy=None, browser_service=None):
+        """
+        backend: 상품 상세 페이지 추출 방식 ('selenium' 또는 브라우저 없는 'http')
+        network_profile: 드라이버에 적용할 NetworkProfile (기본: 이미지/폰트/동영상/트래커 차단)
+        state_store: CrawlStateStore - 상품별 수집 결과를 체크포인트하고 ttl 안의 상품은 건너뜀
+        ranking_mode: 랭킹 수집 방식 ('network': JSON 응답 캡처, 'dom': 스크롤 후 링크 수집)
+        sink: 레코드가 완성되는 즉시 기록할 결과 sink (JsonLinesSink / ParquetSink)
+        retain_products: False면 self.products에 레코드를 쌓지 않음 (sink만 사용, 메모리 일정)
+        quiet: True면 상품 단위 출력 생략 (실패와 진행률, 요약만 출력)
+        retry_policy: 실패한 상품의 재시도 정책 (기본: RetryPolicy() - 최대 3회, 지수 백오프 + jitter)
+        browser_service: BrowserServiceClient - 크롬을 새로 띄우지 않고 브라우저 서비스의 warm 세션을 빌려 씀
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"지원하지 않는 backend: {backend} (가능: {', '.join(self.BACKENDS)})")
+        self.backend = backend
+        self.http_fetcher = HttpProductFetcher() if backend == 'http' else None
         self.driver = None
         self.wait = None
         self.products = []
         self.product_urls = []
+        self.ranking_mode = ranking_mode
+        self.listing_items = {}  # 상품URL -> 랭킹 JSON 응답의 상품 항목 (network 모드)
+        self.sink = sink
+        self.retain_products = retain_products
+        self.record_context = {}  # 모든 레코드에 덧붙일 필드 (예: 스케줄러의 카테고리 정보)
+        self.cancel = None  # threading.Event - set되면 남은 상품을 크롤링하지 않고 결과도 내보내지 않음
+        self.quiet = quiet
+        self.metrics = CrawlMetrics()  # 단계별 소요 시간, 필드 적중률, 실패 유형
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retries = 0
+        self.dead_letters = []  # 재시도하지 않거나 재시도를 모두 실패한 상품 (빈 레코드 대신 기록)
         self.lock = threading.Lock()  # 병렬 처리를 위한 lock
+        self.driver_pool = None  # 병렬 처리용 드라이버 풀
+        self.concurrency = None  # 적응형 동시 처리 개수 조절기 (crawl_urls(adaptive=True)일 때)
+        self.wait_policy = ReadinessWait()  # 고정 sleep 대신 페이지 준비 상태 대기
+        self.selector_chains = selector_chains()  # 일괄 추출 스크립트에 넘길 셀렉터 맵
+        self.network_profile = network_profile or NetworkProfile()
+        self.state_store = state_store  # 증분 크롤링용 CrawlStateStore (None이면 매번 전체 크롤링)
+        self.browser_service = browser_service
+        # 이번 실행의 스냅샷 ID (ttl 안이라 재사용한 레코드의 크롤링시간은 이전 실행 시각이므로 쓰지 않음)
+        self.started_at = datetime.now()
         
     def setup_driver(self):
         """크롬 드라이버 설정"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        driver_path = Path.home() / ".chromedriver" / "chromedriver"
-        service = Service(str(driver_path))
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = self.create_driver()
         self.wait = WebDriverWait(self.driver, 10)
         print("✓ 크롬 드라이버 설정 완료")
         
     def create_driver(self):
-        """병렬 처리용 드라이버 생성"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        driver_path = Path.home() / ".chromedriver" / "chromedriver"
-        service = Service(str(driver_path))
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        """병렬 처리용 드라이버 생성 (네트워크 차단 프로필 적용)
+        
+        브라우저 서비스를 사용하면 새로 띄우지 않고 미리 떠 있는 세션에 연결한다
+        (네트워크 차단 프로필은 서비스 쪽 설정을 따름).
+        """
+        if self.browser_service:
+            return self.browser_service.attach()
+        
+        service = Service(str(CHROMEDRIVER_PATH))
+        driver = webdriver.Chrome(service=service, options=build_chrome_options(self.network_profile))
+        self.network_profile.apply(driver)
         return driver
         
-    def collect_product_urls(self):
-        """랭킹 페이지에서 상품 URL 수집"""
+    def collect_product_urls(self, ranking_url=None, limit=100):
+        """랭킹 페이지에서 상품 URL 수집 (기본: 전체 카테고리 랭킹 상위 100개)
+        
+        ranking_mode가 'network'이면 페이지가 받아오는 JSON 응답에서 랭킹을 읽고,
+        찾지 못하면 DOM 스크롤 방식으로 대체한다.
+        """
         print("\n[Step 1] 무신사 랭킹 페이지에서 상품 URL 수집 중...")
         
-        ranking_url = 'https://www.musinsa.com/main/musinsa/ranking?storeCode=musinsa&sectionId=199&contentsId=&categoryCode=000&gf=A'
+        ranking_url = ranking_url or build_ranking_url()
+        if self.ranking_mode == 'network':
+            # 이전 페이지의 로그는 비우고 Network 도메인 활성화 (응답 본문 조회용)
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.network_profile.collect(self.driver)
+        
         self.driver.get(ranking_url)
-        time.sleep(3)
+        self.wait_policy.wait_for_ranking(self.driver)
+        
+        product_urls = []
+        if self.ranking_mode == 'network':
+            product_urls = self._collect_from_network(limit)
+            if not product_urls:
+                print("JSON 응답에서 랭킹을 찾지 못해 DOM 스크롤 방식으로 수집합니다.")
+        if not product_urls:
+            product_urls = self._collect_from_dom(limit)
+        
+        self.network_profile.collect(self.driver)
+        print(f"\n✓ 총 {len(product_urls)}개의 상품 URL 수집 완료!")
+        self.product_urls = product_urls[:limit]
+        return True
+    
+    def _collect_from_network(self, limit, max_scrolls=10):
+        """랭킹 페이지의 JSON 응답(performance 로그)에서 상품 URL과 목록 정보 수집"""
+        capture = RankingCapture()
+        height = self.driver.execute_script("return document.body.scrollHeight")
+        
+        for _ in range(max_scrolls):
+            capture.feed(self.driver, self.network_profile.collect(self.driver))
+            print(f"수집된 URL: {len(capture.items)}개 (JSON 응답 {capture.responses}개)", end='\r')
+            if len(capture.items) >= limit:
+                break
+            
+            # 다음 페이지 요청을 유도하기 위해 스크롤
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            new_height = self.wait_policy.wait_for_scroll(self.driver, height)
+            if new_height == height:
+                capture.feed(self.driver, self.network_profile.collect(self.driver))
+                break
+            height = new_height
         
+        items = capture.items[:limit]
+        self.listing_items = {url: item for url, item in items}
+        return [url for url, _ in items]
+    
+    def _collect_from_dom(self, limit):
+        """DOM을 스크롤하며 상품 링크 수집 (대체 방식)"""
         product_urls = []
         seen_urls = set()
         scroll_count = 0
+        height = self.driver.execute_script("return document.body.scrollHeight")
         
-        while len(product_urls) < 100 and scroll_count < 50:
-            # 현재 화면의 상품 링크 수집
-            elements = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/products/']")
+        while len(product_urls) < limit and scroll_count < 50:
+            # 현재 화면의 상품 링크 수집 (링크마다 get_attribute를 호출하지 않고 한 번에 조회)
+            hrefs = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll(\"a[href*='/products/']\"), a => a.href);")
             
-            for elem in elements:
-                href = elem.get_attribute('href')
+            for href in hrefs:
                 if href and '/products/' in href and href not in seen_urls:
                     seen_urls.add(href)
                     product_urls.append(href)
                     
-                    if len(product_urls) >= 100:
+                    if len(product_urls) >= limit:
                         break
             
             print(f"수집된 URL: {len(product_urls)}개", end='\r')
+            if len(product_urls) >= limit:
+                break
             
-            # 스크롤
+            # 스크롤 후 새 컨텐츠가 로드될 때까지(페이지 높이 변경) 대기
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(random.uniform(1.5, 2.5))
+            new_height = self.wait_policy.wait_for_scroll(self.driver, height)
             scroll_count += 1
             
             # 더 이상 새로운 컨텐츠가 없으면 종료
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if scroll_count > 2 and len(product_urls) == len(seen_urls):
+            if new_height == height:
                 break
+            height = new_height
         
-        print(f"\n✓ 총 {len(product_urls)}개의 상품 URL 수집 완료!")
-        self.product_urls = product_urls[:100]
-        return True
+        return product_urls
     
-    def extract_product_data_parallel(self, url_rank_tuple):
-        """병렬 처리용 상품 데이터 추출 메서드"""
-        url, rank = url_rank_tuple
-        driver = self.create_driver()
+    def _read_fields(self, driver):
+        """현재 페이지에서 셀렉터 맵의 모든 필드 추출 (Selenium)
+        
+        필드마다 find_element를 호출하지 않고, 대체 셀렉터까지 포함한 전체 셀렉터 맵을
+        브라우저 안에서 한 번에 평가한다 (WebDriver 왕복 1회).
+        """
+        fields = driver.execute_script(BATCH_EXTRACT_SCRIPT, self.selector_chains) or {}
+        return {key: (fields.get(key) or '').strip() for key in PRODUCT_SELECTORS}
+    
+    def _fetch_with_driver(self, driver, url, rank):
+        """드라이버로 페이지를 열고 상품 레코드 생성"""
+        with self.metrics.time('navigate'):
+            driver.get(url)
+        with self.metrics.time('wait'):
+            ready = self.wait_policy.wait_for_product(driver)
         
+        data = new_record(url, rank)
+        with self.metrics.time('extract'):
+            data.update(self._read_fields(driver))
+        self.network_profile.collect(driver)
         try:
-            print(f"\n[{rank}위] 크롤링 시작...")
-            driver.get(url)
-            time.sleep(random.uniform(2.0, 3.0))
-            
-            data = {
-                '순위': rank,
-                '상품URL': url,
-                '크롤링시간': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # CSS 셀렉터를 사용한 데이터 추출
-            selectors = {
-                '브랜드명': 'div.sc-12cqkwk-0.inPuAw > a > span > span.text-body_14px_med.font-pretendard',
-                '상품명': 'div.sc-1omefes-0.kInhhK',
-                '카테고리': 'div.sc-1prswe3-1.gUBQCf.text-body_13px_reg.text-gray-600.font-pretendard',
-                '현재가격': 'span.text-title_18px_semi.sc-1hw5bl8-7.kXhdZT.text-black.font-pretendard',
-                '원가': 'div.sc-1hw5bl8-0.jwTryS > div > div > span',
-                '할인율': 'span.text-title_18px_semi.sc-1hw5bl8-6.hROMjI.text-red.font-pretendard',
-                '평점': 'span.text-body_13px_med.pl-0\\.5.pr-1.text-black.font-pretendard',
-                '리뷰수': '#root > div.sc-3weaze-0.cBNetp > div.sc-1puoja0-0.hbDyXK > div > div.sc-hw7d9p-0.lecuxg.gtm-click-button > span.text-body_13px_reg.underline.text-gray-600.font-pretendard'
-            }
-            
-            # 각 요소 추출
-            for key, selector in selectors.items():
-                try:
-                    element = driver.find_element(By.CSS_SELECTOR, selector)
-                    data[key] = element.text.strip()
-                except:
-                    # 대체 셀렉터 시도
-                    if key == '브랜드명':
-                        try:
-                            element = driver.find_element(By.CSS_SELECTOR, "a[href*='/brands/']")
-                            data[key] = element.text.strip()
-                        except:
-                            data[key] = ''
-                    elif key == '상품명':
-                        try:
-                            element = driver.find_element(By.TAG_NAME, "h1")
-                            data[key] = element.text.strip()
-                        except:
-                            data[key] = ''
-                    elif key == '원가':
-                        data[key] = data.get('현재가격', '')
-                    else:
-                        data[key] = ''
-            
-            # 리뷰수에서 괄호 제거
-            if data['리뷰수'] and '(' in data['리뷰수']:
-                data['리뷰수'] = data['리뷰수'].strip('()')
-            
-            # 디버깅용 출력
-            print(f"\n[{rank}위] 크롤링 데이터:")
-            print(f"  브랜드명: {data['브랜드명']}")
-            print(f"  상품명: {data['상품명'][:50]}..." if len(data['상품명']) > 50 else f"  상품명: {data['상품명']}")
-            print(f"  카테고리: {data['카테고리']}")
-            print(f"  현재가격: {data['현재가격']}")
-            print(f"  원가: {data['원가']}")
-            print(f"  할인율: {data['할인율']}")
-            print(f"  평점: {data['평점']}")
-            print(f"  리뷰수: {data['리뷰수']}")
-            
+            return check_record(finalize_record(data))
+        except MissingFieldsError:
+            # 준비되지 않은 페이지에서 필드를 못 찾은 것은 셀렉터 문제가 아니라 시간 초과
+            if not ready:
+                raise TimeoutException("상품 페이지 준비 시간 초과")
+            raise
+    
+    def _fetch_with_http(self, url, rank):
+        """HTTP로 페이지를 가져와 상품 레코드 생성"""
+        with self.metrics.time('navigate'):
+            html = self.http_fetcher.fetch(url)
+        with self.metrics.time('extract'):
+            return check_record(parse_product_html(html, url, rank))
+    
+    def _log(self, message):
+        """상품 단위 진행 로그 (quiet 모드에서는 출력하지 않음)"""
+        if not self.quiet:
+            print(message)
+    
+    def _print_run_stats(self):
+        """페이지 대기/네트워크/단계별 통계 출력"""
+        print(self.wait_policy.summary())
+        print(self.network_profile.summary())
+        print(self.metrics.summary())
+        if self.retries or self.dead_letters:
+            print(f"재시도: {self.retries}회, 최종 실패(dead letter): {len(self.dead_letters)}개")
+    
+    def _print_product(self, rank, data):
+        """디버깅용 출력"""
+        if self.quiet:
+            return
+        print(f"\n[{rank}위] 크롤링 데이터:")
+        print(f"  브랜드명: {data['브랜드명']}")
+        print(f"  상품명: {data['상품명'][:50]}..." if len(data['상품명']) > 50 else f"  상품명: {data['상품명']}")
+        print(f"  카테고리: {data['카테고리']}")
+        print(f"  현재가격: {data['현재가격']}")
+        print(f"  원가: {data['원가']}")
+        print(f"  할인율: {data['할인율']}")
+        print(f"  평점: {data['평점']}")
+        print(f"  리뷰수: {data['리뷰수']}")
+    
+    def _emit(self, data):
+        """완성된 레코드 하나를 결과로 내보냄 (sink에 즉시 기록 + 메모리 보관)
+        
+        sink 기록이 실패하면 메모리에도 남기지 않는다.
+        """
+        if self.record_context:
+            data.update(self.record_context)
+        if self.sink:
+            with self.metrics.time('sink'):
+                self.sink.write(data)
+        if self.retain_products:
             with self.lock:
                 self.products.append(data)
-                print(f"[{rank}위] ✓ 수집 완료")
-            
-            return True
-            
-        except Exception as e:
-            print(f"[{rank}위] ✗ 크롤링 실패: {e}")
+    
+    @property
+    def cancelled(self):
+        """cancel 이벤트가 set되었는지 (예: 스케줄러 워커가 shard lease를 잃음)"""
+        return self.cancel is not None and self.cancel.is_set()
+    
+    def _store_result(self, data):
+        """수집 결과 저장 + 상태 저장소에 즉시 체크포인트 (취소된 뒤에는 버림)"""
+        if self.cancelled:
+            return
+        self.metrics.record_fields(data, PRODUCT_SELECTORS)
+        self._emit(data)
+        if self.state_store:
+            self.state_store.checkpoint(data, success=True)
+    
+    def _on_failure(self, url, rank, exc, attempt):
+        """실패를 분류해서 재시도 대기 시간을 정하거나 dead letter로 기록
+        
+        빈 레코드를 결과에 넣지 않으므로 실패한 상품이 평균 가격/할인율 등을 왜곡하지 않는다.
+        """
+        failure = CrawlFailure(url, rank, exc, attempt)
+        self.metrics.record_failure(failure.kind)
+        if self.retry_policy.should_retry(failure):
+            failure.retry_in = self.retry_policy.delay(failure)
             with self.lock:
-                self.products.append({
-                    '순위': rank,
-                    '상품URL': url,
-                    '크롤링시간': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    '브랜드명': '',
-                    '상품명': '',
-                    '카테고리': '',
-                    '현재가격': '',
-                    '원가': '',
-                    '할인율': '0%',
-                    '평점': '0',
-                    '리뷰수': '0'
-                })
-            return False
-            
-        finally:
-            driver.quit()
+                self.retries += 1
+            print(f"[{rank}위] ✗ {failure.kind}: {exc} - {failure.retry_in:.1f}초 후 재시도 "
+                  f"({attempt}/{self.retry_policy.max_attempts})")
+        else:
+            print(f"[{rank}위] ✗ 크롤링 실패 ({failure.kind}, {attempt}회 시도): {exc}")
+            with self.lock:
+                self.dead_letters.append(failure.to_record())
+            if self.state_store:
+                self.state_store.checkpoint(new_record(url, rank), success=False)
+        return failure
     
-    def extract_product_data(self, url, rank):
-        """제공된 CSS 셀렉터를 사용하여 상품 데이터 추출 (단일 드라이버)"""
+    def _on_store_failure(self, url, rank, exc, attempt):
+        """결과 저장(sink, 상태 저장소) 실패 - 페이지는 이미 수집했으므로 재시도하지 않고 dead letter로 기록"""
+        failure = CrawlFailure(url, rank, exc, attempt)
+        self.metrics.record_failure(failure.kind)
+        print(f"[{rank}위] ✗ 결과 저장 실패: {exc}")
+        with self.lock:
+            self.dead_letters.append(failure.to_record())
+        return failure
+    
+    def _skip_fresh(self, url_rank_tuples):
+        """ttl 안에 수집된 상품은 저장된 레코드를 재사용하고, 크롤링할 (url, rank)만 반환"""
+        if not self.state_store:
+            return url_rank_tuples
+        
+        fresh = self.state_store.fresh_records([url for url, _ in url_rank_tuples])
+        pending = []
+        for url, rank in url_rank_tuples:
+            if url in fresh:
+                record = fresh[url]
+                record['순위'] = rank  # 순위는 이번 랭킹 기준
+                self._emit(record)
+            else:
+                pending.append((url, rank))
+        
+        if fresh:
+            print(f"최근 {self.state_store.ttl}초 안에 수집된 {len(fresh)}개 상품은 건너뜀 (크롤링 대상: {len(pending)}개)")
+        return pending
+    
+    def _attempt_parallel(self, url, rank, attempt=1):
+        """병렬 처리용 상품 데이터 추출 1회 시도 - 성공하면 None, 실패하면 CrawlFailure
+        
+        재시도는 페이지 열기/추출 실패만 한다. 결과 저장(sink, 상태 저장소) 오류는 같은 레코드를
+        두 번 내보내지 않도록 재시도하지 않는다 (_on_store_failure).
+        """
+        start = time.perf_counter()
+        
         try:
-            print(f"\n[{rank}위] 크롤링 중: {url}")
-            self.driver.get(url)
-            time.sleep(random.uniform(2.0, 3.0))
-            
-            data = {
-                '순위': rank,
-                '상품URL': url,
-                '크롤링시간': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
-            # CSS 셀렉터를 사용한 데이터 추출
-            selectors = {
-                '브랜드명': 'div.sc-12cqkwk-0.inPuAw > a > span > span.text-body_14px_med.font-pretendard',
-                '상품명': 'div.sc-1omefes-0.kInhhK',
-                '카테고리': 'div.sc-1prswe3-1.gUBQCf.text-body_13px_reg.text-gray-600.font-pretendard',
-                '현재가격': 'span.text-title_18px_semi.sc-1hw5bl8-7.kXhdZT.text-black.font-pretendard',
-                '원가': 'div.sc-1hw5bl8-0.jwTryS > div > div > span',
-                '할인율': 'span.text-title_18px_semi.sc-1hw5bl8-6.hROMjI.text-red.font-pretendard',
-                '평점': 'span.text-body_13px_med.pl-0\\.5.pr-1.text-black.font-pretendard',
-                '리뷰수': '#root > div.sc-3weaze-0.cBNetp > div.sc-1puoja0-0.hbDyXK > div > div.sc-hw7d9p-0.lecuxg.gtm-click-button > span.text-body_13px_reg.underline.text-gray-600.font-pretendard'
-            }
-            
-            # 각 요소 추출
-            for key, selector in selectors.items():
-                try:
-                    element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    data[key] = element.text.strip()
-                except:
-                    # 대체 셀렉터 시도
-                    if key == '브랜드명':
-                        try:
-                            # 더 간단한 셀렉터로 시도
-                            element = self.driver.find_element(By.CSS_SELECTOR, "a[href*='/brands/']")
-                            data[key] = element.text.strip()
-                        except:
-                            data[key] = ''
-                    elif key == '상품명':
-                        try:
-                            element = self.driver.find_element(By.TAG_NAME, "h1")
-                            data[key] = element.text.strip()
-                        except:
-                            data[key] = ''
-                    elif key == '원가':
-                        # 원가가 없으면 현재가격과 동일하게 설정
-                        data[key] = data.get('현재가격', '')
-                    else:
-                        data[key] = ''
-            
-            # 리뷰수에서 괄호 제거
-            if data['리뷰수'] and '(' in data['리뷰수']:
-                data['리뷰수'] = data['리뷰수'].strip('()')
-            
-            # 디버깅용 출력
-            print(f"\n[{rank}위] 크롤링 데이터:")
-            print(f"  브랜드명: {data['브랜드명']}")
-            print(f"  상품명: {data['상품명'][:50]}..." if len(data['상품명']) > 50 else f"  상품명: {data['상품명']}")
-            print(f"  카테고리: {data['카테고리']}")
-            print(f"  현재가격: {data['현재가격']}")
-            print(f"  원가: {data['원가']}")
-            print(f"  할인율: {data['할인율']}")
-            print(f"  평점: {data['평점']}")
-            print(f"  리뷰수: {data['리뷰수']}")
-            print(f"  ✓ 수집 완료")
-            
-            return data
+            self._log(f"\n[{rank}위] 크롤링 시작...")
+            if self.backend == 'http':
+                data = self._fetch_with_http(url, rank)
+            else:
+                # 오류가 난 드라이버는 풀에 돌려놓지 않고 폐기 (재시도는 새 드라이버로)
+                # 필수 필드가 없는 페이지는 드라이버 문제가 아니므로 그대로 반납
+                with self.driver_pool.driver(keep_on=MissingFieldsError) as driver:
+                    self.metrics.observe('acquire', time.perf_counter() - start)
+                    data = self._fetch_with_driver(driver, url, rank)
             
         except Exception as e:
-            print(f"  ✗ 크롤링 실패: {e}")
-            return {
-                '순위': rank,
-                '상품URL': url,
-                '크롤링시간': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                '브랜드명': '',
-                '상품명': '',
-                '카테고리': '',
-                '현재가격': '',
-                '원가': '',
-                '할인율': '0%',
-                '평점': '0',
-                '리뷰수': '0'
-            }
+            failure = self._on_failure(url, rank, e, attempt)
+            if self.concurrency:
+                self.concurrency.observe(time.perf_counter() - start, False)
+            return failure
+        
+        self._print_product(rank, data)
+        try:
+            self._store_result(data)
+        except Exception as e:
+            return self._on_store_failure(url, rank, e, attempt)
+        self._log(f"[{rank}위] ✓ 수집 완료")
+        
+        if self.concurrency:
+            # 가격이 비어 있으면 덜 그려진 페이지일 가능성이 높음
+            self.concurrency.observe(time.perf_counter() - start, True, blank=not data['현재가격'])
+        return None
+    
+    def extract_product_data_parallel(self, url_rank_tuple):
+        """병렬 처리용 상품 데이터 추출 메서드 (재시도 포함, 대기 중에는 스레드를 점유)"""
+        url, rank = url_rank_tuple
+        attempt = 1
+        while True:
+            failure = self._attempt_parallel(url, rank, attempt)
+            if failure is None:
+                return True
+            if failure.retry_in is None:
+                return False
+            time.sleep(failure.retry_in)
+            attempt += 1
+    
+    def _restart_driver(self):
+        """단일 드라이버 재시작 (순차 크롤링의 재시도용)"""
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.setup_driver()
+    
+    def extract_product_data(self, url, rank):
+        """제공된 CSS 셀렉터를 사용하여 상품 데이터 추출 (단일 드라이버)
+        
+        재시도할 수 있는 실패는 백오프 후 새 드라이버로 다시 시도하고, 최종 실패하면 None 반환.
+        """
+        attempt = 1
+        while True:
+            try:
+                self._log(f"\n[{rank}위] 크롤링 중: {url}")
+                if self.backend == 'http':
+                    data = self._fetch_with_http(url, rank)
+                else:
+                    data = self._fetch_with_driver(self.driver, url, rank)
+                
+                self._print_product(rank, data)
+                self._log(f"  ✓ 수집 완료")
+                
+                self.metrics.record_fields(data, PRODUCT_SELECTORS)
+                if self.state_store:
+                    self.state_store.checkpoint(data, success=True)
+                return data
+                
+            except Exception as e:
+                failure = self._on_failure(url, rank, e, attempt)
+                if failure.retry_in is None:
+                    return None
+                time.sleep(failure.retry_in)
+                if self.backend == 'selenium':
+                    self._restart_driver()
+                attempt += 1
     
     def crawl_all_products(self):
         """전체 크롤링 프로세스"""
@@ -289,22 +429,77 @@ class MusinsaPreciseCrawler:
         # 각 상품 크롤링
         print(f"\n[Step 2] {len(self.product_urls)}개 상품 상세 정보 크롤링 시작...")
         
-        for rank, url in enumerate(self.product_urls, 1):
+        url_rank_tuples = self._skip_fresh([(url, rank) for rank, url in enumerate(self.product_urls, 1)])
+        
+        for i, (url, rank) in enumerate(url_rank_tuples, 1):
             product_data = self.extract_product_data(url, rank)
-            self.products.append(product_data)
+            if product_data:
+                self._emit(product_data)
             
             # 진행률 표시
-            if rank % 10 == 0:
-                print(f"\n진행률: {rank}/{len(self.product_urls)} ({rank/len(self.product_urls)*100:.0f}%)")
+            if i % 10 == 0:
+                print(f"\n진행률: {i}/{len(url_rank_tuples)} ({i/len(url_rank_tuples)*100:.0f}%)")
             
             # 봇 탐지 회피를 위한 랜덤 대기
             time.sleep(random.uniform(0.5, 1.5))
         
+        self.products.sort(key=lambda x: x['순위'])
+        print(f"\n✓ 크롤링 완료! 총 {len(self.products)}개 상품")
+        self._print_run_stats()
+        return True
+    
+    def crawl_listing(self, max_workers=10, detail_ttl=86400, adaptive=False, min_workers=1):
+        """랭킹 목록 정보 위주의 빠른 크롤링
+        
+        목록(JSON 응답)에 있는 필드는 한 번에 채우고, 목록에 없는 필드(평점, 리뷰수 등)는
+        detail_ttl 안에 수집한 상세 페이지 레코드에서 가져온다. 둘 다 없는 상품만 상세 페이지를 방문한다.
+        """
+        print("="*60)
+        print("무신사 랭킹 TOP 100 크롤링 (목록 우선)")
+        print("="*60)
+        
+        if not self.collect_product_urls():
+            return False
+        
+        cached = self.state_store.fresh_records(self.product_urls, ttl=detail_ttl) if self.state_store else {}
+        need_detail = []
+        from_cache = 0
+        completed = 0
+        
+        for rank, url in enumerate(self.product_urls, 1):
+            record = new_record(url, rank)
+            record.update(listing_fields(self.listing_items.get(url, {})))
+            missing = [key for key in PRODUCT_SELECTORS if record[key] is None]
+            
+            if missing and url in cached:
+                for key in missing:
+                    record[key] = cached[url].get(key, '')
+                missing = []
+                from_cache += 1
+            
+            if missing:
+                need_detail.append((url, rank))
+            else:
+                self._emit(finalize_record(record))
+                completed += 1
+        
+        print(f"목록 정보로 완성: {completed}개 (상세 정보 재사용 {from_cache}개), "
+              f"상세 페이지 방문 필요: {len(need_detail)}개")
+        
+        if need_detail:
+            return self.crawl_urls(need_detail, max_workers, adaptive=adaptive, min_workers=min_workers)
+        
+        self.products.sort(key=lambda x: x['순위'])
         print(f"\n✓ 크롤링 완료! 총 {len(self.products)}개 상품")
+        self._print_run_stats()
         return True
     
-    def crawl_all_products_parallel(self, max_workers=10):
-        """병렬 처리를 사용한 전체 크롤링 프로세스"""
+    def crawl_all_products_parallel(self, max_workers=10, max_pages_per_driver=50, adaptive=False, min_workers=1):
+        """병렬 처리를 사용한 전체 크롤링 프로세스
+
+        max_pages_per_driver: 드라이버 하나가 처리할 최대 페이지 수 (초과 시 재시작)
+        adaptive: True면 max_workers를 상한으로 동시 처리 개수를 실행 중에 자동 조절 (AIMD)
+        """
         print("="*60)
         print("무신사 랭킹 TOP 100 정밀 크롤링 (병렬 처리)")
         print("="*60)
@@ -313,51 +508,214 @@ class MusinsaPreciseCrawler:
         if not self.collect_product_urls():
             return False
         
-        # 병렬 크롤링
-        print(f"\n[Step 2] {len(self.product_urls)}개 상품 상세 정보 크롤링 시작...")
-        print(f"동시 처리 개수: {max_workers}개")
-        
         url_rank_tuples = [(url, rank) for rank, url in enumerate(self.product_urls, 1)]
+        return self.crawl_urls(url_rank_tuples, max_workers, max_pages_per_driver, adaptive, min_workers)
+    
+    def crawl_urls(self, url_rank_tuples, max_workers=10, max_pages_per_driver=50, adaptive=False, min_workers=1):
+        """주어진 (url, rank) 목록의 상품 상세 정보를 병렬 크롤링"""
+        # 병렬 크롤링
+        print(f"\n[Step 2] {len(url_rank_tuples)}개 상품 상세 정보 크롤링 시작...")
+        if adaptive:
+            self.concurrency = AdaptiveConcurrency(max_workers, min_workers=min_workers,
+                                                   on_change=self._on_concurrency_change)
+            print(f"동시 처리 개수: {self.concurrency.limit}개에서 시작, {min_workers}~{max_workers}개 범위에서 자동 조절 "
+                  f"(추출 방식: {self.backend})")
+        else:
+            self.concurrency = None
+            print(f"동시 처리 개수: {max_workers}개 (추출 방식: {self.backend})")
+        
+        url_rank_tuples = self._skip_fresh(url_rank_tuples)
         
         start_time = time.time()
+        
+        # 워커 수만큼 드라이버를 재사용 (상품마다 크롬을 새로 띄우지 않음)
+        if self.backend == 'selenium' and self.driver_pool is None:
+            self.driver_pool = DriverPool(self.create_driver, size=max_workers,
+                                          max_pages_per_driver=max_pages_per_driver)
+        
+        self._run_parallel(url_rank_tuples, max_workers, start_time)
+        
+        # 순위별로 정렬
+        self.products.sort(key=lambda x: x['순위'])
+        
+        elapsed_time = time.time() - start_time
+        print(f"\n✓ 크롤링 완료! 총 {len(self.products)}개 상품")
+        print(f"성공: {self.completed_count}개, 실패: {self.failed_count}개")
+        if self.driver_pool:
+            print(f"드라이버 생성: {self.driver_pool.created}개, 재시작: {self.driver_pool.recycled}회")
+        if self.concurrency:
+            print(self.concurrency.summary())
+        self._print_run_stats()
+        print(f"병렬 처리 소요 시간: {elapsed_time:.1f}초 ({elapsed_time/60:.1f}분)")
+        
+        return True
+    
+    def _on_concurrency_change(self, old, new, reason):
+        """동시 처리 개수가 바뀔 때 호출 - 줄어든 만큼 대기 중인 드라이버를 종료해 메모리 회수"""
+        if reason:
+            print(f"\n동시 처리 개수 감소: {old} -> {new}개 ({reason})")
+            if self.driver_pool:
+                self.driver_pool.shrink(new)
+        else:
+            self._log(f"\n동시 처리 개수 증가: {old} -> {new}개")
+    
+    def _attempt_with_limit(self, url, rank, attempt=1):
+        """적응형 동시 처리 한도 안에서 상품 데이터 추출 1회 시도"""
+        with self.concurrency.slot():
+            return self._attempt_parallel(url, rank, attempt)
+    
+    def _run_parallel(self, url_rank_tuples, max_workers, start_time):
+        """스레드 풀로 상품 상세 페이지 크롤링
+        
+        재시도할 실패는 백오프 시간이 지난 뒤 다시 제출하므로, 대기 중인 상품이 스레드를 점유하지 않는다.
+        """
         completed = 0
         failed = 0
+        total = len(url_rank_tuples)
+        # 적응형 모드에서는 스레드는 상한만큼 두고 실제 동시 처리 개수는 조절기가 제한
+        attempt = self._attempt_with_limit if self.concurrency else self._attempt_parallel
+        retry_queue = []  # (재시도 시각, 순위, url, 시도 횟수) 힙
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # 작업 제출
-            future_to_rank = {executor.submit(self.extract_product_data_parallel, url_rank): url_rank[1] 
-                             for url_rank in url_rank_tuples}
+            running = {executor.submit(attempt, url, rank, 1): (url, rank, 1)
+                       for url, rank in url_rank_tuples}
             
-            # 결과 수집
-            for future in as_completed(future_to_rank):
-                rank = future_to_rank[future]
-                try:
-                    success = future.result()
-                    if success:
-                        completed += 1
-                    else:
-                        failed += 1
-                except Exception as exc:
-                    print(f'[{rank}위] 예외 발생: {exc}')
-                    failed += 1
+            while running or retry_queue:
+                if self.cancelled:
+                    # 아직 시작하지 않은 작업과 재시도는 버림 (실행 중인 작업의 결과는 _store_result에서 버림)
+                    for future in running:
+                        future.cancel()
+                    print(f"\n✗ 크롤링 중단: 남은 {len(running) + len(retry_queue)}개 상품은 처리하지 않음")
+                    break
+                
+                # 대기 시간이 지난 재시도 작업 제출
+                now = time.time()
+                while retry_queue and retry_queue[0][0] <= now:
+                    _, rank, url, attempts = heapq.heappop(retry_queue)
+                    running[executor.submit(attempt, url, rank, attempts)] = (url, rank, attempts)
+                
+                timeout = max(0, retry_queue[0][0] - now) if retry_queue else None
+                if not running:
+                    time.sleep(timeout)
+                    continue
                 
-                # 진행 상황 표시
-                total_processed = completed + failed
-                if total_processed % 10 == 0:
-                    elapsed = time.time() - start_time
-                    rate = total_processed / elapsed
-                    eta = (len(self.product_urls) - total_processed) / rate
-                    print(f"\n진행률: {total_processed}/{len(self.product_urls)} ({total_processed/len(self.product_urls)*100:.0f}%)")
-                    print(f"처리 속도: {rate:.1f}개/초, 예상 남은 시간: {eta:.0f}초")
-                    print(f"성공: {completed}개, 실패: {failed}개")
+                # 결과 수집
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, rank, attempts = running.pop(future)
+                    try:
+                        failure = future.result()
+                    except Exception as exc:
+                        print(f'[{rank}위] 예외 발생: {exc}')
+                        failure = None
+                        failed += 1
+                    else:
+                        if failure is None:
+                            completed += 1
+                        elif failure.retry_in is not None:
+                            heapq.heappush(retry_queue, (time.time() + failure.retry_in, rank, url, attempts + 1))
+                            continue
+                        else:
+                            failed += 1
+                    
+                    # 진행 상황 표시
+                    total_processed = completed + failed
+                    if total_processed % 10 == 0:
+                        elapsed = time.time() - start_time
+                        rate = total_processed / elapsed
+                        eta = (total - total_processed) / rate
+                        print(f"\n진행률: {total_processed}/{total} ({total_processed/total*100:.0f}%)")
+                        print(f"처리 속도: {rate:.1f}개/초, 예상 남은 시간: {eta:.0f}초")
+                        print(f"성공: {completed}개, 실패: {failed}개")
+        
+        self.completed_count = completed
+        self.failed_count = failed
+    
+    async def _attempt_async(self, fetcher, url, rank, attempt=1):
+        """asyncio 엔진용 HTTP 상품 데이터 추출 1회 시도 - 성공하면 None, 실패하면 CrawlFailure
+        
+        재시도와 백오프는 AsyncCrawlEngine이 맡는다 (시도마다 토큰을 얻고, 대기 중에는 세마포어를 놓음).
+        """
+        try:
+            with self.metrics.time('navigate'):
+                html = await fetcher.fetch(url)
+            with self.metrics.time('extract'):
+                data = check_record(parse_product_html(html, url, rank))
+        except Exception as e:
+            return self._on_failure(url, rank, e, attempt)
+        
+        self._print_product(rank, data)
+        try:
+            self._store_result(data)
+        except Exception as e:
+            return self._on_store_failure(url, rank, e, attempt)
+        self._log(f"[{rank}위] ✓ 수집 완료")
+        return None
+    
+    def crawl_all_products_async(self, rate=2.0, burst=5, per_host_limit=10, max_pages_per_driver=50):
+        """asyncio 엔진을 사용한 전체 크롤링 프로세스
+        
+        랜덤 대기 대신 토큰 버킷으로 요청 속도를 제한한다.
+        rate: 초당 요청 수, burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수,
+        per_host_limit: 호스트별 동시 요청 수
+        """
+        print("="*60)
+        print("무신사 랭킹 TOP 100 정밀 크롤링 (asyncio)")
+        print("="*60)
+        
+        # URL 수집
+        if not self.collect_product_urls():
+            return False
+        
+        print(f"\n[Step 2] {len(self.product_urls)}개 상품 상세 정보 크롤링 시작...")
+        print(f"요청 속도: 초당 {rate}개 (burst {burst}), 호스트별 동시 처리: {per_host_limit}개 (추출 방식: {self.backend})")
+        
+        url_rank_tuples = self._skip_fresh([(url, rank) for rank, url in enumerate(self.product_urls, 1)])
+        results = []
+        
+        def on_done(url, rank, success):
+            results.append(success)
+            if len(results) % 10 == 0:
+                print(f"\n진행률: {len(results)}/{len(url_rank_tuples)} ({len(results)/len(url_rank_tuples)*100:.0f}%)")
+        
+        if self.backend == 'http':
+            async def run():
+                async with AsyncHttpProductFetcher(limit=per_host_limit) as fetcher:
+                    engine = AsyncCrawlEngine(
+                        lambda url, rank, attempt: self._attempt_async(fetcher, url, rank, attempt),
+                        rate=rate, burst=burst, per_host_limit=per_host_limit, on_done=on_done)
+                    await engine.run(url_rank_tuples)
+                    return engine
+        else:
+            # Selenium 호출은 블로킹이므로 드라이버 풀 크기만큼의 스레드에서 실행
+            self.driver_pool = DriverPool(self.create_driver, size=per_host_limit,
+                                          max_pages_per_driver=max_pages_per_driver)
+            
+            async def run():
+                engine = AsyncCrawlEngine(
+                    lambda url, rank, attempt: asyncio.to_thread(self._attempt_parallel, url, rank, attempt),
+                    rate=rate, burst=burst, per_host_limit=per_host_limit, on_done=on_done)
+                await engine.run(url_rank_tuples)
+                return engine
+        
+        start_time = time.time()
+        try:
+            engine = asyncio.run(run())
+        finally:
+            if self.driver_pool:
+                self.driver_pool.close()
+                self.driver_pool = None
         
-        # 순위별로 정렬
         self.products.sort(key=lambda x: x['순위'])
         
         elapsed_time = time.time() - start_time
+        completed = sum(1 for success in results if success)
         print(f"\n✓ 크롤링 완료! 총 {len(self.products)}개 상품")
-        print(f"성공: {completed}개, 실패: {failed}개")
-        print(f"병렬 처리 소요 시간: {elapsed_time:.1f}초 ({elapsed_time/60:.1f}분)")
+        print(f"성공: {completed}개, 실패: {len(results) - completed}개")
+        print(f"처리 속도: {len(results)/elapsed_time:.2f}개/초 (속도 제한 대기: {engine.bucket.waited:.1f}초)")
+        self._print_run_stats()
+        print(f"소요 시간: {elapsed_time:.1f}초 ({elapsed_time/60:.1f}분)")
         
         return True
     
@@ -383,8 +741,8 @@ class MusinsaPreciseCrawler:
         df.to_excel(filepath, index=False, engine='openpyxl')
         print(f"\n✓ Excel 파일 저장: {filepath}")
         
-        # pickle 파일로도 저장
-        df.to_pickle('data/musinsa_ranking_precise.pkl')
+        # pickle 파일로도 저장 (엑셀과 같은 이름)
+        df.to_pickle(os.path.splitext(filepath)[0] + '.pkl')
         print("✓ Pickle 파일도 저장되었습니다.")
         
         # 기본 통계 출력
@@ -407,31 +765,144 @@ class MusinsaPreciseCrawler:
         
         return df
     
+    def save_snapshot(self, path='data/snapshots.sqlite', snapshot_id=None):
+        """이번 결과를 이력 스냅샷으로 추가하고 직전 스냅샷 대비 변화 요약 출력
+
+        snapshot_id 기본값은 크롤러를 만든 시각(실행 시작 시각).
+        """
+        snapshot_id = snapshot_id or self.started_at.strftime(TIME_FORMAT)
+        store = SnapshotStore(path)
+        try:
+            if store.ingest(self.products, snapshot_id=snapshot_id) is None:
+                return None
+            counts = store.delta_counts(snapshot_id)
+            print(f"\n✓ 스냅샷 저장: {snapshot_id} ({path})")
+            print(f"직전 스냅샷 대비 - 상승: {counts.get('up', 0)}개, 하락: {counts.get('down', 0)}개, "
+                  f"유지: {counts.get('same', 0)}개, 신규 진입: {counts.get('new', 0)}개, 이탈: {counts.get('dropped', 0)}개")
+            return snapshot_id
+        finally:
+            store.close()
+    
+    def save_dead_letters(self, path):
+        """최종 실패한 상품 목록을 JSON Lines로 저장 (다음 실행에서 원인 확인/재수집용)"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            for record in self.dead_letters:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        print(f"✗ 최종 실패 {len(self.dead_letters)}개 상품 기록: {path}")
+    
     def close(self):
         """드라이버 종료"""
+        if self.sink:
+            self.sink.close()
+            print(f"\n✓ 결과 {self.sink.written}개 기록: {self.sink.path}")
+        if self.driver_pool:
+            self.driver_pool.close()
+            self.driver_pool = None
+        if self.http_fetcher:
+            self.http_fetcher.close()
+        if self.state_store:
+            if self.state_store.changed:
+                print(f"\n이전 수집 대비 내용이 바뀐 상품: {self.state_store.changed}개")
+            self.state_store.close()
         if self.driver:
             self.driver.quit()
             print("\n크롬 드라이버 종료")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="무신사 랭킹 TOP 100 정밀 크롤링")
+    parser.add_argument('--backend', choices=MusinsaPreciseCrawler.BACKENDS, default='selenium',
+                        help="상품 상세 페이지 추출 방식 (기본: selenium)")
+    parser.add_argument('--workers', type=int, default=10,
+                        help="동시 처리 개수 (기본: 10, --adaptive 사용 시 상한)")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="지연 시간/오류율/빈 레코드 비율/메모리 사용률에 따라 동시 처리 개수 자동 조절")
+    parser.add_argument('--min-workers', type=int, default=1, help="--adaptive 사용 시 최소 동시 처리 개수 (기본: 1)")
+    parser.add_argument('--ranking-mode', choices=MusinsaPreciseCrawler.RANKING_MODES, default='network',
+                        help="랭킹 수집 방식 (network: JSON 응답 캡처, dom: 스크롤 후 링크 수집)")
+    parser.add_argument('--no-block', action='store_true',
+                        help="이미지/폰트/트래커 등 리소스 차단 비활성화")
+    parser.add_argument('--state', default='data/crawl_state.sqlite',
+                        help="증분 크롤링 상태 저장 파일 (기본: data/crawl_state.sqlite)")
+    parser.add_argument('--ttl', type=int, default=3600,
+                        help="이 시간(초) 안에 수집된 상품은 다시 크롤링하지 않음 (기본: 3600)")
+    parser.add_argument('--full', action='store_true', help="상태 저장소를 사용하지 않고 전체 크롤링")
+    parser.add_argument('--listing-only', action='store_true',
+                        help="랭킹 목록 정보 위주로 수집하고, 목록에 없는 필드만 상세 페이지에서 수집")
+    parser.add_argument('--detail-ttl', type=int, default=86400,
+                        help="목록 모드에서 상세 페이지 정보(평점, 리뷰수 등)를 재사용할 시간(초) (기본: 86400)")
+    parser.add_argument('--sink', default=None,
+                        help="수집되는 즉시 결과를 기록할 경로 (.jsonl: JSON Lines, 그 외: Parquet 디렉토리)")
+    parser.add_argument('--no-excel', action='store_true',
+                        help="결과를 메모리에 모으지 않고 sink에만 기록 (엑셀/피클 저장 생략)")
+    parser.add_argument('--quiet', action='store_true', help="상품별 출력 생략 (진행률과 요약만 출력)")
+    parser.add_argument('--metrics-report', default='data/crawl_report.json',
+                        help="단계별 소요 시간/필드 적중률/실패 유형 리포트 저장 경로 (기본: data/crawl_report.json)")
+    parser.add_argument('--retries', type=int, default=3, help="상품별 최대 시도 횟수 (기본: 3)")
+    parser.add_argument('--dead-letters', default='data/crawl_dead_letters.jsonl',
+                        help="재시도 후에도 실패한 상품 기록 경로 (기본: data/crawl_dead_letters.jsonl)")
+    parser.add_argument('--browser-service', default=None, metavar='URL',
+                        help="크롬을 새로 띄우지 않고 브라우저 서비스(browser_service.py)의 세션 사용 (예: http://127.0.0.1:9600)")
+    parser.add_argument('--snapshots', default='data/snapshots.sqlite',
+                        help="크롤링 결과를 이력 스냅샷으로 쌓을 파일 (기본: data/snapshots.sqlite, 빈 값이면 저장 안 함)")
+    parser.add_argument('--engine', choices=['thread', 'async'], default='thread',
+                        help="병렬 처리 방식 (thread: 스레드 풀, async: asyncio + 토큰 버킷)")
+    parser.add_argument('--rate', type=float, default=2.0, help="async 엔진의 초당 요청 수 (기본: 2.0)")
+    parser.add_argument('--burst', type=int, default=5, help="async 엔진의 최대 burst 요청 수 (기본: 5)")
+    return parser.parse_args()
+
 def main():
-    crawler = MusinsaPreciseCrawler()
+    args = parse_args()
+    state_store = None if args.full else CrawlStateStore(args.state, ttl=args.ttl)
+    browser_service = None
+    if args.browser_service:
+        browser_service = BrowserServiceClient(args.browser_service)
+        if not browser_service.available():
+            print(f"브라우저 서비스에 연결할 수 없어 크롬을 직접 실행합니다: {args.browser_service}")
+            browser_service = None
+    crawler = MusinsaPreciseCrawler(backend=args.backend,
+                                    network_profile=NetworkProfile(enabled=not args.no_block),
+                                    state_store=state_store,
+                                    ranking_mode=args.ranking_mode,
+                                    sink=open_sink(args.sink) if args.sink else None,
+                                    retain_products=not (args.sink and args.no_excel),
+                                    quiet=args.quiet,
+                                    retry_policy=RetryPolicy(max_attempts=args.retries),
+                                    browser_service=browser_service)
     
     try:
         start_time = time.time()
         
-        # 드라이버 설정
+        # 드라이버 설정 (랭킹 페이지 URL 수집용)
         crawler.setup_driver()
         
-        # 병렬 크롤링 실행 (최대 10개 동시 처리)
-        success = crawler.crawl_all_products_parallel(max_workers=10)
-        
-        if success:
+        # 병렬 크롤링 실행 (기본 최대 10개 동시 처리)
+        if args.listing_only:
+            success = crawler.crawl_listing(max_workers=args.workers, detail_ttl=args.detail_ttl,
+                                            adaptive=args.adaptive, min_workers=args.min_workers)
+        elif args.engine == 'async':
+            success = crawler.crawl_all_products_async(rate=args.rate, burst=args.burst,
+                                                       per_host_limit=args.workers)
+        else:
+            success = crawler.crawl_all_products_parallel(max_workers=args.workers, adaptive=args.adaptive,
+                                                          min_workers=args.min_workers)
+        
+        if success and crawler.retain_products:
             # 데이터 저장
             df = crawler.save_to_excel()
+            if args.snapshots:
+                crawler.save_snapshot(args.snapshots)
             
         elapsed_time = time.time() - start_time
         print(f"\n총 소요 시간: {elapsed_time/60:.1f}분")
         
+        if crawler.dead_letters and args.dead_letters:
+            crawler.save_dead_letters(args.dead_letters)
+        
+        if args.metrics_report:
+            crawler.metrics.write_report(args.metrics_report)
+            print(f"✓ 크롤링 리포트 저장: {args.metrics_report}")
+        
     except KeyboardInterrupt:
         print("\n\n사용자에 의해 중단되었습니다.")
         
@@ -0,0 +1,90 @@
+import json
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+# 텍스트 추출에 필요 없는 리소스 (이미지, 폰트, 동영상, 트래커)
+DEFAULT_BLOCKED_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*facebook.net*', '*connect.facebook.com*', '*criteo.*', '*kakao.com/v1/pixel*',
+    '*hotjar.com*', '*clarity.ms*', '*branch.io*', '*appsflyer.com*',
+]
+
+
+class NetworkProfile:
+    """크롬 드라이버 네트워크 차단 프로필 + 전송량 집계
+
+    차단은 DevTools(Network.setBlockedURLs)와 이미지 로딩 비활성화 설정으로 적용하고,
+    전송 바이트/차단 요청 수는 performance 로그의 Network 이벤트로 집계한다.
+    """
+
+    def __init__(self, blocked_patterns=None, block_images=True, enabled=True):
+        self.blocked_patterns = list(DEFAULT_BLOCKED_PATTERNS if blocked_patterns is None else blocked_patterns)
+        self.block_images = block_images
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.blocked = 0
+        self.failed = 0
+        self.bytes_transferred = 0
+
+    def apply_options(self, chrome_options):
+        """드라이버 생성 전 크롬 옵션 설정"""
+        # 전송량 집계를 위해 Network 이벤트를 performance 로그로 받는다
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+        if self.enabled and self.block_images:
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+            })
+
+    def apply(self, driver):
+        """드라이버 생성 직후 차단 URL 패턴 등록"""
+        if not self.enabled or not self.blocked_patterns:
+            return
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_patterns})
+
+    def collect(self, driver):
+        """쌓인 performance 로그를 비우면서 집계하고 Network 이벤트 목록 반환"""
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException:
+            return []
+
+        events = []
+        requests = blocked = failed = transferred = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method', '')
+            params = message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                requests += 1
+            elif method == 'Network.loadingFinished':
+                transferred += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed':
+                if params.get('blockedReason') or 'BLOCKED' in params.get('errorText', ''):
+                    blocked += 1
+                else:
+                    failed += 1
+            events.append(message)
+
+        with self._lock:
+            self.requests += requests
+            self.blocked += blocked
+            self.failed += failed
+            self.bytes_transferred += transferred
+        return events
+
+    def summary(self):
+        return (f"네트워크: 요청 {self.requests}개, 차단 {self.blocked}개, 실패 {self.failed}개, "
+                f"전송량 {self.bytes_transferred / 1024 / 1024:.1f}MB")
@@ -0,0 +1,169 @@
+import json
+import math
+import re
+
+from selenium.common.exceptions import WebDriverException
+
+PRODUCT_URL_RE = re.compile(r'/products/(\d+)')
+PRODUCT_URL_TEMPLATE = 'https://www.musinsa.com/products/{}'
+
+# 상품 항목에서 상품 번호로 쓰이는 키
+_PRODUCT_ID_KEYS = ('goodsNo', 'productId', 'goodsId', 'productNo')
+
+
+def _product_id(node, depth=2):
+    """dict가 상품 항목이면 상품 번호 반환 (중첩 dict는 depth 단계까지만 확인)"""
+    for key in _PRODUCT_ID_KEYS:
+        value = node.get(key)
+        if value is not None and str(value).isdigit():
+            return str(value)
+    for value in node.values():
+        if isinstance(value, str):
+            match = PRODUCT_URL_RE.search(value)
+            if match:
+                return match.group(1)
+    if depth > 0:
+        for value in node.values():
+            if isinstance(value, dict):
+                product_id = _product_id(value, depth - 1)
+                if product_id:
+                    return product_id
+    return None
+
+
+def find_product_items(payload):
+    """JSON 응답에서 상품 항목을 문서 순서대로 추출 -> [(상품번호, 항목 dict)]"""
+    items = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            product_id = _product_id(node)
+            # 하위에 상품 목록(list)을 가진 dict는 항목이 아니라 컨테이너
+            if product_id and not any(isinstance(v, list) for v in node.values()):
+                items.append((product_id, node))
+                return
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(payload)
+    return items
+
+
+def _is_json_response(event):
+    if event.get('method') != 'Network.responseReceived':
+        return False
+    response = event.get('params', {}).get('response', {})
+    return 'json' in response.get('mimeType', '')
+
+
+class RankingCapture:
+    """랭킹 페이지가 받아오는 JSON 응답에서 상품 목록 수집
+
+    DOM을 스크롤하며 앵커를 훑는 대신, performance 로그의 Network 이벤트로 JSON 응답을 찾아
+    본문(Network.getResponseBody)에서 상품 항목을 꺼낸다.
+    """
+
+    def __init__(self):
+        self.items = []  # [(상품URL, 항목 dict)] - 랭킹 순서
+        self.responses = 0
+        self._seen = set()
+
+    def feed(self, driver, events):
+        """Network 이벤트 목록을 받아 새로 발견한 상품 수 반환"""
+        added = 0
+        for event in events:
+            if not _is_json_response(event):
+                continue
+            request_id = event['params']['requestId']
+            try:
+                body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                payload = json.loads(body.get('body', ''))
+            except (WebDriverException, ValueError):
+                continue
+
+            found = find_product_items(payload)
+            if found:
+                self.responses += 1
+            for product_id, item in found:
+                if product_id in self._seen:
+                    continue
+                self._seen.add(product_id)
+                self.items.append((PRODUCT_URL_TEMPLATE.format(product_id), item))
+                added += 1
+        return added
+
+
+# 목록 JSON 키 -> 레코드 필드 (앞에 있는 키 우선)
+LISTING_FIELD_KEYS = {
+    '브랜드명': ('brandName', 'brandNameKr', 'brand'),
+    '상품명': ('productName', 'goodsName', 'name'),
+    '카테고리': ('categoryName', 'category'),
+    '현재가격': ('finalPrice', 'salePrice', 'price'),
+    '원가': ('normalPrice', 'originalPrice', 'consumerPrice'),
+    '할인율': ('discountRatio', 'discountRate', 'saleRate'),
+    '평점': ('reviewScore', 'rating'),
+    '리뷰수': ('reviewCount',),
+}
+
+NUMBER_FIELDS = ('현재가격', '원가', '할인율', '평점', '리뷰수')
+
+
+def _find_value(node, keys, depth=2):
+    """항목 dict(중첩 dict 포함)에서 keys 중 처음 발견되는 스칼라 값"""
+    for key in keys:
+        value = node.get(key)
+        if value is not None and not isinstance(value, (dict, list)):
+            return value
+    if depth > 0:
+        for value in node.values():
+            if isinstance(value, dict):
+                found = _find_value(value, keys, depth - 1)
+                if found is not None:
+                    return found
+    return None
+
+
+def _to_number(value):
+    """숫자 값 (float), 해석할 수 없거나 'nan'/'inf' 같은 값이면 None"""
+    try:
+        number = float(str(value).replace(',', ''))
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def listing_fields(item):
+    """목록 항목에서 상세 페이지와 같은 형식의 필드 추출
+
+    목록에 없거나 숫자 필드 값을 해석할 수 없는 필드는 None (상세 페이지에서 채워야 함),
+    값이 없다고 확인된 필드는 ''.
+    """
+    fields = {}
+    for key, candidates in LISTING_FIELD_KEYS.items():
+        value = _find_value(item, candidates)
+        if value is None:
+            fields[key] = None
+            continue
+
+        number = _to_number(value)
+        if key in NUMBER_FIELDS and number is None:
+            # '가격 문의' 같은 값은 값이 없다는 뜻이 아니므로 상세 페이지에서 확인
+            fields[key] = None
+        elif key in ('현재가격', '원가'):
+            fields[key] = f"{int(number):,}원" if number else ''
+        elif key == '할인율':
+            # 할인이 없으면 상세 페이지에도 할인율 요소가 없다
+            fields[key] = f"{int(number)}%" if number else ''
+        elif key == '평점':
+            # 100점 만점 점수로 오는 경우 5점 만점으로 환산
+            if number > 5:
+                number = round(number / 20, 1)
+            fields[key] = f"{number:.1f}" if number else ''
+        elif key == '리뷰수':
+            fields[key] = f"후기 {int(number):,}개"
+        else:
+            fields[key] = str(value).strip()
+    return fields
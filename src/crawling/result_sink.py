@@ -0,0 +1,87 @@
+import json
+import os
+import threading
+import time
+
+
+class JsonLinesSink:
+    """수집된 상품 레코드를 즉시 JSON Lines 파일에 추가
+
+    레코드마다 flush하므로 크롤링이 중간에 죽어도 그때까지의 결과가 남고,
+    크롤링 중에도 `tail -f`로 결과를 확인할 수 있다.
+    """
+
+    def __init__(self, path, fsync=False):
+        self.path = path
+        self.fsync = fsync
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+        self.written = 0
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.written += 1
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class ParquetSink:
+    """수집된 상품 레코드를 batch_size개씩 Parquet 파일로 기록
+
+    Parquet은 파일 끝(footer)을 써야 읽을 수 있으므로, 배치마다 디렉토리 안에
+    part 파일을 하나씩 만든다. 디렉토리 전체를 pd.read_parquet(path)로 읽을 수 있다.
+    """
+
+    def __init__(self, path, batch_size=500):
+        import pyarrow  # noqa: F401 - Parquet 저장에 필요
+
+        self.path = path
+        self.batch_size = batch_size
+        os.makedirs(path, exist_ok=True)
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._prefix = f"part-{time.strftime('%Y%m%d%H%M%S')}-{os.getpid()}"
+        self._parts = 0
+        self.written = 0
+
+    def _flush(self):
+        import pandas as pd
+
+        if not self._buffer:
+            return
+        # 필드 구성이 레코드마다 조금씩 달라도 되도록 순위 외에는 문자열로 통일
+        df = pd.DataFrame(self._buffer)
+        for column in df.columns:
+            if column != '순위':
+                df[column] = df[column].astype('string')
+        part_path = os.path.join(self.path, f"{self._prefix}-{self._parts:05d}.parquet")
+        df.to_parquet(part_path, index=False)
+        self._parts += 1
+        self.written += len(self._buffer)
+        self._buffer = []
+
+    def write(self, record):
+        with self._lock:
+            self._buffer.append(record)
+            if len(self._buffer) >= self.batch_size:
+                self._flush()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+
+
+def open_sink(path):
+    """경로에 맞는 결과 sink 생성 (.jsonl -> JSON Lines, 그 외 -> Parquet 디렉토리)"""
+    if path.endswith('.jsonl') or path.endswith('.json'):
+        return JsonLinesSink(path)
+    return ParquetSink(path)
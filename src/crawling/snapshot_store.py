@@ -0,0 +1,324 @@
+"""크롤링 결과 이력 저장소 (append-only 스냅샷)
+
+크롤링 결과를 덮어쓰지 않고 크롤링 시각(크롤링시간)별 스냅샷으로 쌓는다.
+스냅샷을 추가할 때 직전 스냅샷 대비 순위/가격/할인율 변화를 미리 계산해 저장하므로,
+"어제 이후 무엇이 바뀌었나"를 과거 파일을 모두 다시 읽지 않고 조회할 수 있다.
+
+사용법:
+    python src/crawling/snapshot_store.py ingest data/musinsa_ranking_precise.xlsx
+    python src/crawling/snapshot_store.py movers --since 1d
+    python src/crawling/snapshot_store.py history https://www.musinsa.com/products/1234567
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_NUMBER_RE = re.compile(r'[\d.]+')
+
+
+def _to_number(value, cast=int):
+    """'48,990원', '45%', '후기 12,191개', 4.8 같은 값을 숫자로 (없거나 해석할 수 없으면 None)"""
+    if value is None or value != value:  # None 또는 NaN
+        return None
+    match = _NUMBER_RE.search(str(value).replace(',', ''))
+    if not match:
+        return None
+    try:
+        return cast(float(match.group()))
+    except ValueError:  # '.', '1.2.3' 같은 값
+        return None
+
+
+def _row_values(record):
+    return (
+        int(record['순위']),
+        record.get('브랜드명') or '',
+        record.get('상품명') or '',
+        _to_number(record.get('현재가격')),
+        _to_number(record.get('원가')),
+        _to_number(record.get('할인율')),
+        _to_number(record.get('평점'), float),
+        _to_number(record.get('리뷰수')),
+    )
+
+
+class SnapshotStore:
+    """크롤링 시각별 상품 스냅샷 저장소 (SQLite)
+
+    snapshots: 스냅샷 목록 (snapshot_id = 크롤링 실행 시작 시각, 지정하지 않으면 레코드의 가장 이른 크롤링시간)
+    snapshot_products: 스냅샷별 상품 레코드 - (snapshot_id, url) 기본 키, url 인덱스로 상품 이력 조회
+    snapshot_deltas: 스냅샷 추가 시 계산한 직전 스냅샷 대비 변화
+    """
+
+    def __init__(self, path='data/snapshots.sqlite'):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                scope TEXT NOT NULL,
+                snapshot_id TEXT NOT NULL,
+                ingested_at TEXT NOT NULL,
+                products INTEGER NOT NULL,
+                PRIMARY KEY (scope, snapshot_id)
+            );
+            CREATE TABLE IF NOT EXISTS snapshot_products (
+                scope TEXT NOT NULL,
+                snapshot_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                rank INTEGER NOT NULL,
+                brand TEXT,
+                name TEXT,
+                price INTEGER,
+                original_price INTEGER,
+                discount INTEGER,
+                rating REAL,
+                reviews INTEGER,
+                record TEXT NOT NULL,
+                PRIMARY KEY (scope, snapshot_id, url)
+            );
+            CREATE INDEX IF NOT EXISTS idx_snapshot_products_url ON snapshot_products (url, snapshot_id);
+            CREATE TABLE IF NOT EXISTS snapshot_deltas (
+                scope TEXT NOT NULL,
+                snapshot_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                previous_id TEXT,
+                status TEXT NOT NULL,
+                rank INTEGER,
+                previous_rank INTEGER,
+                rank_delta INTEGER,
+                price_delta INTEGER,
+                discount_delta INTEGER,
+                PRIMARY KEY (scope, snapshot_id, url)
+            );
+        """)
+        self._conn.commit()
+
+    def snapshot_ids(self, scope='all'):
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT snapshot_id FROM snapshots WHERE scope = ? ORDER BY snapshot_id', (scope,)).fetchall()
+        return [row[0] for row in rows]
+
+    def latest(self, scope='all'):
+        with self._lock:
+            return self._conn.execute('SELECT MAX(snapshot_id) FROM snapshots WHERE scope = ?', (scope,)).fetchone()[0]
+
+    def snapshot_at(self, when, scope='all'):
+        """when(datetime 또는 문자열) 시점에 가장 최근이었던 스냅샷 ID"""
+        if isinstance(when, datetime):
+            when = when.strftime(TIME_FORMAT)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT MAX(snapshot_id) FROM snapshots WHERE scope = ? AND snapshot_id <= ?',
+                (scope, when)).fetchone()
+        return row[0]
+
+    def ingest(self, records, scope='all', snapshot_id=None):
+        """크롤링 결과를 새 스냅샷으로 추가하고 직전 스냅샷 대비 변화 계산
+
+        같은 스냅샷 ID가 이미 있으면 경고를 출력하고 추가하지 않음 (append-only, None 반환).
+        크롤러는 실행 시작 시각을 snapshot_id로 넘긴다. 증분 크롤링에서 재사용한 레코드는 크롤링시간이
+        이전 실행 시각이라, 레코드로 정한 ID는 직전 스냅샷과 같거나 더 이를 수 있다.
+        """
+        records = [record for record in records if record.get('상품URL')]
+        if not records:
+            print("✗ 스냅샷에 추가할 레코드가 없습니다.")
+            return None
+        snapshot_id = snapshot_id or min(str(record['크롤링시간']) for record in records)
+
+        with self._lock:
+            exists = self._conn.execute('SELECT 1 FROM snapshots WHERE scope = ? AND snapshot_id = ?',
+                                        (scope, snapshot_id)).fetchone()
+            if exists:
+                print(f"✗ 이미 저장된 스냅샷 ID입니다: {snapshot_id} ({scope}) - 추가하지 않음")
+                return None
+            previous_id = self._conn.execute(
+                'SELECT MAX(snapshot_id) FROM snapshots WHERE scope = ? AND snapshot_id < ?',
+                (scope, snapshot_id)).fetchone()[0]
+
+            with self._conn:
+                self._conn.execute('INSERT INTO snapshots VALUES (?, ?, ?, ?)',
+                                   (scope, snapshot_id, datetime.now().strftime(TIME_FORMAT), len(records)))
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO snapshot_products VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(scope, snapshot_id, record['상품URL'], *_row_values(record),
+                      json.dumps(record, ensure_ascii=False, default=str)) for record in records])
+                self._insert_deltas(scope, snapshot_id, previous_id)
+        return snapshot_id
+
+    def _insert_deltas(self, scope, snapshot_id, previous_id):
+        """직전 스냅샷과 url로 조인해서 변화 기록 (새로 진입 / 이탈 포함)"""
+        self._conn.execute("""
+            INSERT INTO snapshot_deltas
+            SELECT cur.scope, cur.snapshot_id, cur.url, ?,
+                   CASE WHEN prev.url IS NULL THEN 'new'
+                        WHEN cur.rank < prev.rank THEN 'up'
+                        WHEN cur.rank > prev.rank THEN 'down'
+                        ELSE 'same' END,
+                   cur.rank, prev.rank, prev.rank - cur.rank,
+                   cur.price - prev.price, cur.discount - prev.discount
+            FROM snapshot_products cur
+            LEFT JOIN snapshot_products prev
+                ON prev.scope = cur.scope AND prev.snapshot_id = ? AND prev.url = cur.url
+            WHERE cur.scope = ? AND cur.snapshot_id = ?
+        """, (previous_id, previous_id, scope, snapshot_id))
+        if previous_id is None:
+            return
+        self._conn.execute("""
+            INSERT INTO snapshot_deltas
+            SELECT prev.scope, ?, prev.url, prev.snapshot_id, 'dropped',
+                   NULL, prev.rank, NULL, NULL, NULL
+            FROM snapshot_products prev
+            WHERE prev.scope = ? AND prev.snapshot_id = ?
+              AND NOT EXISTS (SELECT 1 FROM snapshot_products cur
+                              WHERE cur.scope = prev.scope AND cur.snapshot_id = ? AND cur.url = prev.url)
+        """, (snapshot_id, scope, previous_id, snapshot_id))
+
+    def deltas(self, snapshot_id=None, scope='all'):
+        """스냅샷(기본: 최신)의 직전 스냅샷 대비 변화 - 추가할 때 계산해둔 값을 그대로 조회"""
+        import pandas as pd
+
+        snapshot_id = snapshot_id or self.latest(scope)
+        with self._lock:
+            return pd.read_sql_query("""
+                SELECT d.url AS 상품URL, p.brand AS 브랜드명, p.name AS 상품명, d.status AS 변화,
+                       d.rank AS 순위, d.previous_rank AS 이전순위, d.rank_delta AS 순위변화,
+                       d.price_delta AS 가격변화, d.discount_delta AS 할인율변화
+                FROM snapshot_deltas d
+                LEFT JOIN snapshot_products p
+                    ON p.scope = d.scope AND p.url = d.url
+                   AND p.snapshot_id = CASE WHEN d.status = 'dropped' THEN d.previous_id ELSE d.snapshot_id END
+                WHERE d.scope = ? AND d.snapshot_id = ?
+                ORDER BY d.rank IS NULL, d.rank
+            """, self._conn, params=(scope, snapshot_id))
+
+    def compare(self, old_id, new_id, scope='all'):
+        """임의의 두 스냅샷 비교 (예: 하루 전 스냅샷 vs 최신 스냅샷)"""
+        import pandas as pd
+
+        with self._lock:
+            return pd.read_sql_query("""
+                SELECT cur.url AS 상품URL, cur.brand AS 브랜드명, cur.name AS 상품명,
+                       cur.rank AS 순위, old.rank AS 이전순위, old.rank - cur.rank AS 순위변화,
+                       cur.price - old.price AS 가격변화, cur.discount - old.discount AS 할인율변화
+                FROM snapshot_products cur
+                LEFT JOIN snapshot_products old ON old.scope = cur.scope AND old.snapshot_id = ? AND old.url = cur.url
+                WHERE cur.scope = ? AND cur.snapshot_id = ?
+                ORDER BY cur.rank
+            """, self._conn, params=(old_id, scope, new_id))
+
+    def changes_since(self, since, scope='all'):
+        """since(datetime) 시점의 스냅샷과 최신 스냅샷 비교"""
+        latest = self.latest(scope)
+        baseline = self.snapshot_at(since, scope)
+        if latest is None:
+            return None
+        # since 이전 스냅샷이 없으면 가장 오래된 스냅샷과 비교
+        baseline = baseline or self.snapshot_ids(scope)[0]
+        return self.compare(baseline, latest, scope)
+
+    def product_history(self, url, scope='all'):
+        """상품 하나의 스냅샷별 순위/가격/할인율 이력 (url 인덱스 사용)"""
+        import pandas as pd
+
+        with self._lock:
+            return pd.read_sql_query("""
+                SELECT snapshot_id AS 크롤링시간, rank AS 순위, price AS 현재가격, discount AS 할인율,
+                       rating AS 평점, reviews AS 리뷰수
+                FROM snapshot_products WHERE url = ? AND scope = ?
+                ORDER BY snapshot_id
+            """, self._conn, params=(url, scope))
+
+    def delta_counts(self, snapshot_id, scope='all'):
+        """스냅샷의 변화 유형별 상품 수 {'up': .., 'down': .., 'same': .., 'new': .., 'dropped': ..}"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT status, COUNT(*) FROM snapshot_deltas WHERE scope = ? AND snapshot_id = ? GROUP BY status',
+                (scope, snapshot_id)).fetchall()
+        return dict(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def load_records(path):
+    """저장된 크롤링 결과 파일(.xlsx, .pkl, .jsonl, Parquet)을 레코드 목록으로"""
+    import pandas as pd
+
+    if path.endswith('.xlsx'):
+        df = pd.read_excel(path)
+    elif path.endswith('.pkl'):
+        df = pd.read_pickle(path)
+    elif path.endswith('.jsonl') or path.endswith('.json'):
+        df = pd.read_json(path, lines=True)
+    else:
+        df = pd.read_parquet(path)
+    df['크롤링시간'] = df['크롤링시간'].astype(str)
+    return df.to_dict('records')
+
+
+def parse_since(value):
+    """'1d', '12h', '30m' 또는 'YYYY-MM-DD HH:MM:SS' -> datetime"""
+    match = re.fullmatch(r'(\d+)([dhm])', value)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {'d': timedelta(days=amount), 'h': timedelta(hours=amount), 'm': timedelta(minutes=amount)}[unit]
+        return datetime.now() - delta
+    return datetime.strptime(value, TIME_FORMAT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 결과 스냅샷 이력 저장소")
+    parser.add_argument('--db', default='data/snapshots.sqlite', help="스냅샷 저장 파일 (기본: data/snapshots.sqlite)")
+    parser.add_argument('--scope', default='all', help="스냅샷 구분 (예: 카테고리별 크롤링)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest = subparsers.add_parser('ingest', help="크롤링 결과 파일을 스냅샷으로 추가")
+    ingest.add_argument('paths', nargs='+')
+
+    movers = subparsers.add_parser('movers', help="순위/가격/할인율이 바뀐 상품")
+    movers.add_argument('--since', default=None, help="이 시점 이후 변화 (예: 1d, 12h) - 생략 시 직전 스냅샷 대비")
+    movers.add_argument('--top', type=int, default=20)
+
+    history = subparsers.add_parser('history', help="상품 하나의 스냅샷별 이력")
+    history.add_argument('url')
+
+    args = parser.parse_args()
+    store = SnapshotStore(args.db)
+    try:
+        if args.command == 'ingest':
+            for path in args.paths:
+                snapshot_id = store.ingest(load_records(path), scope=args.scope)
+                if snapshot_id:
+                    print(f"✓ 스냅샷 추가: {snapshot_id} ({path})")
+
+        elif args.command == 'movers':
+            df = store.changes_since(parse_since(args.since), args.scope) if args.since else store.deltas(scope=args.scope)
+            if df is None or df.empty:
+                print("비교할 스냅샷이 없습니다.")
+                return
+            if '변화' in df:
+                print(f"새로 진입: {(df['변화'] == 'new').sum()}개, 이탈: {(df['변화'] == 'dropped').sum()}개\n")
+            moved = df[df['순위변화'].fillna(0) != 0].copy()
+            moved = moved.reindex(moved['순위변화'].abs().sort_values(ascending=False).index)
+            print(moved.head(args.top).to_string(index=False))
+
+        else:
+            print(store.product_history(args.url, args.scope).to_string(index=False))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
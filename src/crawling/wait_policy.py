@@ -0,0 +1,96 @@
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from musinsa_page import PRODUCT_SELECTORS
+
+
+class ReadinessWait:
+    """고정 sleep 대신 페이지가 준비되는 즉시 반환하는 대기 정책
+
+    기존 고정 대기(평균값)와 실제 대기 시간을 비교해 절약된 시간을 집계한다.
+    """
+
+    # 기존 코드의 고정 대기 시간 평균 (초)
+    BASELINE_PRODUCT = 2.5   # random.uniform(2.0, 3.0)
+    BASELINE_RANKING = 3.0   # time.sleep(3)
+    BASELINE_SCROLL = 2.0    # random.uniform(1.5, 2.5)
+
+    # 상품 페이지 준비 기준: 가격 또는 브랜드 요소 존재
+    PRODUCT_READY_SELECTORS = (PRODUCT_SELECTORS['현재가격'], PRODUCT_SELECTORS['브랜드명'])
+    RANKING_READY_SELECTOR = "a[href*='/products/']"
+
+    def __init__(self, timeout=10, scroll_timeout=5, poll_frequency=0.1):
+        self.timeout = timeout
+        self.scroll_timeout = scroll_timeout
+        self.poll_frequency = poll_frequency
+
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.timeouts = 0
+        self.waited = 0.0
+        self.baseline = 0.0
+
+    def _record(self, elapsed, baseline, timed_out):
+        with self._lock:
+            self.waits += 1
+            self.waited += elapsed
+            self.baseline += baseline
+            if timed_out:
+                self.timeouts += 1
+
+    def _wait_until(self, driver, condition, timeout, baseline):
+        """조건이 만족될 때까지 대기. 만족하면 True, 시간 초과면 False"""
+        start = time.time()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll_frequency).until(condition)
+            ready = True
+        except TimeoutException:
+            ready = False
+        self._record(time.time() - start, baseline, timed_out=not ready)
+        return ready
+
+    def wait_for_product(self, driver):
+        """상품 상세 페이지의 가격/브랜드 요소가 생길 때까지 대기"""
+        condition = EC.any_of(*[
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            for selector in self.PRODUCT_READY_SELECTORS
+        ])
+        return self._wait_until(driver, condition, self.timeout, self.BASELINE_PRODUCT)
+
+    def wait_for_ranking(self, driver):
+        """랭킹 페이지에 상품 링크가 생길 때까지 대기"""
+        condition = EC.presence_of_element_located((By.CSS_SELECTOR, self.RANKING_READY_SELECTOR))
+        return self._wait_until(driver, condition, self.timeout, self.BASELINE_RANKING)
+
+    def wait_for_scroll(self, driver, previous_height):
+        """스크롤 후 페이지 높이가 바뀔 때까지 대기하고 새 높이 반환
+
+        시간 내에 높이가 바뀌지 않으면 previous_height를 그대로 반환한다 (더 불러올 컨텐츠 없음).
+        """
+        def height_changed(d):
+            height = d.execute_script("return document.body.scrollHeight")
+            return height if height != previous_height else False
+
+        start = time.time()
+        try:
+            height = WebDriverWait(driver, self.scroll_timeout,
+                                   poll_frequency=self.poll_frequency).until(height_changed)
+        except TimeoutException:
+            height = previous_height
+        self._record(time.time() - start, self.BASELINE_SCROLL,
+                     timed_out=height == previous_height)
+        return height
+
+    @property
+    def saved(self):
+        """고정 대기 대비 절약된 시간 (초)"""
+        return self.baseline - self.waited
+
+    def summary(self):
+        return (f"페이지 대기: {self.waits}회, 실제 {self.waited:.1f}초 "
+                f"(고정 대기 대비 {self.saved:.1f}초 절약, 시간 초과 {self.timeouts}회)")
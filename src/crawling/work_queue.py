@@ -0,0 +1,128 @@
+import json
+import os
+import sqlite3
+import time
+
+
+class WorkQueue:
+    """SQLite 기반 영속 작업 큐
+
+    여러 크롤러 프로세스(또는 같은 파일을 공유하는 여러 머신)가 작업 묶음(shard)을
+    lease 방식으로 가져간다. lease 기한(visibility timeout) 안에 complete되지 않은 작업은
+    다른 워커가 다시 가져갈 수 있다.
+    """
+
+    def __init__(self, path='data/crawl_queue.sqlite', max_attempts=3):
+        self.path = path
+        self.max_attempts = max_attempts
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        # 프로세스 간 잠금은 SQLite가 처리하므로 busy 대기 시간만 넉넉히 준다
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        # WAL은 공유 메모리(-shm)를 쓰므로 NFS/SMB처럼 여러 머신이 공유하는 파일에서는 잠금이 깨진다.
+        # 기본 rollback journal(DELETE)을 명시해 예전에 WAL로 만든 큐 파일도 되돌린다.
+        self._conn.execute('PRAGMA journal_mode=DELETE')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL UNIQUE,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, lease_expires)')
+
+    def put(self, key, kind, payload):
+        """작업 추가 (같은 key가 이미 있으면 무시). 추가되면 True"""
+        cursor = self._conn.execute(
+            'INSERT OR IGNORE INTO tasks (key, kind, payload, updated_at) VALUES (?, ?, ?, ?)',
+            (key, kind, json.dumps(payload, ensure_ascii=False), time.time()))
+        return cursor.rowcount == 1
+
+    def lease(self, owner, visibility_timeout=600, kinds=None):
+        """대기 중이거나 lease가 만료된 작업 하나를 가져옴. 없으면 None
+
+        lease가 만료된 작업 중 이미 max_attempts번 시도한 작업은 failed로 바꾸고 다시 가져가지 않는다
+        (처리 중 워커를 매번 죽게 하는 shard가 fail()을 거치지 않고 끝없이 재시도되지 않도록).
+        반환값: {'id', 'key', 'kind', 'payload', 'attempts'}
+        """
+        now = time.time()
+        kind_filter = ''
+        params = [now, self.max_attempts]
+        if kinds:
+            kind_filter = f"AND kind IN ({', '.join('?' * len(kinds))})"
+            params.extend(kinds)
+
+        # BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아 두 워커가 같은 작업을 가져가지 않게 한다
+        self._conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._conn.execute("""
+                UPDATE tasks SET status = 'failed', lease_expires = NULL, updated_at = ?,
+                                 error = 'lease 만료 (최대 시도 횟수 초과)'
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+            """, (now, now, self.max_attempts))
+            row = self._conn.execute(f"""
+                SELECT id, key, kind, payload, attempts FROM tasks
+                WHERE (status = 'pending' OR (status = 'leased' AND lease_expires < ? AND attempts < ?))
+                {kind_filter}
+                ORDER BY id LIMIT 1
+            """, params).fetchone()
+            if row is None:
+                self._conn.execute('COMMIT')
+                return None
+
+            task_id, key, kind, payload, attempts = row
+            self._conn.execute("""
+                UPDATE tasks SET status = 'leased', owner = ?, lease_expires = ?,
+                                 attempts = attempts + 1, updated_at = ?
+                WHERE id = ?
+            """, (owner, now + visibility_timeout, now, task_id))
+            self._conn.execute('COMMIT')
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+
+        return {'id': task_id, 'key': key, 'kind': kind,
+                'payload': json.loads(payload), 'attempts': attempts + 1}
+
+    def extend(self, task_id, owner, visibility_timeout=600):
+        """오래 걸리는 작업의 lease 연장. 이미 다른 워커에게 넘어갔으면 False
+
+        CrawlWorker가 작업을 처리하는 동안 주기적으로 호출한다 (heartbeat).
+        """
+        cursor = self._conn.execute("""
+            UPDATE tasks SET lease_expires = ?, updated_at = ?
+            WHERE id = ? AND owner = ? AND status = 'leased'
+        """, (time.time() + visibility_timeout, time.time(), task_id, owner))
+        return cursor.rowcount == 1
+
+    def complete(self, task_id, owner):
+        """작업 완료 처리"""
+        cursor = self._conn.execute("""
+            UPDATE tasks SET status = 'done', lease_expires = NULL, updated_at = ?
+            WHERE id = ? AND owner = ?
+        """, (time.time(), task_id, owner))
+        return cursor.rowcount == 1
+
+    def fail(self, task_id, owner, error=''):
+        """작업 실패 처리 - max_attempts 전까지는 다시 대기열로, 이후에는 failed"""
+        cursor = self._conn.execute("""
+            UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                             lease_expires = NULL, error = ?, updated_at = ?
+            WHERE id = ? AND owner = ?
+        """, (self.max_attempts, str(error)[:500], time.time(), task_id, owner))
+        return cursor.rowcount == 1
+
+    def stats(self):
+        """상태별 작업 수"""
+        rows = self._conn.execute('SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status').fetchall()
+        return {(kind, status): count for kind, status, count in rows}
+
+    def close(self):
+        self._conn.close()
@@ -1,74 +1,527 @@
+import hashlib
+import json
+import os
+import re
+
 import pandas as pd
 import numpy as np
-import re
 
-def load_and_preprocess_data(file_path):
-    """무신사 랭킹 데이터를 로드하고 전처리"""
-    df = pd.read_excel(file_path)
-    
-    # 가격 데이터 정제 (문자열 -> 숫자)
-    def clean_price(price_str):
-        if pd.isna(price_str):
-            return np.nan
-        # 숫자와 쉼표만 추출
-        clean_str = re.sub(r'[^\d,]', '', str(price_str))
-        clean_str = clean_str.replace(',', '')
+# 가격대 / 할인율 구간 (고정 구간)
+PRICE_BINS = [0, 30000, 50000, 100000, 200000, float('inf')]
+PRICE_LABELS = ['3만원 이하', '3-5만원', '5-10만원', '10-20만원', '20만원 이상']
+DISCOUNT_BINS = [-1, 0, 10, 30, 50, 100]
+DISCOUNT_LABELS = ['할인없음', '10% 이하', '10-30%', '30-50%', '50% 이상']
+REVIEW_BINS = [0, 100, 500, 1000, 5000, float('inf')]
+REVIEW_LABELS = ['100개 미만', '100-500개', '500-1000개', '1000-5000개', '5000개 이상']
+
+# 랭킹 데이터 컬럼별 dtype (apply_schema에서 적용)
+# - 브랜드명/카테고리: 반복되는 값이 많으므로 category
+# - 문자열 컬럼: 파이썬 객체 대신 Arrow 문자열
+# - 순위/할인율/리뷰수: 값 범위에 맞는 작은 정수형
+# - 가격은 결측치가 있어 float64 유지 (float32는 1,600만원 이상에서 원 단위가 정확하지 않음)
+# - 평점도 float64 (float32면 4.8이 4.800000190734863으로 분석 결과에 그대로 드러남)
+STRING_DTYPE = 'string[pyarrow]'
+RANKING_SCHEMA = {
+    '순위': 'int16',
+    '상품URL': STRING_DTYPE,
+    '크롤링시간': 'datetime64[ns]',
+    '브랜드명': 'category',
+    '상품명': STRING_DTYPE,
+    '카테고리': 'category',
+    '현재가격': STRING_DTYPE,
+    '원가': STRING_DTYPE,
+    '할인율': STRING_DTYPE,
+    '평점': 'float64',
+    '리뷰수': STRING_DTYPE,
+    '현재가격_정제': 'float64',
+    '원가_정제': 'float64',
+    '할인율_정제': 'int16',
+    '리뷰수_정제': 'int32',
+    '할인액': 'float64',
+    '리뷰당_순위점수': 'float64',
+}
+
+
+# 가격 데이터 정제 (문자열 -> 숫자)
+def clean_price(price_str):
+    if pd.isna(price_str):
+        return np.nan
+    # 숫자와 쉼표만 추출
+    clean_str = re.sub(r'[^\d,]', '', str(price_str))
+    clean_str = clean_str.replace(',', '')
+    try:
+        return int(clean_str)
+    except:
+        return np.nan
+
+# 리뷰수 정제
+def clean_review_count(review_str):
+    if pd.isna(review_str):
+        return 0
+    # 숫자와 쉼표만 추출
+    clean_str = re.sub(r'[^\d,]', '', str(review_str))
+    clean_str = clean_str.replace(',', '')
+    try:
+        return int(clean_str)
+    except:
+        return 0
+
+# 할인율 정제
+def clean_discount_rate(discount_str):
+    if pd.isna(discount_str):
+        return 0
+    # 숫자만 추출
+    clean_str = re.sub(r'[^\d]', '', str(discount_str))
+    try:
+        return int(clean_str)
+    except:
+        return 0
+
+
+def _extract_number(series, default):
+    """문자열 컬럼에서 숫자만 남겨 정수로 변환 (벡터 연산)
+
+    clean_price / clean_review_count / clean_discount_rate를 셀마다 호출하는 것과 같은 결과를 낸다.
+    랭킹 데이터는 같은 값('후기 1,234개', '45%' 등)이 반복되므로 고유값만 정제한 뒤 다시 펼친다.
+    값이 없거나(NaN) 숫자가 없으면 default, 결과에 NaN이 없으면 int64.
+    19자리 이상의 숫자('99999999999999999999999' 등)도 default로 둔다. int64로 바꿀 때 음수로 넘치지 않도록
+    하기 위해서이며, 이 경우만 셀 단위 함수(파이썬 int를 그대로 반환)와 결과가 다르다.
+    정수로 바로 변환하므로 큰 값도 float를 거치며 자릿수를 잃지 않는다.
+    """
+    codes, uniques = pd.factorize(series)
+    # str()로 바꾼 뒤 숫자 외 문자 제거 (쉼표도 제거되므로 셀 단위 함수의 두 단계와 같음)
+    digits = pd.Series(uniques, dtype=object).astype(str).str.replace(r'[^\d]', '', regex=True)
+    # 19자리 이상은 int64 범위(약 9.2 x 10^18)를 넘을 수 있으므로 제외 (앞의 0은 자릿수에서 뺌)
+    valid = (digits != '') & (digits.str.lstrip('0').str.len() <= 18)
+    # factorize는 NaN을 -1로 표시하므로 마지막 자리에 '값 없음'을 두고 한 번에 조회
+    numbers = np.append(digits.where(valid, '0').astype('int64').to_numpy(), 0)[codes]
+    missing = np.append(~valid.to_numpy(), True)[codes]
+    if not missing.any():
+        values = numbers
+    else:
+        values = np.where(missing, default, numbers)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def clean_price_series(series):
+    """clean_price의 벡터 버전 (값이 없으면 NaN)"""
+    return _extract_number(series, np.nan)
+
+
+def clean_review_count_series(series):
+    """clean_review_count의 벡터 버전 (값이 없으면 0)"""
+    return _extract_number(series, 0)
+
+
+def clean_discount_rate_series(series):
+    """clean_discount_rate의 벡터 버전 (값이 없으면 0)"""
+    return _extract_number(series, 0)
+
+
+# 파생 컬럼 목록: 컬럼 이름 -> (먼저 있어야 하는 컬럼, 계산 함수)
+DERIVED_COLUMNS = {}
+
+
+def derived_column(name, *sources):
+    """파생 컬럼 계산 함수 등록"""
+    def register(func):
+        DERIVED_COLUMNS[name] = (sources, func)
+        return func
+    return register
+
+
+@derived_column('현재가격_정제', '현재가격')
+def _current_price(df):
+    return clean_price_series(df['현재가격'])
+
+
+@derived_column('원가_정제', '원가')
+def _original_price(df):
+    return clean_price_series(df['원가'])
+
+
+def _within_schema(values, name):
+    """RANKING_SCHEMA의 정수형 범위를 벗어난 값은 결측치로 바꾸고 바꾼 행 수를 출력
+
+    '최대 50% + 10,000원 쿠폰'처럼 숫자가 여러 개인 값은 5010000으로 붙어 int16을 넘는다.
+    행은 남기고 이 값에서 계산하는 파생 컬럼(할인율_구간, 리뷰당_순위점수 등)도 결측치가 되게 한다.
+    """
+    limits = np.iinfo(RANKING_SCHEMA[name])
+    out_of_range = (values < limits.min) | (values > limits.max)
+    if not out_of_range.any():
+        return values
+    print(f"✗ '{name}' 값이 {RANKING_SCHEMA[name]} 범위를 벗어난 {out_of_range.sum():,}행은 결측치로 처리")
+    return values.mask(out_of_range)
+
+
+@derived_column('할인율_정제', '할인율')
+def _discount_rate(df):
+    return _within_schema(clean_discount_rate_series(df['할인율']), '할인율_정제')
+
+
+@derived_column('리뷰수_정제', '리뷰수')
+def _review_count(df):
+    return _within_schema(clean_review_count_series(df['리뷰수']), '리뷰수_정제')
+
+
+@derived_column('할인액', '원가_정제', '현재가격_정제')
+def _discount_amount(df):
+    return df['원가_정제'] - df['현재가격_정제']
+
+
+@derived_column('리뷰당_순위점수', '순위', '리뷰수_정제')
+def _rank_per_review(df):
+    # 낮을수록 좋음
+    return df['순위'] / (df['리뷰수_정제'] + 1)
+
+
+@derived_column('가격대', '현재가격_정제')
+def _price_range(df):
+    return pd.cut(df['현재가격_정제'], bins=PRICE_BINS, labels=PRICE_LABELS)
+
+
+@derived_column('할인율_구간', '할인율_정제')
+def _discount_range(df):
+    return pd.cut(df['할인율_정제'], bins=DISCOUNT_BINS, labels=DISCOUNT_LABELS)
+
+
+@derived_column('리뷰수_구간', '리뷰수_정제')
+def _review_range(df):
+    return pd.cut(df['리뷰수_정제'], bins=REVIEW_BINS, labels=REVIEW_LABELS)
+
+
+# preprocess_data가 한 번에 추가하는 컬럼 (계산 순서대로)
+PREPROCESSED_COLUMNS = ['현재가격_정제', '원가_정제', '할인율_정제', '리뷰수_정제',
+                        '할인액', '리뷰당_순위점수', '가격대', '할인율_구간']
+
+
+def add_derived_columns(df, columns):
+    """columns 중 df에 없는 파생 컬럼을 필요한 컬럼부터 계산해서 추가하고, 새로 추가한 컬럼 목록 반환"""
+    added = []
+    for name in columns:
+        if name in df.columns:
+            continue
+        if name not in DERIVED_COLUMNS:
+            raise KeyError(f"'{name}' 컬럼이 없고 계산할 수 있는 파생 컬럼도 아닙니다.")
+        sources, func = DERIVED_COLUMNS[name]
+        added += add_derived_columns(df, sources)
+        df[name] = func(df)
+        added.append(name)
+    return added
+
+
+def preprocess_data(df):
+    """로드된 랭킹 데이터에 정제 컬럼과 파생 컬럼 추가 (이미 있는 컬럼도 다시 계산)"""
+    for name in PREPROCESSED_COLUMNS:
+        df[name] = DERIVED_COLUMNS[name][1](df)
+    return df
+
+
+def _out_of_range(values, dtype):
+    """값이 없거나(NaN) 정수형 dtype 범위를 벗어난 위치"""
+    limits = np.iinfo(dtype)
+    return values.isna() | (values < limits.min) | (values > limits.max)
+
+
+def apply_schema(df, categorical=True):
+    """RANKING_SCHEMA의 dtype을 한 번에 적용 (스키마에 없는 컬럼은 그대로)
+
+    숫자 컬럼의 빈 문자열('') 등 숫자가 아닌 값은 결측치로 바꾼다. 순위가 없거나 int16 범위를 벗어난 행은
+    제외하고 제외한 행 수를 출력한다. 다른 정수 컬럼(할인율_정제 등)은 행을 남기고, 값이 없거나 범위를
+    벗어나면 결측치로 두고 nullable 정수형(Int16 등)을 쓴다.
+    categorical=False면 category 컬럼도 문자열로 둔다 (청크마다 카테고리가 달라지는 스트리밍 저장용).
+    """
+    if '순위' in df.columns:
+        # 다른 컬럼의 dtype(카테고리 순서, nullable 여부)이 남은 행으로 정해지도록 먼저 제외
+        ranks = pd.to_numeric(df['순위'], errors='coerce')
+        bad = _out_of_range(ranks, RANKING_SCHEMA['순위'])
+        if bad.any():
+            print(f"✗ '순위' 값이 없거나 {RANKING_SCHEMA['순위']} 범위를 벗어난 {bad.sum():,}행 제외")
+            df = df[~bad].copy()
+
+    dtypes = {}
+    for column, dtype in RANKING_SCHEMA.items():
+        if column not in df.columns:
+            continue
+        if dtype == 'category' and not categorical:
+            dtype = STRING_DTYPE
+
+        if dtype == 'category':
+            # 카테고리 순서를 처음 등장한 순서로 두어 value_counts 동률 순서가 문자열 컬럼일 때와 같게 함
+            dtype = pd.CategoricalDtype(pd.unique(df[column].dropna()))
+        elif dtype.startswith('datetime'):
+            df[column] = pd.to_datetime(df[column], errors='coerce')
+            continue
+        elif dtype.startswith('int'):
+            values = pd.to_numeric(df[column], errors='coerce')
+            bad = _out_of_range(values, dtype)
+            if bad.any():
+                values = values.mask(bad)
+                dtype = dtype.capitalize()  # 'int16' -> 'Int16'
+            df[column] = values
+        elif dtype.startswith('float'):
+            # 크롤러가 값을 찾지 못하면 '' (JSON Lines/Parquet sink 레코드)
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+        elif dtype == STRING_DTYPE and df[column].dtype != object:
+            # 전부 비어 있거나 숫자로 읽힌 컬럼 (astype(str)로 바꾸면 NaN이 'nan'이 되므로 객체로 먼저 변환)
+            df[column] = df[column].astype(object)
+        dtypes[column] = dtype
+    return df.astype(dtypes)
+
+
+# 로드 결과 캐시 (Parquet)
+#
+# 엑셀 파일을 openpyxl로 읽는 과정을 매번 반복하지 않도록, 스키마를 적용한 DataFrame을
+# data/cache 아래 Parquet 파일로 저장해두고 원본 파일이 바뀌지 않았으면 그대로 읽는다.
+# 파생 컬럼은 저장하지 않는다 (벡터 연산이라 필요할 때 계산해도 빠름).
+# 캐시 키는 원본 파일의 절대 경로, 크기, 수정 시각(mtime), 내용 해시(SHA-256)와 PREPROCESS_VERSION이다.
+# - 크기와 mtime이 같으면 해시 계산 없이 캐시 사용
+# - mtime만 바뀌었으면(복사, touch 등) 해시를 다시 계산해 내용이 같으면 캐시 사용
+# - 그 외에는 다시 읽어서 캐시를 덮어씀
+DEFAULT_CACHE_DIR = os.path.join('data', 'cache')
+# 캐시에 저장하는 내용(컬럼, 값, dtype)이 바뀌면 올려서 기존 캐시를 무효화
+PREPROCESS_VERSION = 4
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path, content_hash=True):
+    """캐시 키로 쓰는 원본 파일 정보 (경로, 크기, mtime, 내용 해시)"""
+    stat = os.stat(path)
+    fingerprint = {
+        'path': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+    if content_hash:
+        fingerprint['sha256'] = file_hash(path)
+    return fingerprint
+
+
+class FrameCache:
+    """원본 파일별로 build() 결과 DataFrame을 Parquet으로 저장하는 캐시
+
+    파일마다 <이름>-<경로 해시>.parquet와 키 정보를 담은 .json을 함께 저장한다.
+    pyarrow가 없으면 캐시 없이 매번 build()를 호출한다.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, version=PREPROCESS_VERSION):
+        self.cache_dir = cache_dir
+        self.version = version
+
+    def _paths(self, source_path):
+        source_path = os.path.abspath(source_path)
+        name = os.path.splitext(os.path.basename(source_path))[0]
+        key = hashlib.sha1(source_path.encode('utf-8')).hexdigest()[:12]
+        base = os.path.join(self.cache_dir, f"{name}-{key}")
+        return base + '.parquet', base + '.json'
+
+    def _read_manifest(self, manifest_path):
         try:
-            return int(clean_str)
-        except:
-            return np.nan
-    
-    # 리뷰수 정제
-    def clean_review_count(review_str):
-        if pd.isna(review_str):
-            return 0
-        # 숫자와 쉼표만 추출
-        clean_str = re.sub(r'[^\d,]', '', str(review_str))
-        clean_str = clean_str.replace(',', '')
+            with open(manifest_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self, manifest_path, manifest):
+        tmp_path = manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, manifest_path)
+
+    def _validate(self, source_path, manifest_path):
+        """캐시가 유효하면 True (mtime만 바뀌고 내용이 같으면 manifest의 mtime 갱신)"""
+        manifest = self._read_manifest(manifest_path)
+        if not manifest or manifest.get('version') != self.version:
+            return False
+        current = file_fingerprint(source_path, content_hash=False)
+        if current['path'] != manifest['path'] or current['size'] != manifest['size']:
+            return False
+        if current['mtime_ns'] == manifest['mtime_ns']:
+            return True
+        if file_hash(source_path) != manifest['sha256']:
+            return False
+        manifest['mtime_ns'] = current['mtime_ns']
+        self._write_manifest(manifest_path, manifest)
+        return True
+
+    def source_hash(self, source_path):
+        """원본 파일 내용의 SHA-256 (크기와 mtime이 manifest와 같으면 해시 계산 없이 저장된 값 사용)"""
+        manifest = self._read_manifest(self._paths(source_path)[1])
+        current = file_fingerprint(source_path, content_hash=False)
+        if manifest and manifest.get('sha256') and all(manifest.get(key) == value for key, value in current.items()):
+            return manifest['sha256']
+        return file_hash(source_path)
+
+    @staticmethod
+    def _read(data_path):
+        # 문자열 컬럼을 저장할 때와 같은 Arrow 문자열(string[pyarrow])로 읽음
+        with pd.option_context('mode.string_storage', 'pyarrow'):
+            df = pd.read_parquet(data_path)
+        # Parquet에서 읽은 문자열 컬럼의 결측치는 None이므로 엑셀에서 읽었을 때와 같은 NaN으로 맞춤
+        for column in df.columns[df.dtypes == object]:
+            df[column] = df[column].where(df[column].notna(), np.nan)
+        return df
+
+    def load(self, source_path, build):
+        """캐시된 DataFrame 반환, 없거나 원본이 바뀌었으면 build(source_path)로 만들어 저장"""
         try:
-            return int(clean_str)
-        except:
-            return 0
-    
-    # 할인율 정제
-    def clean_discount_rate(discount_str):
-        if pd.isna(discount_str):
-            return 0
-        # 숫자만 추출
-        clean_str = re.sub(r'[^\d]', '', str(discount_str))
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return build(source_path)
+
+        data_path, manifest_path = self._paths(source_path)
+        if os.path.exists(data_path) and self._validate(source_path, manifest_path):
+            try:
+                return self._read(data_path)
+            except Exception:
+                pass  # 깨진 캐시는 다시 만듦
+
+        # 전처리 도중 원본이 바뀌어도 이전 내용의 키로 저장되지 않도록 먼저 키를 계산
+        manifest = dict(file_fingerprint(source_path), version=self.version)
+        df = build(source_path)
         try:
-            return int(clean_str)
-        except:
-            return 0
-    
-    # 전처리 적용
-    df['현재가격_정제'] = df['현재가격'].apply(clean_price)
-    df['원가_정제'] = df['원가'].apply(clean_price)
-    df['할인율_정제'] = df['할인율'].apply(clean_discount_rate)
-    df['리뷰수_정제'] = df['리뷰수'].apply(clean_review_count)
-    
-    # 할인액 계산
-    df['할인액'] = df['원가_정제'] - df['현재가격_정제']
-    
-    # 리뷰당 순위 점수 (낮을수록 좋음)
-    df['리뷰당_순위점수'] = df['순위'] / (df['리뷰수_정제'] + 1)
-    
-    # 가격대 구분
-    df['가격대'] = pd.cut(df['현재가격_정제'], 
-                         bins=[0, 30000, 50000, 100000, 200000, float('inf')],
-                         labels=['3만원 이하', '3-5만원', '5-10만원', '10-20만원', '20만원 이상'])
-    
-    # 할인율 구간
-    df['할인율_구간'] = pd.cut(df['할인율_정제'],
-                            bins=[-1, 0, 10, 30, 50, 100],
-                            labels=['할인없음', '10% 이하', '10-30%', '30-50%', '50% 이상'])
-    
-    return df
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = data_path + '.tmp'
+            df.to_parquet(tmp_path, index=True)
+            os.replace(tmp_path, data_path)
+            self._write_manifest(manifest_path, manifest)
+        except Exception as e:
+            print(f"✗ 데이터 캐시 저장 실패: {e}")
+        return df
+
+    def clear(self, source_path):
+        """원본 파일의 캐시 삭제"""
+        for path in self._paths(source_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def read_ranking_data(file_path):
+    """캐시 없이 엑셀 파일을 읽어 스키마 적용"""
+    return apply_schema(pd.read_excel(file_path))
+
+
+def load_ranking_data(file_path, use_cache=True, cache_dir=DEFAULT_CACHE_DIR):
+    """스키마를 적용한 원본 랭킹 데이터 로드 (원본이 바뀌지 않았으면 Parquet 캐시에서 읽음)
+
+    파생 컬럼은 포함하지 않는다. 필요한 컬럼만 계산하려면 ranking_dataset.RankingDataset 사용.
+    """
+    if not use_cache:
+        return read_ranking_data(file_path)
+    return FrameCache(cache_dir).load(file_path, read_ranking_data)
+
+
+def load_and_preprocess_data(file_path, use_cache=True, cache_dir=DEFAULT_CACHE_DIR):
+    """무신사 랭킹 데이터를 로드하고 전처리 (PREPROCESSED_COLUMNS를 모두 계산)"""
+    df = load_ranking_data(file_path, use_cache, cache_dir)
+    return apply_schema(preprocess_data(df))
+
+
+# 청크 단위 전처리 (스트리밍)
+#
+# 여러 스냅샷을 모은 큰 파일은 한 번에 메모리에 올리지 않고 chunk_size행씩 읽어 같은 규칙으로 정제하고,
+# 결과를 Parquet 파일에 이어서 쓴다. 파생 컬럼은 모두 행 단위 계산이고 구간은 고정(PRICE_BINS, DISCOUNT_BINS)이라
+# 청크로 나눠도 전체를 한 번에 전처리한 결과와 같다. 최대 메모리는 입력 크기가 아니라 chunk_size에 비례한다.
+
+
+def _iter_excel_chunks(file_path, chunk_size):
+    """openpyxl read-only 모드로 엑셀 시트를 행 단위로 읽어 DataFrame 청크로 반환"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        columns = next(rows, None)
+        if columns is None:
+            return
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield pd.DataFrame(chunk, columns=columns)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _iter_parquet_chunks(file_path, chunk_size):
+    """Parquet 파일 또는 part 파일 디렉토리(크롤러 ParquetSink 출력)를 chunk_size행씩 읽음"""
+    import pyarrow.dataset as ds
+
+    for batch in ds.dataset(file_path, format='parquet').to_batches(batch_size=chunk_size):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+def iter_chunks(file_path, chunk_size=100000):
+    """크롤링 결과 파일(.xlsx, .csv, .jsonl, Parquet 파일/디렉토리)을 chunk_size행씩 DataFrame으로 읽음"""
+    if file_path.endswith('.xlsx'):
+        return _iter_excel_chunks(file_path, chunk_size)
+    if file_path.endswith('.csv'):
+        return pd.read_csv(file_path, chunksize=chunk_size)
+    if file_path.endswith('.jsonl') or file_path.endswith('.json'):
+        return pd.read_json(file_path, lines=True, chunksize=chunk_size)
+    return _iter_parquet_chunks(file_path, chunk_size)
+
+
+def preprocess_in_chunks(file_path, output_path, chunk_size=100000):
+    """입력 파일을 청크 단위로 전처리해서 Parquet 파일로 저장하고 처리한 행 수 반환"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tmp_path = output_path + '.tmp'
+    writer = None
+    rows = 0
+    try:
+        for chunk in iter_chunks(file_path, chunk_size):
+            # 청크마다 dtype이 달라지지 않도록 스키마 고정 (결측치 유무, 전부 비어 있는 컬럼 등)
+            chunk = apply_schema(preprocess_data(chunk), categorical=False)
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = pq.ParquetWriter(tmp_path, table.schema)
+            else:
+                table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise ValueError(f"데이터가 없습니다: {file_path}")
+    os.replace(tmp_path, output_path)
+    return rows
+
+
+def parse_args():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="무신사 랭킹 데이터 전처리")
+    parser.add_argument('input', nargs='?', default='data/musinsa_ranking_precise.xlsx')
+    parser.add_argument('--stream', metavar='OUTPUT',
+                        help="청크 단위로 전처리해서 지정한 Parquet 파일로 저장 (큰 스냅샷 이력용)")
+    parser.add_argument('--chunk-size', type=int, default=100000, help="청크 행 수 (기본: 100000)")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    # 테스트
-    df = load_and_preprocess_data('data/musinsa_ranking_precise.xlsx')
-    print("전처리 완료!")
-    print(f"데이터 shape: {df.shape}")
-    print("\n새로운 컬럼:")
-    print([col for col in df.columns if '정제' in col or col in ['할인액', '리뷰당_순위점수', '가격대', '할인율_구간']])
\ No newline at end of file
+    args = parse_args()
+    if args.stream:
+        rows = preprocess_in_chunks(args.input, args.stream, args.chunk_size)
+        print(f"✓ 전처리 완료: {rows:,}행 -> {args.stream}")
+    else:
+        # 테스트
+        df = load_and_preprocess_data(args.input)
+        print("전처리 완료!")
+        print(f"데이터 shape: {df.shape}")
+        print("\n새로운 컬럼:")
+        print([col for col in df.columns if '정제' in col or col in ['할인액', '리뷰당_순위점수', '가격대', '할인율_구간']])
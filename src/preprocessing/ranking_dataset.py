@@ -0,0 +1,67 @@
+"""랭킹 데이터셋 - 파생 컬럼을 처음 사용할 때 계산하고 기억해두는 공용 데이터 객체
+
+대시보드, 분석기(MusinsaMarketingAnalyzer), CLI 리포트(scripts/run_notebook.py)가 같은 정제 규칙
+(data_preprocessing.DERIVED_COLUMNS)을 쓰고, 각자 사용하는 컬럼만 계산한다.
+
+사용법:
+    dataset = RankingDataset.load('data/musinsa_ranking_precise.xlsx')
+    df = dataset.require('가격대', '순위')   # 가격대 계산에 필요한 현재가격_정제도 함께 계산
+    dataset['리뷰수_정제'].mean()
+"""
+import hashlib
+import json
+
+import pandas as pd
+
+from preprocessing.data_preprocessing import (
+    DEFAULT_CACHE_DIR, DERIVED_COLUMNS, FrameCache, add_derived_columns, apply_schema, file_hash, load_ranking_data,
+)
+
+
+class RankingDataset:
+    """원본 랭킹 데이터 + 필요할 때 계산되는 파생 컬럼
+
+    파생 컬럼은 require()나 dataset[컬럼]으로 처음 요청할 때 계산해서 df에 추가하고,
+    이후에는 다시 계산하지 않는다.
+    """
+
+    def __init__(self, df, fingerprint=None):
+        self.df = df
+        self._fingerprint = fingerprint
+
+    @classmethod
+    def load(cls, file_path, use_cache=True, cache_dir=DEFAULT_CACHE_DIR):
+        # 읽는 도중 원본이 바뀌어도 이전 내용의 지문이 붙지 않도록 먼저 계산
+        # (캐시를 쓰면 크기와 mtime이 같을 때 캐시에 기록된 해시를 그대로 사용)
+        fingerprint = FrameCache(cache_dir).source_hash(file_path) if use_cache else file_hash(file_path)
+        return cls(load_ranking_data(file_path, use_cache, cache_dir), fingerprint)
+
+    def require(self, *columns):
+        """columns가 모두 계산된 DataFrame 반환 (없는 파생 컬럼만 계산)"""
+        added = add_derived_columns(self.df, columns)
+        if added:
+            typed = apply_schema(self.df[added].copy())
+            for column in added:
+                self.df[column] = typed[column]
+        return self.df
+
+    def __getitem__(self, column):
+        return self.require(column)[column]
+
+    def __len__(self):
+        return len(self.df)
+
+    def fingerprint(self):
+        """데이터 내용의 SHA-256 (파일에서 읽었으면 원본 파일 해시, 아니면 원본 컬럼 값/dtype의 해시)"""
+        if self._fingerprint is None:
+            raw = self.df[[column for column in self.df.columns if column not in DERIVED_COLUMNS]]
+            digest = hashlib.sha256(json.dumps({column: str(dtype) for column, dtype in raw.dtypes.items()},
+                                               ensure_ascii=False).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(raw, index=True).values.tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    @property
+    def computed(self):
+        """지금까지 계산된 파생 컬럼 목록"""
+        return [column for column in self.df.columns if column in DERIVED_COLUMNS]
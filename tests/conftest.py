@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# 스크립트와 같은 방식으로 src(분석/전처리)와 src/crawling(크롤러 모듈)을 import 경로에 추가
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'src'))
+sys.path.insert(0, str(ROOT / 'src' / 'crawling'))
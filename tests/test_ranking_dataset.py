@@ -0,0 +1,47 @@
+"""전체 전처리(load_and_preprocess_data)와 지연 계산(RankingDataset.require)이 같은 결과를 내는지 확인"""
+import pandas as pd
+import pytest
+
+from preprocessing.data_preprocessing import PREPROCESSED_COLUMNS, load_and_preprocess_data
+from preprocessing.ranking_dataset import RankingDataset
+
+pytest.importorskip('openpyxl')
+
+
+def write_ranking(path, count=100):
+    rows = []
+    for rank in range(1, count + 1):
+        rows.append({
+            '순위': rank,
+            '브랜드명': f"브랜드{rank % 4}",
+            '상품명': f"상품{rank}",
+            '카테고리': '상의' if rank % 2 else '하의',
+            '현재가격': f"{rank * 1000:,}원",
+            '원가': f"{rank * 1200:,}원",
+            '할인율': f"{rank % 60}%",
+            '평점': 4.5,
+            '리뷰수': f"후기 {rank * 10:,}개",
+        })
+    # 숫자가 붙어 int16/int32 범위를 넘는 값 (5010000, 99999999999)
+    rows[10]['할인율'] = '최대 50% + 10,000원 쿠폰'
+    rows[20]['리뷰수'] = '후기 99,999,999,999개'
+    pd.DataFrame(rows).to_excel(path, index=False)
+
+
+def test_eager_and_lazy_preprocessing_match(tmp_path, capsys):
+    path = str(tmp_path / 'ranking.xlsx')
+    write_ranking(path)
+
+    eager = load_and_preprocess_data(path, use_cache=False)
+    dataset = RankingDataset.load(path, use_cache=False)
+    for column in PREPROCESSED_COLUMNS:
+        dataset.require(column)
+    lazy = dataset.df[eager.columns]
+
+    assert len(eager) == 100
+    assert "결측치로 처리" in capsys.readouterr().out
+    assert str(eager['할인율_정제'].dtype) == 'Int16'
+    assert str(eager['리뷰수_정제'].dtype) == 'Int32'
+    assert pd.isna(eager['할인율_정제'].iloc[10]) and pd.isna(eager['할인율_구간'].iloc[10])
+    assert pd.isna(eager['리뷰당_순위점수'].iloc[20])
+    pd.testing.assert_frame_equal(eager, lazy)
@@ -0,0 +1,70 @@
+"""증분 크롤링(state_store ttl 재사용) 후 스냅샷 저장"""
+from datetime import datetime, timedelta
+
+from crawl_state import CrawlStateStore
+from musinsa_page import new_record
+from musinsa_precise_crawler import MusinsaPreciseCrawler
+from snapshot_store import SnapshotStore
+
+
+def make_record(url, rank, crawled_at):
+    record = new_record(url, rank)
+    record.update({'크롤링시간': crawled_at, '브랜드명': '브랜드', '상품명': url.rsplit('/', 1)[-1],
+                   '현재가격': '10,000원', '원가': '20,000원', '할인율': '50%', '평점': '4.8', '리뷰수': '100'})
+    return record
+
+
+def test_snapshot_after_ttl_reuse(tmp_path):
+    state_store = CrawlStateStore(str(tmp_path / 'state.sqlite'), ttl=86400)
+    snapshots = str(tmp_path / 'snapshots.sqlite')
+    urls = [f"https://www.musinsa.com/products/{i}" for i in range(3)]
+    first_run = datetime(2024, 1, 1, 9, 0, 0)
+
+    # 1회차: 전체 크롤링
+    crawler = MusinsaPreciseCrawler(backend='http', state_store=state_store, quiet=True)
+    crawler.started_at = first_run
+    for rank, url in enumerate(urls, 1):
+        crawler._store_result(make_record(url, rank, '2024-01-01 09:00:05'))
+    assert crawler.save_snapshot(snapshots) == '2024-01-01 09:00:00'
+
+    # 1시간 뒤 2회차: 기존 상품은 ttl 안이라 저장된 레코드(이전 크롤링시간)를 순위만 바꿔 재사용
+    crawler = MusinsaPreciseCrawler(backend='http', state_store=state_store, quiet=True)
+    crawler.started_at = first_run + timedelta(hours=1)
+    new_url = "https://www.musinsa.com/products/new"
+    pending = crawler._skip_fresh([(urls[2], 1), (urls[0], 2), (urls[1], 3), (new_url, 4)])
+    assert pending == [(new_url, 4)]
+    crawler._store_result(make_record(new_url, 4, '2024-01-01 10:00:03'))
+
+    assert crawler.save_snapshot(snapshots) == '2024-01-01 10:00:00'
+    store = SnapshotStore(snapshots)
+    try:
+        assert store.snapshot_ids() == ['2024-01-01 09:00:00', '2024-01-01 10:00:00']
+        assert store.delta_counts('2024-01-01 10:00:00') == {'up': 1, 'down': 2, 'new': 1}
+    finally:
+        store.close()
+        state_store.close()
+
+
+def test_ingest_existing_id_warns(tmp_path, capsys):
+    store = SnapshotStore(str(tmp_path / 'snapshots.sqlite'))
+    try:
+        records = [make_record("https://www.musinsa.com/products/1", 1, '2024-01-01 09:00:05')]
+        assert store.ingest(records, snapshot_id='2024-01-01 09:00:00') == '2024-01-01 09:00:00'
+        assert store.ingest(records, snapshot_id='2024-01-01 09:00:00') is None
+        assert '이미 저장된 스냅샷 ID' in capsys.readouterr().out
+    finally:
+        store.close()
+
+
+def test_ingest_unparsable_number(tmp_path):
+    """'.'처럼 숫자로 해석할 수 없는 값은 결측치로 저장하고 스냅샷 저장을 계속"""
+    store = SnapshotStore(str(tmp_path / 'snapshots.sqlite'))
+    try:
+        record = make_record("https://www.musinsa.com/products/1", 1, '2024-01-01 09:00:05')
+        record.update({'평점': '.', '할인율': '1.2.3%'})
+        assert store.ingest([record], snapshot_id='2024-01-01 09:00:00') == '2024-01-01 09:00:00'
+        history = store.product_history(record['상품URL'])
+        assert history['평점'].isna().all() and history['할인율'].isna().all()
+        assert history['현재가격'].tolist() == [10000]
+    finally:
+        store.close()
@@ -0,0 +1,67 @@
+"""크롤러 결과 sink 출력을 청크 단위 전처리(preprocess_in_chunks)로 읽는지 확인"""
+import pandas as pd
+import pytest
+
+from musinsa_page import finalize_record, new_record
+from preprocessing.data_preprocessing import preprocess_in_chunks
+from result_sink import JsonLinesSink, ParquetSink
+
+pytest.importorskip('pyarrow')
+
+
+def make_records(count):
+    records = []
+    for rank in range(1, count + 1):
+        record = new_record(f"https://www.musinsa.com/products/{rank}", rank)
+        record.update({
+            '브랜드명': f"브랜드{rank % 3}",
+            '상품명': f"상품{rank}",
+            '카테고리': '상의',
+            '현재가격': f"{rank * 1000:,}원",
+            '원가': '',
+            '할인율': '10%' if rank % 2 else '',
+            '평점': '4.8',
+            '리뷰수': f"({rank * 10:,})",
+        })
+        records.append(finalize_record(record))
+    return records
+
+
+@pytest.mark.parametrize('sink_class, name', [(ParquetSink, 'ranking'), (JsonLinesSink, 'ranking.jsonl')])
+def test_preprocess_sink_output(tmp_path, sink_class, name):
+    sink_path = str(tmp_path / name)
+    sink = sink_class(sink_path, batch_size=4) if sink_class is ParquetSink else sink_class(sink_path)
+    for record in make_records(10):
+        sink.write(record)
+    sink.close()
+
+    output_path = str(tmp_path / 'preprocessed.parquet')
+    assert preprocess_in_chunks(sink_path, output_path, chunk_size=3) == 10
+
+    df = pd.read_parquet(output_path).sort_values('순위', ignore_index=True)
+    assert df['순위'].tolist() == list(range(1, 11))
+    assert df['현재가격_정제'].tolist() == [rank * 1000.0 for rank in range(1, 11)]
+    assert df['원가_정제'].tolist() == df['현재가격_정제'].tolist()
+    assert df['리뷰수_정제'].tolist() == [rank * 10 for rank in range(1, 11)]
+    assert df['할인율_정제'].tolist() == [10 if rank % 2 else 0 for rank in range(1, 11)]
+
+
+def test_preprocess_incomplete_records(tmp_path, capsys):
+    """평점을 찾지 못한 레코드('')는 결측치로, 순위가 없는 레코드는 제외"""
+    records = make_records(4)
+    records[0]['평점'] = ''
+    records[1]['순위'] = None
+    sink_path = str(tmp_path / 'ranking.jsonl')
+    sink = JsonLinesSink(sink_path)
+    for record in records:
+        sink.write(record)
+    sink.close()
+
+    output_path = str(tmp_path / 'preprocessed.parquet')
+    assert preprocess_in_chunks(sink_path, output_path) == 3
+    assert "1행 제외" in capsys.readouterr().out
+
+    df = pd.read_parquet(output_path)
+    assert df['순위'].tolist() == [1, 3, 4]
+    assert df['평점'].isna().tolist() == [True, False, False]
+    assert df['평점'].iloc[1] == 4.8
@@ -0,0 +1,70 @@
+"""작업 큐 lease 만료와 처리 중 lease 연장(heartbeat)"""
+import time
+
+from crawl_scheduler import CrawlWorker
+from work_queue import WorkQueue
+
+
+def test_expired_lease_stops_at_max_attempts(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.sqlite'), max_attempts=2)
+    try:
+        queue.put('shard-0', 'products', {'items': []})
+        # 워커가 complete/fail 없이 죽는 상황: lease가 바로 만료되도록 visibility_timeout을 음수로
+        assert queue.lease('worker-1', visibility_timeout=-1)['attempts'] == 1
+        assert queue.lease('worker-2', visibility_timeout=-1)['attempts'] == 2
+        assert queue.lease('worker-3', visibility_timeout=-1) is None
+        assert queue.stats() == {('products', 'failed'): 1}
+    finally:
+        queue.close()
+
+
+def test_heartbeat_keeps_long_shard_leased(tmp_path):
+    path = str(tmp_path / 'queue.sqlite')
+    queue = WorkQueue(path)
+    other = WorkQueue(path)
+    try:
+        queue.put('shard-0', 'products', {'section_id': '199', 'category_code': '000', 'gf': 'A', 'items': []})
+        worker = CrawlWorker(queue, crawler=None, owner='worker-1', visibility_timeout=0.6)
+        task = queue.lease(worker.owner, worker.visibility_timeout)
+        with worker.heartbeat(task):
+            time.sleep(1.2)  # 처리에 visibility_timeout의 2배가 걸림
+            assert other.lease('worker-2', visibility_timeout=0.6) is None
+        assert queue.complete(task['id'], worker.owner)
+    finally:
+        other.close()
+        queue.close()
+
+
+class StolenShardCrawler:
+    """크롤링 도중 다른 워커가 shard lease를 가져가는 상황을 흉내 내는 크롤러"""
+
+    def __init__(self, path, visibility_timeout):
+        self.path = path
+        self.visibility_timeout = visibility_timeout
+        self.products = []
+        self.record_context = {}
+        self.cancel = None
+        self.sink = None
+
+    def crawl_urls(self, url_rank_tuples, max_workers=10, adaptive=False):
+        other = WorkQueue(self.path)
+        try:
+            other._conn.execute("UPDATE tasks SET owner = 'worker-2'")
+        finally:
+            other.close()
+        assert self.cancel.wait(self.visibility_timeout)
+        self.products.append({'순위': 1})
+
+
+def test_lost_lease_stops_shard(tmp_path):
+    path = str(tmp_path / 'queue.sqlite')
+    queue = WorkQueue(path)
+    try:
+        queue.put('shard-0', 'products', {'section_id': '199', 'category_code': '000', 'gf': 'A',
+                                          'items': [['https://www.musinsa.com/products/1', 1]]})
+        worker = CrawlWorker(queue, StolenShardCrawler(path, 0.6), owner='worker-1', visibility_timeout=0.6)
+        assert worker.run() == 0
+        assert worker.results == []
+        assert queue.stats() == {('products', 'leased'): 1}  # worker-2의 lease가 그대로 남음
+    finally:
+        queue.close()